@@ -1,21 +1,98 @@
 # docs/conf.py
+import functools
+import hashlib
+import json
 import os
+import pickle
+import shutil
+import subprocess
 import sys
+import time
+import urllib.request
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import sphinx.ext.autosummary.generate as autosummary_generate_module
+from sphinx.application import ENV_PICKLE_FILENAME, Sphinx
+from sphinx.environment import CONFIG_OK, BuildEnvironment
+from sphinx.util import logging as sphinx_logging
 
 sys.path.insert(0, os.path.abspath("../src"))
 
+logger = sphinx_logging.getLogger(__name__)
+
+DOCS_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.join(os.path.dirname(DOCS_DIR), "src")
+# Where autosummary writes the per-object stubs for the API landing pages.
+STUB_DIR = os.path.join(DOCS_DIR, "api", "generated")
+INTERSPHINX_CACHE_DIR = os.path.join(DOCS_DIR, "_build", ".intersphinx-cache")
+# Slow or unreachable inventory hosts must not stall the build for minutes.
+INTERSPHINX_TIMEOUT = 5
+INTERSPHINX_CACHE_DAYS = 7
+
+
+def _git_tracked_files() -> frozenset[str] | None:
+    """Snapshot ``git ls-files`` once, as repository-relative paths.
+
+    Discovery code should consult ``TRACKED_FILES`` (or ``is_tracked``) instead
+    of forking git per file. ``None`` means the docs are not built from a git
+    checkout (e.g. an sdist), so callers should fall back to the filesystem.
+    """
+    repo_root = os.path.dirname(DOCS_DIR)
+    if not os.path.isdir(os.path.join(repo_root, ".git")):
+        return None
+    try:
+        output = subprocess.check_output(  # noqa: S603
+            ["git", "ls-files", "-z"],  # noqa: S607
+            cwd=repo_root,
+            stderr=subprocess.DEVNULL,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return frozenset(os.fsdecode(path) for path in output.split(b"\0") if path)
+
+
+TRACKED_FILES = _git_tracked_files()
+
+
+def is_tracked(path: str) -> bool:
+    """Return True when ``path`` is tracked by git (always True outside a checkout)."""
+    if TRACKED_FILES is None:
+        return True
+    relative = os.path.relpath(os.path.abspath(path), os.path.dirname(DOCS_DIR))
+    return relative.replace(os.sep, "/") in TRACKED_FILES
+
+
+# DOCS_FAST=1 trims the build to autodoc + napoleon + MyST for quick local
+# iteration ("did my docstring render?"). CI and release builds leave it unset
+# and load the full extension set.
+DOCS_FAST = bool(os.environ.get("DOCS_FAST"))
+# DOCS_STATIC_MATH=1 pre-renders math to SVG with imgmath (needs latex and
+# dvisvgm) instead of shipping the MathJax runtime. imgmath names each image by
+# the hash of its LaTeX and skips rendering when that file already exists, so
+# the cached _build/ directory doubles as the render cache.
+DOCS_STATIC_MATH = bool(os.environ.get("DOCS_STATIC_MATH"))
+# DOCS_RELEASE=1 adds the todo list and documentation-coverage report; each is
+# an extra full pass over the environment that iterative builds do not need.
+DOCS_RELEASE = bool(os.environ.get("DOCS_RELEASE"))
+
 project = "kde-cpi"
 author = "Jacob Bourne"
 version = release = "0.1.0"
 
-extensions = [
+FAST_EXTENSIONS = [
+    "sphinx.ext.autodoc",
+    "sphinx.ext.napoleon",
+    "myst_parser",
+]
+
+FULL_EXTENSIONS = [
     "sphinx.ext.autodoc",
     "sphinx.ext.autosummary",  # <— add
     "sphinx.ext.napoleon",  # <— add (Google/NumPy docstrings)
     "sphinx.ext.doctest",
     "sphinx.ext.intersphinx",
-    "sphinx.ext.todo",
-    "sphinx.ext.coverage",
     "sphinx.ext.mathjax",
     "sphinx.ext.ifconfig",
     "sphinx.ext.viewcode",
@@ -27,26 +104,364 @@ extensions = [
     "sphinxcontrib.mermaid",
 ]
 
+if DOCS_RELEASE:
+    FULL_EXTENSIONS += ["sphinx.ext.todo", "sphinx.ext.coverage"]
+
+if DOCS_STATIC_MATH:
+    FULL_EXTENSIONS[FULL_EXTENSIONS.index("sphinx.ext.mathjax")] = "sphinx.ext.imgmath"
+    imgmath_image_format = "svg"
+
+extensions = FAST_EXTENSIONS if DOCS_FAST else FULL_EXTENSIONS
+
+# Public API pages rendered under docs/api/. Autosummary starts from this
+# allowlist (recursing only into our own subpackages) instead of walking every
+# importable name.
+AUTOSUMMARY_MODULES: dict[str, tuple[str, tuple[str, ...]]] = {
+    "kde_cpi": (
+        "kde_cpi package",
+        (
+            "kde_cpi.data",
+            "kde_cpi.math",
+            "kde_cpi.output",
+            "kde_cpi.series",
+            "kde_cpi.logging",
+        ),
+    ),
+    "cli": ("Command line interface", ("cli.main",)),
+}
+
 # Autodoc / autosummary behavior
-autosummary_generate = True
-autodoc_typehints = "description"
+autosummary_generate = [] if DOCS_FAST else [f"api/{page}.rst" for page in AUTOSUMMARY_MODULES]
+autosummary_imported_members = False
+# Sphinx compares each regenerated stub with the file on disk and only rewrites
+# stubs whose content changed, so untouched modules keep their mtimes and stay
+# cached in the doctree environment.
+autosummary_generate_overwrite = True
+autodoc_typehints = "none" if DOCS_FAST else "description"
 autodoc_default_options = {
     "members": True,
     "undoc-members": True,
     "show-inheritance": True,
+    "ignore-module-all": False,
     # Uncomment if useful:
     # "inherited-members": True,
     # "special-members": "__call__",
 }
+# Stub out the heavy plotting/analysis stack so each (parallel) reader does not
+# pay its import cost. numpy stays real: kde_cpi.math.utils builds type aliases
+# from numpy.typing at import time, which mocks cannot combine with ``|``.
+autodoc_mock_imports = ["matplotlib", "pandas", "scipy", "seaborn", "sklearn"]
+autodoc_preserve_defaults = True
+autodoc_inherit_docstrings = False
+autodoc_class_signature = "separated"
+
+
+def _markdown_uses_dollar_math() -> bool:
+    """Return True when any Markdown source under docs/ contains a ``$``."""
+    for root, dirs, files in os.walk(DOCS_DIR):
+        dirs[:] = [name for name in dirs if not name.startswith(("_build", "."))]
+        for name in files:
+            if not name.endswith(".md"):
+                continue
+            with open(os.path.join(root, name), encoding="utf-8") as handle:
+                if "$" in handle.read():
+                    return True
+    return False
 
-# MyST (Markdown) quality-of-life
-myst_enable_extensions = ["colon_fence", "dollarmath", "deflist"]
+
+# MyST (Markdown) quality-of-life. Parsed Markdown is cached in the doctree
+# environment between builds; dollarmath is only enabled when some source
+# actually uses it, so math-free pages skip the extra inline scan.
+myst_enable_extensions = ["colon_fence", "deflist"]
+if _markdown_uses_dollar_math():
+    myst_enable_extensions.append("dollarmath")
 
 templates_path = ["_templates"]
 exclude_patterns = ["_build", "Thumbs.db", ".DS_Store"]
+if DOCS_FAST:
+    # Stubs left over from a full build need autosummary, which is not loaded.
+    exclude_patterns.append("api/generated")
 
 html_theme = "furo"
 html_static_path = ["_static"]
+# Iteration builds skip copying reST sources into _sources/ (viewcode is
+# already left out of FAST_EXTENSIONS).
+html_copy_source = not DOCS_FAST
+html_show_sourcelink = not DOCS_FAST
+
+
+def needs_rebuild(src: str, dst: str) -> bool:
+    """Return True when ``dst`` is missing or older than ``src``.
+
+    Any ``build-finished`` post-processor should call this (via
+    ``app.needs_rebuild``) for each page before doing per-page work.
+    """
+    return not os.path.exists(dst) or os.path.getmtime(src) > os.path.getmtime(dst)
+
+
+def write_if_changed(path: str, payload: bytes) -> bool:
+    """Write ``payload`` only when it differs from the file on disk.
+
+    Unchanged files keep their mtime, so nothing downstream sees them as new.
+    Returns True when the file was (re)written.
+    """
+    if os.path.isfile(path):
+        with open(path, "rb") as handle:
+            if handle.read() == payload:
+                return False
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as handle:
+        handle.write(payload)
+    return True
+
+
+def _inventory_cache_path(url: str) -> str:
+    """Return the local cache file for an intersphinx inventory URL."""
+    digest = hashlib.sha256(url.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(INTERSPHINX_CACHE_DIR, f"{digest}.inv")
+
+
+def _download_inventory(url: str, path: str) -> bool:
+    """Fetch a remote inventory into the cache, returning True on success."""
+    try:
+        with urllib.request.urlopen(url, timeout=INTERSPHINX_TIMEOUT) as response:  # noqa: S310
+            payload = response.read()
+    except OSError:
+        return False
+    if not write_if_changed(path, payload):
+        os.utime(path)  # identical payload: restart the TTL clock
+    return True
+
+
+def _inventory_is_fresh(path: str) -> bool:
+    """Return True when a cached inventory exists and is younger than the TTL."""
+    try:
+        age = time.time() - os.path.getmtime(path)
+    except OSError:
+        return False
+    return age < INTERSPHINX_CACHE_DAYS * 86400
+
+
+def _cached_intersphinx(targets: dict[str, str]) -> dict[str, tuple[str, object]]:
+    """Prefetch inventories concurrently and prefer the on-disk copies.
+
+    Warm builds read every inventory from ``_build/.intersphinx-cache`` without
+    touching the network; cold builds download all missing or expired
+    inventories at once. An expired copy is still used when the refetch fails,
+    and entries that were never fetched fall back to Sphinx's remote lookup.
+    """
+    urls = {name: f"{base.rstrip('/')}/objects.inv" for name, base in targets.items()}
+    paths = {name: _inventory_cache_path(url) for name, url in urls.items()}
+    missing = [name for name, path in paths.items() if not _inventory_is_fresh(path)]
+    if missing:
+        with ThreadPoolExecutor(max_workers=min(8, len(missing))) as pool:
+            list(pool.map(lambda name: _download_inventory(urls[name], paths[name]), missing))
+    mapping: dict[str, tuple[str, object]] = {}
+    for name, base in targets.items():
+        if os.path.isfile(paths[name]):
+            mapping[name] = (base, (paths[name], None))
+        else:
+            mapping[name] = (base, None)
+    return mapping
+
+
+intersphinx_mapping = (
+    {}
+    if DOCS_FAST
+    else _cached_intersphinx(
+        {
+            "python": "https://docs.python.org/3",
+            "numpy": "https://numpy.org/doc/stable",
+        }
+    )
+)
+intersphinx_timeout = INTERSPHINX_TIMEOUT
+intersphinx_cache_limit = INTERSPHINX_CACHE_DAYS
+# Only resolve Python objects across projects; never link to foreign pages.
+intersphinx_disabled_reftypes = ["*:doc"]
+# Missing cross-references are reported by release builds, not every build.
+nitpicky = False
+todo_include_todos = DOCS_RELEASE
+
+
+def _render_api_page(title: str, modules: tuple[str, ...]) -> str:
+    """Return the reStructuredText for one API landing page."""
+    lines = [title, "=" * len(title), ""]
+    if DOCS_FAST:
+        for module in modules:
+            lines.append(f".. automodule:: {module}")
+    else:
+        lines += [".. autosummary::", "   :toctree: generated", "   :recursive:", ""]
+        lines += [f"   {module}" for module in modules]
+    return "\n".join(lines) + "\n"
+
+
+def _write_api_pages(app: Sphinx) -> None:
+    """Materialize the API landing pages from ``AUTOSUMMARY_MODULES``."""
+    for page, (title, modules) in AUTOSUMMARY_MODULES.items():
+        path = os.path.join(DOCS_DIR, "api", f"{page}.rst")
+        write_if_changed(path, _render_api_page(title, modules).encode("utf-8"))
+
+
+# Documents dropped from the read list by ``_skip_unchanged_sources`` this build.
+_PRUNED_DOCS: set[str] = set()
+
+
+def _content_hash_path(app: Sphinx) -> str:
+    """Return the content-hash store kept next to the pickled environment."""
+    return os.path.join(str(app.doctreedir), "contenthash.json")
+
+
+def _source_digest(env: BuildEnvironment, docname: str) -> str:
+    """Hash a document together with the files it depends on (e.g. autodoc'd modules).
+
+    Paths enter the hash relative to the source directory, so moving the
+    checkout (or restoring a cached ``_build`` on another runner) keeps it valid.
+    """
+    digest = hashlib.sha256()
+    srcdir = str(env.srcdir)
+    paths = [str(env.doc2path(docname))]
+    paths += sorted(os.path.join(srcdir, dep) for dep in env.dependencies[docname])
+    for path in paths:
+        digest.update(os.path.relpath(path, srcdir).replace(os.sep, "/").encode("utf-8"))
+        try:
+            with open(path, "rb") as handle:
+                digest.update(handle.read())
+        except OSError:
+            digest.update(b"<missing>")
+    return digest.hexdigest()
+
+
+def _skip_unchanged_sources(app: Sphinx, env: BuildEnvironment, docnames: list[str]) -> None:
+    """Drop documents whose content matches the last build, whatever their mtime.
+
+    Fresh checkouts, ``touch`` and rsync all bump mtimes, which makes Sphinx
+    re-read every source even though the pickled environment is still valid.
+    Pruned documents get their stored read time refreshed, as Sphinx does after
+    a real read, and ``_store_content_hashes`` re-pickles the environment so the
+    next build no longer sees them as outdated.
+    """
+    _PRUNED_DOCS.clear()
+    if env.config_status != CONFIG_OK:
+        return
+    try:
+        with open(_content_hash_path(app), encoding="utf-8") as handle:
+            stored: dict[str, str] = json.load(handle)
+    except (OSError, ValueError):
+        return
+    for docname in list(docnames):
+        if docname not in env.all_docs or docname in env.reread_always:
+            continue
+        if stored.get(docname) == _source_digest(env, docname):
+            docnames.remove(docname)
+            env.all_docs[docname] = time.time_ns() // 1_000
+            _PRUNED_DOCS.add(docname)
+
+
+def _store_content_hashes(app: Sphinx, exception: Exception | None) -> None:
+    """Record per-document content hashes after a successful build.
+
+    Sphinx only pickles the environment when some document was read, so the
+    read times refreshed for pruned documents are saved here as well.
+    """
+    if exception is not None:
+        return
+    env = app.env
+    if _PRUNED_DOCS:
+        with open(os.path.join(str(app.doctreedir), ENV_PICKLE_FILENAME), "wb") as handle:
+            pickle.dump(env, handle, pickle.HIGHEST_PROTOCOL)
+        _PRUNED_DOCS.clear()
+    hashes = {docname: _source_digest(env, docname) for docname in sorted(env.all_docs)}
+    payload = json.dumps(hashes, indent=0, sort_keys=True).encode("utf-8")
+    write_if_changed(_content_hash_path(app), payload)
+
+
+def _autosummary_fingerprint(sources: list[str]) -> str:
+    """Hash the autosummary inputs: the API pages, the templates and every Python source."""
+    digest = hashlib.sha256()
+    paths = [os.path.join(DOCS_DIR, source) for source in sources]
+    for top in (os.path.join(DOCS_DIR, "_templates"), SRC_DIR):
+        for root, dirs, files in os.walk(top):
+            dirs.sort()
+            paths += [
+                os.path.join(root, name)
+                for name in sorted(files)
+                if top != SRC_DIR or name.endswith(".py")
+            ]
+    repo_root = os.path.dirname(DOCS_DIR)
+    for path in paths:
+        digest.update(os.path.relpath(path, repo_root).replace(os.sep, "/").encode("utf-8"))
+        with open(path, "rb") as handle:
+            digest.update(handle.read())
+    return digest.hexdigest()
+
+
+def _generated_stubs() -> list[str]:
+    """Return the autosummary stub files currently on disk, relative to ``STUB_DIR``."""
+    if not os.path.isdir(STUB_DIR):
+        return []
+    return sorted(name for name in os.listdir(STUB_DIR) if name.endswith(".rst"))
+
+
+def _read_autosummary_marker(marker: str) -> dict[str, Any]:
+    """Load the fingerprint and stub list recorded by the last generation pass."""
+    try:
+        with open(marker, encoding="utf-8") as handle:
+            recorded = json.load(handle)
+    except (OSError, ValueError):
+        return {}
+    return recorded if isinstance(recorded, dict) else {}
+
+
+def _skip_unchanged_autosummary(generate: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap autosummary stub generation so it is skipped when no input changed.
+
+    Generation imports every documented module; when neither the API pages, the
+    templates nor the Python sources changed since the last run and every stub
+    it produced is still on disk, the whole pass can be skipped. Recursive calls
+    made by autosummary itself pass straight through.
+    """
+    active = False
+
+    @functools.wraps(generate)
+    def wrapper(sources: list[str], *args: Any, **kwargs: Any) -> Any:
+        nonlocal active
+        app = kwargs.get("app")
+        if active or app is None:
+            return generate(sources, *args, **kwargs)
+        marker = os.path.join(str(app.doctreedir), "autosummary.json")
+        fingerprint = _autosummary_fingerprint([str(source) for source in sources])
+        recorded = _read_autosummary_marker(marker)
+        stubs = recorded.get("stubs") or []
+        missing = [name for name in stubs if not os.path.isfile(os.path.join(STUB_DIR, name))]
+        if stubs and not missing and recorded.get("fingerprint") == fingerprint:
+            logger.info("autosummary: stubs up to date, skipping generation")
+            return []
+        if missing:
+            # Autosummary only recurses into stubs it rewrites, so a lost nested stub
+            # comes back only when the whole tree is regenerated.
+            shutil.rmtree(STUB_DIR, ignore_errors=True)
+        active = True
+        try:
+            result = generate(sources, *args, **kwargs)
+        finally:
+            active = False
+        payload = {"fingerprint": fingerprint, "stubs": _generated_stubs()}
+        write_if_changed(marker, json.dumps(payload, indent=0, sort_keys=True).encode("utf-8"))
+        return result
+
+    return wrapper
+
 
-intersphinx_mapping = {"python": ("https://docs.python.org/3", None)}
-todo_include_todos = True
+def setup(app: Sphinx) -> None:
+    """Expose the freshness helpers to local extensions and event handlers."""
+    app.needs_rebuild = needs_rebuild  # type: ignore[attr-defined]
+    app.write_if_changed = write_if_changed  # type: ignore[attr-defined]
+    app.is_tracked = is_tracked  # type: ignore[attr-defined]
+    # Run ahead of autosummary's own builder-inited stub generation.
+    app.connect("builder-inited", _write_api_pages, priority=400)
+    app.connect("env-before-read-docs", _skip_unchanged_sources)
+    app.connect("build-finished", _store_content_hashes)
+    autosummary_generate_module.generate_autosummary_docs = _skip_unchanged_autosummary(
+        autosummary_generate_module.generate_autosummary_docs
+    )
@@ -1,5 +1,38 @@
-"""Expose the Click application entry point."""
+"""Expose the Click application entry point.
 
-from .main import cli
+``cli`` is resolved on first access so that ``kde-cpi --version`` can answer from package
+metadata without importing the command module and its numeric stack.
+"""
 
-__all__ = ["cli"]
+import sys
+from typing import Any
+
+__all__ = ["cli", "run"]
+
+VERSION_FLAGS = (["--version"], ["-V"])
+
+
+def run() -> None:
+    """Run the ``kde-cpi`` console script."""
+    if sys.argv[1:] in VERSION_FLAGS:
+        from importlib.metadata import PackageNotFoundError, version
+
+        try:
+            installed = version("kde-cpi")
+        except PackageNotFoundError:
+            pass  # Not installed; let Click report it.
+        else:
+            sys.stdout.write(f"kde-cpi, version {installed}\n")
+            return
+    from .main import cli
+
+    cli()
+
+
+def __getattr__(name: str) -> Any:
+    """Import the Click group on first access."""
+    if name == "cli":
+        from .main import cli
+
+        return cli
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
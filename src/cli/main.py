@@ -1,52 +1,165 @@
 """Command line entry point for the kde-cpi application."""
 
+from __future__ import annotations
+
 import asyncio
+import csv
+import functools
+import heapq
+import itertools
 import json
-from collections import defaultdict
-from collections.abc import Mapping, Sequence
-from dataclasses import dataclass
+import logging
+import math
+import os
+import secrets
+from collections.abc import Callable, Coroutine, Iterable, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from decimal import DivisionByZero, InvalidOperation
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeAlias, TypeVar
 
 import click
+import numpy as np
+import numpy.typing as npt
 import structlog
 
-from kde_cpi.data import (
-    CpiDatabaseLoader,
-    CpiDatasetBuilder,
-    Dataset,
-    Observation,
-    load_full_history,
-    update_current_periods,
-)
+from kde_cpi.data.files import MAPPING_FILES
 from kde_cpi.logging import configure_logging
 from kde_cpi.math import StatSummary, compute_statistics
 from kde_cpi.output import generate_density_plot, generate_histogram_plot
 from kde_cpi.output.utils import format_percent
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    # Imported inside the commands that need them so `--help` skips requests/asyncpg.
+    from kde_cpi.data import CpiDatabaseLoader, CpiDatasetBuilder, Dataset
+
+PACKAGE_NAME = "kde-cpi"
 DSN_HELP = "PostgreSQL connection string. May also be set via the KDE_CPI_DSN env var."
 SCHEMA_HELP = (
     "Target database schema for CPI tables. May also be set via the KDE_CPI_SCHEMA env var."
 )
 DATA_FILE_HELP = "One or more specific CPI data partitions to ingest (e.g. cu.data.0.Current)."
+WORKERS_HELP = "Worker processes for KDE summaries (1 = run in-process, 0 = one per CPU)."
 
 LOG_FORMAT_CHOICES = ("console", "json")
 LOG_LEVEL_CHOICES = ("critical", "error", "warning", "info", "debug")
+TOP_EXAMPLE_COUNT = 5
+# Arrow types for non-float export columns; every other column is a float64 statistic.
+PARQUET_COLUMN_TYPES = {
+    "date": "string",
+    "year": "int64",
+    "period": "string",
+    "group_label": "string",
+    "group_by": "string",
+    "selectable_only": "bool",
+    "source": "string",
+    "count": "int64",
+    "component_count": "int64",
+    "mode_percent": "string",
+    "weighted_mean_percent": "string",
+    "weighted_median_percent": "string",
+    "trimmed_mean_percent": "string",
+    "weighted_kde_mode_percent": "string",
+}
+PARQUET_DICTIONARY_COLUMNS = frozenset({"group_label", "group_by", "period", "source"})
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY if orjson is not None else 0
+# Observations serialized per write when streaming a dataset snapshot.
+JSON_STREAM_CHUNK = 10_000
 
 logger = structlog.get_logger(__name__)
 
+IntArray: TypeAlias = npt.NDArray[np.int64]
+FloatArray: TypeAlias = npt.NDArray[np.float64]
+BoolArray: TypeAlias = npt.NDArray[np.bool_]
+T = TypeVar("T")
+R = TypeVar("R")
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def _option_group(*options: Callable[[F], F]) -> Callable[[F], F]:
+    """Bundle click option decorators so commands can share one declaration."""
+
+    def decorator(func: F) -> F:
+        return functools.reduce(lambda wrapped, option: option(wrapped), reversed(options), func)
+
+    return decorator
+
+
+database_options = _option_group(
+    click.option("--dsn", envvar="KDE_CPI_DSN", help=DSN_HELP, default=None),
+    click.option("--schema", envvar="KDE_CPI_SCHEMA", default=None, help=SCHEMA_HELP),
+)
+data_file_option = click.option("--data-file", "data_files", multiple=True, help=DATA_FILE_HELP)
+workers_option = click.option(
+    "--workers", type=click.IntRange(min=0), default=1, show_default=True, help=WORKERS_HELP
+)
+
 
 @dataclass(slots=True)
 class ObservationCache:
-    """Precomputed lookup tables for per-series observations."""
-
-    observations: dict[str, dict[tuple[int, str], Observation]]
-    latest: dict[str, tuple[tuple[int, str], Observation]]
+    """Columnar observation index sorted by (series, year, period).
+
+    Each row is addressed by a composite ``int64`` key so that same-period
+    lookups across years reduce to ``np.searchsorted`` over ``keys``.
+    """
+
+    series_ids: list[str]
+    period_codes: list[str]
+    period_positions: dict[str, int]
+    keys: IntArray
+    values: FloatArray
+    latest: IntArray
     periods: list[tuple[int, str]]
+    base_year: int
+    year_span: int
+    eligibility: dict[tuple[bool, tuple[tuple[str, str], ...]], BoolArray] = field(
+        default_factory=dict
+    )
+
+    @property
+    def period_count(self) -> int:
+        """Return the stride between consecutive years in ``keys``."""
+        return max(len(self.period_codes), 1)
+
+    def key_for(self, year: int, period: str) -> int | None:
+        """Return the key offset of ``(year, period)`` for series zero, if indexed."""
+        offset = year - self.base_year
+        position = self.period_positions.get(period)
+        if not 0 < offset < self.year_span or position is None:
+            return None
+        return offset * self.period_count + position
+
+    def decode(self, key: int) -> tuple[str, int, str]:
+        """Return the ``(series_id, year, period)`` addressed by a row key."""
+        series_position, period_key = divmod(key, self.year_span * self.period_count)
+        year_offset, period_position = divmod(period_key, self.period_count)
+        return (
+            self.series_ids[series_position],
+            self.base_year + year_offset,
+            self.period_codes[period_position],
+        )
+
+    def series_of(self, rows: IntArray) -> IntArray:
+        """Return the ``series_ids`` position owning each row."""
+        return self.keys[rows] // (self.year_span * self.period_count)
 
+    def find(self, keys: IntArray) -> IntArray:
+        """Return row positions for the given keys, or -1 where absent."""
+        if not self.keys.size:
+            return np.full(keys.shape, -1, dtype=np.int64)
+        positions = np.searchsorted(self.keys, keys, side="right") - 1
+        clipped = np.maximum(positions, 0)
+        hits = (positions >= 0) & (self.keys[clipped] == keys)
+        return np.where(hits, positions, -1)
 
-@dataclass(frozen=True)
+
+@dataclass(slots=True, frozen=True)
 class GrowthComponent:
     """Single YoY growth component derived from CPI series observations."""
 
@@ -76,18 +189,106 @@ def _resolve_schema(ctx: click.Context, override: str | None) -> str:
     return schema
 
 
-def _build_dataset(*, current_only: bool, data_files: Sequence[str] | None) -> Dataset:
+@dataclass(slots=True)
+class ExportColumns:
+    """Column-oriented accumulator for tabular panel/timeseries exports."""
+
+    columns: dict[str, list[object]] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        """Return the number of rows appended so far."""
+        return len(next(iter(self.columns.values()), ()))
+
+    def append(self, row: Mapping[str, object]) -> None:
+        """Append one row, routing each value into its column list."""
+        for name, value in row.items():
+            self.columns.setdefault(name, []).append(value)
+
+
+def _default_cache_dir() -> Path:
+    """Return the per-user cache directory for flat-file snapshots."""
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "kde_cpi"
+
+
+def _async_runner(ctx: click.Context) -> asyncio.Runner:
+    """Return the event loop runner shared by every database call in this invocation."""
+    obj = ctx.ensure_object(dict)
+    runner = obj.get("runner")
+    if runner is None:
+        runner = asyncio.Runner(loop_factory=_event_loop_factory())
+        obj["runner"] = runner
+        ctx.find_root().call_on_close(lambda: _close_async_resources(obj))
+    return runner
+
+
+def _event_loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Return uvloop's loop factory when it is installed, else None for the default loop."""
+    try:
+        import uvloop  # type: ignore
+    except ImportError:
+        return None
+    return uvloop.new_event_loop  # type: ignore[no-any-return]
+
+
+def _close_async_resources(obj: dict[str, Any]) -> None:
+    """Close cached database loaders, then the shared event loop."""
+    runner = obj.pop("runner", None)
+    loaders = obj.pop("loaders", {})
+    if runner is None:
+        return
+    try:
+        for loader in loaders.values():
+            runner.run(loader.close())
+    finally:
+        runner.close()
+
+
+def _run_async(ctx: click.Context, coro: Coroutine[Any, Any, T]) -> T:
+    """Run ``coro`` on the invocation-wide event loop."""
+    return _async_runner(ctx).run(coro)
+
+
+def _database_loader(ctx: click.Context, dsn: str, schema: str) -> CpiDatabaseLoader:
+    """Return a loader whose connection is reused until the CLI context closes."""
+    from kde_cpi.data import CpiDatabaseLoader
+
+    _async_runner(ctx)
+    loaders: dict[tuple[str, str], CpiDatabaseLoader] = ctx.obj.setdefault("loaders", {})
+    loader = loaders.get((dsn, schema))
+    if loader is None:
+        loader = CpiDatabaseLoader(dsn=dsn, schema=schema)
+        loaders[(dsn, schema)] = loader
+    return loader
+
+
+def _dataset_builder(ctx: click.Context) -> CpiDatasetBuilder:
+    """Return a builder whose HTTP session is reused until the CLI context closes."""
+    from kde_cpi.data import CpiDatasetBuilder
+
+    obj = ctx.ensure_object(dict)
+    builder: CpiDatasetBuilder | None = obj.get("builder")
+    if builder is None:
+        builder = CpiDatasetBuilder(cache_dir=obj.get("cache_dir"))
+        obj["builder"] = builder
+        ctx.find_root().call_on_close(builder.close)
+    return builder
+
+
+def _build_dataset(
+    ctx: click.Context,
+    *,
+    current_only: bool,
+    data_files: Sequence[str] | None,
+) -> Dataset:
     """Load CPI data using the shared dataset builder."""
     build_log = logger.bind(scope="dataset-build", current_only=current_only)
     build_log.debug("dataset.build_start", data_files=list(data_files) if data_files else [])
-    builder = CpiDatasetBuilder()
-    try:
-        if current_only:
-            dataset = builder.load_current_observations()
-        else:
-            dataset = builder.load_dataset(data_files=data_files)
-    finally:
-        builder.close()
+    builder = _dataset_builder(ctx)
+    if current_only:
+        dataset = builder.load_current_observations()
+    else:
+        dataset = builder.load_dataset(data_files=data_files)
     if not dataset.observations:
         build_log.warning("dataset.build_empty", reason="no observations parsed")
     else:
@@ -95,32 +296,102 @@ def _build_dataset(*, current_only: bool, data_files: Sequence[str] | None) -> D
     return dataset
 
 
-def _echo_dataset_summary(action: str, dataset: Dataset) -> None:
+def _echo_dataset_summary(action: str, dataset: Dataset, *, metadata_only: bool = False) -> None:
     """Emit a concise data volume summary for terminal feedback."""
     logger.info(
         "dataset.summary",
         action=action,
         series=len(dataset.series),
-        observations=len(dataset.observations),
+        observations=None if metadata_only else len(dataset.observations),
         areas=len(dataset.areas),
         items=len(dataset.items),
     )
+    observations = "" if metadata_only else f"{len(dataset.observations)} observations "
     click.echo(
         f"{action}: {len(dataset.series)} series, "
-        f"{len(dataset.observations)} observations "
+        f"{observations}"
         f"across {len(dataset.areas)} areas and {len(dataset.items)} items."
     )
 
 
+def _dumps_json(payload: object) -> str:
+    """Render ``payload`` as indented JSON text, via orjson when installed."""
+    return _dumps_json_bytes(payload).decode("utf-8")
+
+
+def _write_json(path: Path, payload: object, *, pretty: bool = True) -> None:
+    """Write ``payload`` as JSON (indented unless ``pretty`` is off) without an intermediate str."""
+    if orjson is not None:
+        option = ORJSON_OPTIONS | orjson.OPT_INDENT_2 if pretty else ORJSON_OPTIONS
+        path.write_bytes(orjson.dumps(payload, option=option))
+        return
+    with path.open("w", encoding="utf-8") as handle:
+        json.dump(_finite_json(payload), handle, indent=2 if pretty else None, allow_nan=False)
+
+
+def _dumps_json_bytes(payload: object) -> bytes:
+    """Render ``payload`` as indented JSON bytes, via orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=ORJSON_OPTIONS | orjson.OPT_INDENT_2)
+    return json.dumps(_finite_json(payload), indent=2, allow_nan=False).encode("utf-8")
+
+
+def _finite_json(value: object) -> object:
+    """Map NaN and infinities to ``None`` for the stdlib encoder, as orjson already does."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, Mapping):
+        return {key: _finite_json(item) for key, item in value.items()}
+    if isinstance(value, list | tuple):
+        return [_finite_json(item) for item in value]
+    return value
+
+
+def _write_json_stream(
+    path: Path,
+    head: Mapping[str, object],
+    key: str,
+    rows: Iterable[object],
+    *,
+    chunk_size: int = JSON_STREAM_CHUNK,
+) -> None:
+    """Write ``head`` plus a trailing ``key`` array fed from ``rows``, one chunk at a time.
+
+    The output matches an indented dump of ``{**head, key: list(rows)}``.
+    """
+    prefix = _dumps_json_bytes({**head, key: []})
+    rows_iter = iter(rows)
+    chunk = list(itertools.islice(rows_iter, chunk_size))
+    with path.open("wb") as handle:
+        if not chunk:
+            handle.write(prefix)
+            return
+        # Reopen the empty trailing array and splice each chunk's items in one level deeper.
+        handle.write(prefix.removesuffix(b"[]\n}") + b"[\n")
+        separator = b""
+        while chunk:
+            body = _dumps_json_bytes(chunk)[2:-2]
+            handle.write(separator + b"  " + body.replace(b"\n", b"\n  "))
+            separator = b",\n"
+            chunk = list(itertools.islice(rows_iter, chunk_size))
+        handle.write(b"\n  ]\n}")
+
+
 def _write_dataset(output: Path, dataset: Dataset) -> None:
-    """Serialize a dataset to disk."""
+    """Serialize a dataset to disk, streaming the observations."""
     output.parent.mkdir(parents=True, exist_ok=True)
-    output.write_text(json.dumps(dataset.to_dict(), indent=2))
+    _write_json_stream(
+        output,
+        dataset.to_dict(observations=False),
+        "observations",
+        dataset.iter_observation_dicts(),
+    )
     click.echo(f"Wrote dataset snapshot to {output}")
     logger.debug("dataset.snapshot_written", output=str(output))
 
 
 @click.group()
+@click.version_option(None, "--version", "-V", package_name=PACKAGE_NAME, prog_name=PACKAGE_NAME)
 @click.option("--dsn", envvar="KDE_CPI_DSN", help=DSN_HELP, default=None)
 @click.option(
     "--schema",
@@ -145,6 +416,19 @@ def _write_dataset(output: Path, dataset: Dataset) -> None:
     show_default=True,
     help="Render logs as console-friendly text or JSON.",
 )
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    envvar="KDE_CPI_CACHE_DIR",
+    default=None,
+    help="Directory for parsed flat-file snapshots (default: ~/.cache/kde_cpi).",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    help="Always download and parse flat files instead of reusing snapshots.",
+)
 @click.pass_context
 def cli(
     ctx: click.Context,
@@ -152,11 +436,14 @@ def cli(
     schema: str,
     log_level: str,
     log_format: str,
+    cache_dir: Path | None,
+    no_cache: bool,
 ) -> None:
     """Manage CPI ingestion, database loading, and reporting workflows."""
     configure_logging(level=log_level, json_output=log_format.lower() == "json")
     ctx.ensure_object(dict)
-    ctx.obj.update({"dsn": dsn, "schema": schema})
+    resolved_cache = None if no_cache else cache_dir or _default_cache_dir()
+    ctx.obj.update({"dsn": dsn, "schema": schema, "cache_dir": resolved_cache})
     logger.bind(command_group="kde-cpi").debug(
         "cli.initialized",
         dsn=bool(dsn),
@@ -173,30 +460,26 @@ def cli(
     type=click.Path(dir_okay=False, path_type=Path),
     help="Optional path to save the assembled dataset as JSON.",
 )
-@click.option(
-    "--data-file",
-    "data_files",
-    multiple=True,
-    help=DATA_FILE_HELP,
-)
+@data_file_option
 @click.option(
     "--current-only",
     is_flag=True,
     default=False,
     help="Limit ingestion to the current-year CPI partition.",
 )
+@click.pass_context
 def fetch_dataset(
+    ctx: click.Context,
     *,
     output_path: Path | None,
     data_files: tuple[str, ...],
     current_only: bool,
 ) -> None:
     """Download CPI flat files, stitch them together, and report counts."""
-    if current_only and data_files:
-        raise click.UsageError("--current-only cannot be combined with --data-file.")
+    _validate_source_args("flatfiles", current_only=current_only, data_files=data_files)
     cmd_log = logger.bind(command="fetch-dataset", current_only=current_only)
     cmd_log.info("command.start", data_files=list(data_files))
-    dataset = _build_dataset(current_only=current_only, data_files=data_files or None)
+    dataset = _build_dataset(ctx, current_only=current_only, data_files=data_files or None)
     _echo_dataset_summary("Fetched dataset", dataset)
     if output_path:
         _write_dataset(output_path, dataset)
@@ -284,12 +567,7 @@ def _parse_series_locks(values: Sequence[str]) -> dict[str, str]:
     show_default=True,
     help="Where to read CPI data from before analysis.",
 )
-@click.option(
-    "--data-file",
-    "data_files",
-    multiple=True,
-    help=DATA_FILE_HELP,
-)
+@data_file_option
 @click.option(
     "--current-only",
     is_flag=True,
@@ -321,6 +599,7 @@ def _parse_series_locks(values: Sequence[str]) -> dict[str, str]:
     show_default=True,
     help="Skip KDE artifacts when the group is smaller than the minimum sample size.",
 )
+@workers_option
 @click.pass_context
 def analyze(
     ctx: click.Context,
@@ -335,6 +614,7 @@ def analyze(
     series_lock_args: tuple[str, ...],
     min_sample_size: int,
     skip_small_samples: bool,
+    workers: int,
 ) -> None:
     """Compute YoY growth distributions and emit charts/statistics."""
     original_group = group_by.lower()
@@ -367,16 +647,17 @@ def analyze(
         skip_small_samples=skip_small_samples,
     )
 
-    if source == "database":
-        resolved_dsn = _require_dsn(ctx, None)
-        resolved_schema = _resolve_schema(ctx, None)
-        dataset = _load_dataset_from_database(resolved_dsn, resolved_schema)
-    else:
-        dataset = _build_dataset(current_only=current_only, data_files=data_files or None)
+    dataset, cache = _load_analysis_dataset(
+        ctx,
+        source=source,
+        current_only=current_only,
+        data_files=data_files,
+    )
     components, _ = _compute_growth_components(
         dataset,
         selectable_only=selectable_only,
         target_period=None,
+        cache=cache,
         series_locks=series_locks,
     )
     if not components:
@@ -384,19 +665,23 @@ def analyze(
 
     analysis_dir = _create_analysis_dir(output_dir, group_by_normalized)
     groups = _group_components(components, group_by_normalized, length_bin_size=length_bin_size)
-    group_summaries = []
-    for label, comps in groups.items():
+    jobs: list[tuple[Path, str, list[GrowthComponent]]] = []
+    for bin_value, comps in groups.items():
         if not comps:
             continue
+        label = _group_label(group_by_normalized, bin_value)
         if _should_skip_sample(
             len(comps),
             min_sample_size=min_sample_size,
             skip_small_samples=skip_small_samples,
             scope="group",
-            label=str(label),
+            label=label,
         ):
             continue
-        group_summaries.append(_render_group_reports(analysis_dir, label, comps))
+        jobs.append((analysis_dir, label, comps))
+    group_summaries = _process_map(
+        _render_group_job, jobs, workers=workers, initializer=_use_agg_backend
+    )
 
     generated_at = datetime.now(UTC)
     summary_payload = {
@@ -411,7 +696,7 @@ def analyze(
         "skip_small_samples": skip_small_samples,
     }
     summary_path = analysis_dir / "summary.json"
-    summary_path.write_text(json.dumps(summary_payload, indent=2))
+    _write_json(summary_path, summary_payload)
     click.echo(f"Analysis artifacts written to {analysis_dir}")
     cmd_log.info("command.completed", output=str(analysis_dir), groups=len(group_summaries))
 
@@ -447,12 +732,7 @@ def analyze(
     show_default=True,
     help="Source for CPI components prior to analysis.",
 )
-@click.option(
-    "--data-file",
-    "data_files",
-    multiple=True,
-    help=DATA_FILE_HELP,
-)
+@data_file_option
 @click.option(
     "--current-only",
     is_flag=True,
@@ -547,15 +827,16 @@ def compute(
 
     groups = _group_components(components, group_by_normalized, length_bin_size=length_bin_size)
     summaries: list[dict[str, object]] = []
-    for label, comps in groups.items():
+    for bin_value, comps in groups.items():
         if not comps:
             continue
+        label = _group_label(group_by_normalized, bin_value)
         if _should_skip_sample(
             len(comps),
             min_sample_size=min_sample_size,
             skip_small_samples=skip_small_samples,
             scope="group",
-            label=str(label),
+            label=label,
         ):
             continue
         summaries.append(_build_group_summary(label, comps))
@@ -572,13 +853,12 @@ def compute(
         "min_sample_size": min_sample_size,
         "skip_small_samples": skip_small_samples,
     }
-    document = json.dumps(payload, indent=2)
     if output:
         output.parent.mkdir(parents=True, exist_ok=True)
-        output.write_text(document)
+        _write_json(output, payload)
         click.echo(f"Wrote summary to {output}")
     else:
-        click.echo(document)
+        click.echo(_dumps_json(payload))
 
 
 @cli.command("panel")
@@ -611,12 +891,7 @@ def compute(
     show_default=True,
     help="Source for CPI components prior to analysis.",
 )
-@click.option(
-    "--data-file",
-    "data_files",
-    multiple=True,
-    help=DATA_FILE_HELP,
-)
+@data_file_option
 @click.option(
     "--current-only",
     is_flag=True,
@@ -648,6 +923,7 @@ def compute(
     show_default=True,
     help="Skip rows whose group samples do not meet the minimum.",
 )
+@workers_option
 @click.pass_context
 def panel(
     ctx: click.Context,
@@ -664,6 +940,7 @@ def panel(
     series_lock_args: tuple[str, ...],
     min_sample_size: int,
     skip_small_samples: bool,
+    workers: int,
 ) -> None:
     """Generate a tidy panel of KDE-mode metrics over a date range."""
     group_by_normalized = group_by.lower()
@@ -692,16 +969,19 @@ def panel(
         data_files=data_files,
     )
 
-    rows: list[dict[str, object]] = []
-    for year, period_code, dt in months:
+    current_rows, growth = _growth_panel_rows(
+        dataset,
+        [(year, period_code) for year, period_code, _ in months],
+        selectable_only=selectable_only,
+        cache=cache,
+        series_locks=series_locks,
+    )
+    # Bins depend only on static series metadata, so resolve them once for the whole range.
+    series_bins = _series_bins(dataset, cache, group_by_normalized)
+    jobs: list[tuple[str, str, list[GrowthComponent]]] = []
+    for slot, (_year, _period_code, dt) in enumerate(months):
         date_label = dt.strftime("%Y-%m")
-        components, cache = _compute_growth_components(
-            dataset,
-            selectable_only=selectable_only,
-            target_period=(year, period_code),
-            cache=cache,
-            series_locks=series_locks,
-        )
+        components = _materialize_components(dataset, cache, current_rows[slot], growth[slot])
         if not components:
             continue
         if _should_skip_sample(
@@ -712,10 +992,17 @@ def panel(
             label=date_label,
         ):
             continue
-        groups = _group_components(components, group_by_normalized, length_bin_size=length_bin_size)
-        for label, comps in groups.items():
+        rows_present = current_rows[slot][~np.isnan(growth[slot])]
+        groups = _group_components(
+            components,
+            group_by_normalized,
+            length_bin_size=length_bin_size,
+            bins=np.take(series_bins, cache.series_of(rows_present)),
+        )
+        for bin_value, comps in groups.items():
             if not comps:
                 continue
+            label = _group_label(group_by_normalized, bin_value)
             if _should_skip_sample(
                 len(comps),
                 min_sample_size=min_sample_size,
@@ -724,17 +1011,21 @@ def panel(
                 label=f"{date_label}:{label}",
             ):
                 continue
-            summary = _build_group_summary(label, comps)
-            rows.append(
-                _flatten_summary_row(
-                    date=date_label,
-                    group_label=label,
-                    summary=summary,
-                    group_by=group_by_normalized,
-                    selectable_only=selectable_only,
-                    source=source.lower(),
-                )
+            jobs.append((date_label, label, comps))
+
+    summaries = _map_group_summaries([(label, comps) for _, label, comps in jobs], workers=workers)
+    rows = ExportColumns()
+    for (date_label, label, _), summary in zip(jobs, summaries, strict=True):
+        rows.append(
+            _flatten_summary_row(
+                date=date_label,
+                group_label=label,
+                summary=summary,
+                group_by=group_by_normalized,
+                selectable_only=selectable_only,
+                source=source.lower(),
             )
+        )
 
     if not rows:
         raise click.ClickException("No rows were produced for the requested range.")
@@ -775,12 +1066,7 @@ def panel(
     show_default=True,
     help="Where to source CPI observations.",
 )
-@click.option(
-    "--data-file",
-    "data_files",
-    multiple=True,
-    help=DATA_FILE_HELP,
-)
+@data_file_option
 @click.option(
     "--current-only",
     is_flag=True,
@@ -853,15 +1139,15 @@ def metrics_timeseries(
         data_files=data_files,
     )
 
-    rows: list[dict[str, object]] = []
-    for year, period_code, dt in months:
-        components, cache = _compute_growth_components(
-            dataset,
-            selectable_only=selectable_only,
-            target_period=(year, period_code),
-            cache=cache,
-            series_locks=series_locks,
-        )
+    panel_components = _compute_growth_panel(
+        dataset,
+        [(year, period_code) for year, period_code, _ in months],
+        selectable_only=selectable_only,
+        cache=cache,
+        series_locks=series_locks,
+    )
+    rows = ExportColumns()
+    for (year, period_code, dt), components in zip(months, panel_components, strict=True):
         if not components:
             logger.debug("timeseries.no_components", year=year, period=period_code)
             continue
@@ -874,10 +1160,7 @@ def metrics_timeseries(
             label=date_label,
         ):
             continue
-        stats = compute_statistics(
-            [comp.value for comp in components],
-            [1.0] * len(components),
-        )
+        stats = compute_statistics(_component_values(components))
         rows.append(
             _flatten_timeseries_row(
                 date=date_label,
@@ -906,25 +1189,14 @@ def metrics_timeseries(
 
 
 @cli.command("load-full")
-@click.option("--dsn", envvar="KDE_CPI_DSN", help=DSN_HELP, default=None)
-@click.option(
-    "--schema",
-    envvar="KDE_CPI_SCHEMA",
-    default=None,
-    help=SCHEMA_HELP,
-)
+@database_options
 @click.option(
     "--no-truncate/--truncate",
     default=False,
     show_default=True,
     help="Skip truncating existing CPI tables before loading.",
 )
-@click.option(
-    "--data-file",
-    "data_files",
-    multiple=True,
-    help=DATA_FILE_HELP,
-)
+@data_file_option
 @click.pass_context
 def load_full(
     ctx: click.Context,
@@ -935,6 +1207,8 @@ def load_full(
     data_files: tuple[str, ...],
 ) -> None:
     """Load the entire CPI history into PostgreSQL."""
+    from kde_cpi.data import load_full_history
+
     resolved_dsn = _require_dsn(ctx, dsn)
     resolved_schema = _resolve_schema(ctx, schema)
     cmd_log = logger.bind(command="load-full", schema=resolved_schema)
@@ -943,46 +1217,58 @@ def load_full(
         truncate=not no_truncate,
         data_files=list(data_files),
     )
-    dataset = asyncio.run(
+    dataset = _run_async(
+        ctx,
         load_full_history(
             resolved_dsn,
             schema=resolved_schema,
             truncate=not no_truncate,
             data_files=data_files or None,
-        )
+            loader=_database_loader(ctx, resolved_dsn, resolved_schema),
+            builder=_dataset_builder(ctx),
+        ),
     )
     _echo_dataset_summary("Loaded dataset", dataset)
     cmd_log.info("command.completed", observations=len(dataset.observations))
 
 
 @cli.command("update-current")
-@click.option("--dsn", envvar="KDE_CPI_DSN", help=DSN_HELP, default=None)
+@database_options
 @click.option(
-    "--schema",
-    envvar="KDE_CPI_SCHEMA",
-    default=None,
-    help=SCHEMA_HELP,
+    "--mappings",
+    "mappings",
+    multiple=True,
+    type=click.Choice(list(MAPPING_FILES)),
+    help="Mapping tables to refresh (repeatable; default: areas and items).",
 )
 @click.pass_context
-def update_current(ctx: click.Context, *, dsn: str | None, schema: str | None) -> None:
+def update_current(
+    ctx: click.Context, *, dsn: str | None, schema: str | None, mappings: tuple[str, ...]
+) -> None:
     """Refresh only the current-year CPI observations."""
+    from kde_cpi.data import update_current_periods
+    from kde_cpi.data.pipeline import CURRENT_UPDATE_MAPPINGS
+
     resolved_dsn = _require_dsn(ctx, dsn)
     resolved_schema = _resolve_schema(ctx, schema)
     cmd_log = logger.bind(command="update-current", schema=resolved_schema)
-    cmd_log.info("command.start")
-    dataset = asyncio.run(update_current_periods(resolved_dsn, schema=resolved_schema))
+    cmd_log.info("command.start", mappings=list(mappings))
+    dataset = _run_async(
+        ctx,
+        update_current_periods(
+            resolved_dsn,
+            schema=resolved_schema,
+            loader=_database_loader(ctx, resolved_dsn, resolved_schema),
+            mappings=frozenset(mappings) or CURRENT_UPDATE_MAPPINGS,
+            builder=_dataset_builder(ctx),
+        ),
+    )
     _echo_dataset_summary("Updated current partitions", dataset)
     cmd_log.info("command.completed", observations=len(dataset.observations))
 
 
 @cli.command("ensure-schema")
-@click.option("--dsn", envvar="KDE_CPI_DSN", help=DSN_HELP, default=None)
-@click.option(
-    "--schema",
-    envvar="KDE_CPI_SCHEMA",
-    default=None,
-    help=SCHEMA_HELP,
-)
+@database_options
 @click.pass_context
 def ensure_schema(ctx: click.Context, *, dsn: str | None, schema: str | None) -> None:
     """Create the CPI tables if they are missing."""
@@ -990,38 +1276,25 @@ def ensure_schema(ctx: click.Context, *, dsn: str | None, schema: str | None) ->
     resolved_schema = _resolve_schema(ctx, schema)
     cmd_log = logger.bind(command="ensure-schema", schema=resolved_schema)
     cmd_log.info("command.start")
-
-    async def _run() -> None:
-        loader = CpiDatabaseLoader(dsn=resolved_dsn, schema=resolved_schema)
-        try:
-            await loader.ensure_schema()
-        finally:
-            await loader.close()
-
-    asyncio.run(_run())
+    loader = _database_loader(ctx, resolved_dsn, resolved_schema)
+    _run_async(ctx, loader.ensure_schema())
     click.echo(f"Ensured schema objects in {resolved_schema}.")
     cmd_log.info("command.completed")
 
 
 @cli.command("sync-metadata")
-@click.option("--dsn", envvar="KDE_CPI_DSN", help=DSN_HELP, default=None)
-@click.option(
-    "--schema",
-    envvar="KDE_CPI_SCHEMA",
-    default=None,
-    help=SCHEMA_HELP,
-)
+@database_options
 @click.option(
     "--current-only",
     is_flag=True,
     default=False,
-    help="Use the smaller current-year partition to refresh metadata.",
+    help="Deprecated and ignored: metadata sync no longer reads observation partitions.",
 )
 @click.option(
     "--data-file",
     "data_files",
     multiple=True,
-    help=DATA_FILE_HELP,
+    help="Deprecated and ignored: metadata sync no longer reads observation partitions.",
 )
 @click.pass_context
 def sync_metadata(
@@ -1033,9 +1306,9 @@ def sync_metadata(
     data_files: tuple[str, ...],
 ) -> None:
     """Upsert mapping tables and series definitions without touching observations."""
-    if current_only and data_files:
-        raise click.UsageError("--current-only cannot be combined with --data-file.")
-    dataset = _build_dataset(current_only=current_only, data_files=data_files or None)
+    if current_only or data_files:
+        logger.warning("sync_metadata.partition_options_ignored")
+    dataset = _dataset_builder(ctx).load_metadata()
     resolved_dsn = _require_dsn(ctx, dsn)
     resolved_schema = _resolve_schema(ctx, schema)
     cmd_log = logger.bind(command="sync-metadata", schema=resolved_schema)
@@ -1044,32 +1317,25 @@ def sync_metadata(
         current_only=current_only,
         data_files=list(data_files),
     )
-
-    async def _run() -> None:
-        loader = CpiDatabaseLoader(dsn=resolved_dsn, schema=resolved_schema)
-        try:
-            await loader.sync_metadata(dataset)
-        finally:
-            await loader.close()
-
-    asyncio.run(_run())
-    _echo_dataset_summary("Synced metadata using dataset", dataset)
-    cmd_log.info("command.completed", observations=len(dataset.observations))
+    loader = _database_loader(ctx, resolved_dsn, resolved_schema)
+    _run_async(ctx, loader.sync_metadata(dataset))
+    _echo_dataset_summary("Synced metadata", dataset, metadata_only=True)
+    cmd_log.info("command.completed", series=len(dataset.series))
 
 
 def _create_analysis_dir(base: Path, group_by: str) -> Path:
-    """Return a timestamped output directory for analysis artifacts."""
+    """Return a new timestamped output directory for analysis artifacts."""
     timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
     slug = group_by.replace("-", "_")
-    attempt = 0
+    base.mkdir(parents=True, exist_ok=True)
     while True:
-        suffix = f"_{attempt}" if attempt else ""
-        candidate = base / f"analysis_{slug}_{timestamp}{suffix}"
+        # A random suffix makes concurrent runs within the same second collide ~never.
+        candidate = base / f"analysis_{slug}_{timestamp}_{secrets.token_hex(3)}"
         try:
-            candidate.mkdir(parents=True, exist_ok=False)
+            candidate.mkdir()
             return candidate
-        except FileExistsError:
-            attempt += 1
+        except FileExistsError:  # pragma: no cover - 1 in 16M chance per second
+            continue
 
 
 def _normalize_period(period: str) -> str:
@@ -1077,6 +1343,7 @@ def _normalize_period(period: str) -> str:
     return period.strip().upper()
 
 
+@functools.lru_cache(maxsize=4096)
 def _period_rank(period: str) -> int:
     """Return a sortable rank for CPI period codes (monthly-aware)."""
     period = _normalize_period(period)
@@ -1085,42 +1352,66 @@ def _period_rank(period: str) -> int:
     return 0
 
 
-def _period_sort_key(year: int, period: str) -> tuple[int, int, str]:
-    """Provide a sorting tuple for period keys."""
-    return (year, _period_rank(period), _normalize_period(period))
-
-
 def _build_observation_cache(dataset: Dataset) -> ObservationCache:
-    """Precompute per-series observation lookups and metadata."""
-    observations: dict[str, dict[tuple[int, str], Observation]] = {}
-    latest: dict[str, tuple[tuple[int, str], Observation]] = {}
-    period_set: set[tuple[int, str]] = set()
+    """Index observations into sorted columnar arrays for vectorized lookups."""
+    series_lookup: dict[str, int] = {}
+    period_lookup: dict[str, int] = {}
+    series_col: list[int] = []
+    year_col: list[int] = []
+    period_col: list[int] = []
+    value_col: list[object] = []
+    # Observation.period is normalized and interned at construction time.
     for obs in dataset.observations:
-        period_code = _normalize_period(obs.period)
-        key = (obs.year, period_code)
-        period_set.add(key)
-        series_entries = observations.setdefault(obs.series_id, {})
-        series_entries[key] = obs
-        order_key = _period_sort_key(obs.year, period_code)
-        existing = latest.get(obs.series_id)
-        if existing is None or order_key > _period_sort_key(*existing[0]):
-            latest[obs.series_id] = (key, obs)
-    periods = sorted(period_set, key=lambda item: _period_sort_key(item[0], item[1]))
-    return ObservationCache(observations=observations, latest=latest, periods=periods)
-
-
-def _load_dataset_from_database(dsn: str, schema: str) -> Dataset:
-    """Load CPI data from PostgreSQL into a Dataset."""
+        series_col.append(series_lookup.setdefault(obs.series_id, len(series_lookup)))
+        year_col.append(obs.year)
+        period_col.append(period_lookup.setdefault(obs.period, len(period_lookup)))
+        value_col.append(obs.value)
+
+    # Number periods in (rank, code) order so keys sort by (year, rank, code).
+    period_codes = sorted(period_lookup, key=lambda code: (_period_rank(code), code))
+    remap = np.empty(len(period_codes), dtype=np.int64)
+    for position, code in enumerate(period_codes):
+        remap[period_lookup[code]] = position
+    period_count = max(len(period_codes), 1)
+
+    series_idx = np.asarray(series_col, dtype=np.int64)
+    years = np.asarray(year_col, dtype=np.int64)
+    period_idx = remap[np.asarray(period_col, dtype=np.int64)]
+    # Offsetting years by one leaves key slot zero empty, so year-1 never aliases a neighbour.
+    base_year = int(years.min()) - 1 if years.size else 0
+    year_span = int(years.max()) - base_year + 1 if years.size else 1
+    period_keys = (years - base_year) * period_count + period_idx
+    keys = series_idx * year_span * period_count + period_keys
+
+    order = np.argsort(keys, kind="stable")
+    keys = keys[order]
+    sorted_series = series_idx[order]
+    block_ends = np.flatnonzero(np.diff(sorted_series, append=-1))
+    latest = np.empty(len(series_lookup), dtype=np.int64)
+    latest[sorted_series[block_ends]] = block_ends
+
+    periods = [
+        (base_year + int(key) // period_count, period_codes[int(key) % period_count])
+        for key in np.unique(period_keys)
+    ]
+    return ObservationCache(
+        series_ids=list(series_lookup),
+        period_codes=period_codes,
+        period_positions={code: position for position, code in enumerate(period_codes)},
+        keys=keys,
+        values=np.asarray(value_col, dtype=np.float64)[order],
+        latest=latest,
+        periods=periods,
+        base_year=base_year,
+        year_span=year_span,
+    )
 
-    async def _run() -> Dataset:
-        loader = CpiDatabaseLoader(dsn=dsn, schema=schema)
-        try:
-            return await loader.fetch_dataset()
-        finally:
-            await loader.close()
 
+def _load_dataset_from_database(ctx: click.Context, dsn: str, schema: str) -> Dataset:
+    """Load CPI data from PostgreSQL into a Dataset."""
     logger.info("analysis.load_from_db", schema=schema)
-    dataset = asyncio.run(_run())
+    loader = _database_loader(ctx, dsn, schema)
+    dataset = _run_async(ctx, loader.fetch_dataset())
     logger.info(
         "analysis.load_from_db_complete",
         series=len(dataset.series),
@@ -1148,6 +1439,31 @@ def _series_matches(series: object, locks: Mapping[str, str] | None) -> bool:
     return True
 
 
+def _eligible_series(
+    dataset: Dataset,
+    cache: ObservationCache,
+    *,
+    selectable_only: bool,
+    series_locks: Mapping[str, str] | None,
+) -> BoolArray:
+    """Return (and memoize) a per-series mask of metadata filters that pass."""
+    memo_key = (selectable_only, tuple(sorted((series_locks or {}).items())))
+    mask = cache.eligibility.get(memo_key)
+    if mask is not None:
+        return mask
+    mask = np.zeros(len(cache.series_ids), dtype=np.bool_)
+    for position, series_id in enumerate(cache.series_ids):
+        series = dataset.series.get(series_id)
+        if series is None or not _series_matches(series, series_locks):
+            continue
+        item = dataset.items.get(series.item_code)
+        if item is None or (selectable_only and not item.selectable):
+            continue
+        mask[position] = True
+    cache.eligibility[memo_key] = mask
+    return mask
+
+
 def _compute_growth_components(
     dataset: Dataset,
     *,
@@ -1157,40 +1473,107 @@ def _compute_growth_components(
     series_locks: Mapping[str, str] | None = None,
 ) -> tuple[list[GrowthComponent], ObservationCache]:
     """Derive YoY growth components per series from the dataset."""
-    cache = cache or _build_observation_cache(dataset)
-    components: list[GrowthComponent] = []
-    normalized_target: tuple[int, str] | None = None
+    if cache is None:
+        cache = _build_observation_cache(dataset)
     if target_period is not None:
-        normalized_target = (target_period[0], _normalize_period(target_period[1]))
+        (components,) = _compute_growth_panel(
+            dataset,
+            [target_period],
+            selectable_only=selectable_only,
+            cache=cache,
+            series_locks=series_locks,
+        )
+        return components, cache
+    eligible = _eligible_series(
+        dataset, cache, selectable_only=selectable_only, series_locks=series_locks
+    )
+    current_rows = cache.latest[eligible]
+    components = _materialize_components(
+        dataset, cache, current_rows, _year_over_year(cache, current_rows)
+    )
+    logger.debug("analysis.components_computed", count=len(components))
+    return components, cache
 
-    for series_id, series_obs in cache.observations.items():
-        series = dataset.series.get(series_id)
-        if not _series_matches(series, series_locks):
-            continue
-        if normalized_target is not None:
-            current_key = normalized_target
-        else:
-            latest_entry = cache.latest.get(series_id)
-            if latest_entry is None:
-                continue
-            current_key = latest_entry[0]
-        current = series_obs.get(current_key)
-        if current is None:
-            continue
-        prev_key = (current_key[0] - 1, current_key[1])
-        previous = series_obs.get(prev_key)
-        if previous is None:
-            continue
-        value = _compute_yoy(current, previous)
-        if value is None:
-            continue
-        if series is None:
-            continue
-        item = dataset.items.get(series.item_code)
-        if item is None:
-            continue
-        if selectable_only and not item.selectable:
-            continue
+
+def _compute_growth_panel(
+    dataset: Dataset,
+    periods: Sequence[tuple[int, str]],
+    *,
+    selectable_only: bool,
+    cache: ObservationCache,
+    series_locks: Mapping[str, str] | None = None,
+) -> list[list[GrowthComponent]]:
+    """Compute YoY components for several target periods in one vectorized pass."""
+    current_rows, growth = _growth_panel_rows(
+        dataset, periods, selectable_only=selectable_only, cache=cache, series_locks=series_locks
+    )
+    panel = [
+        _materialize_components(dataset, cache, current_rows[slot], growth[slot])
+        for slot in range(len(periods))
+    ]
+    if logger.is_enabled_for(logging.DEBUG):
+        logger.debug(
+            "analysis.components_computed",
+            periods=len(periods),
+            count=sum(len(components) for components in panel),
+        )
+    return panel
+
+
+def _growth_panel_rows(
+    dataset: Dataset,
+    periods: Sequence[tuple[int, str]],
+    *,
+    selectable_only: bool,
+    cache: ObservationCache,
+    series_locks: Mapping[str, str] | None = None,
+) -> tuple[IntArray, FloatArray]:
+    """Return (periods x eligible series) current rows and YoY growth (NaN when undefined)."""
+    eligible = _eligible_series(
+        dataset, cache, selectable_only=selectable_only, series_locks=series_locks
+    )
+    series_keys = np.flatnonzero(eligible).astype(np.int64) * (cache.year_span * cache.period_count)
+    # One row per requested period, one column per eligible series; -1 never matches a key.
+    target_keys = np.full((len(periods), series_keys.size), -1, dtype=np.int64)
+    for slot, (year, period) in enumerate(periods):
+        offset = cache.key_for(year, _normalize_period(period))
+        if offset is not None:
+            target_keys[slot] = series_keys + offset
+    current_rows = cache.find(target_keys.ravel())
+    growth = _year_over_year(cache, current_rows).reshape(target_keys.shape)
+    return current_rows.reshape(target_keys.shape), growth
+
+
+def _year_over_year(cache: ObservationCache, current_rows: IntArray) -> FloatArray:
+    """Return YoY growth aligned with ``current_rows`` (NaN where no usable pair exists)."""
+    growth = np.full(current_rows.shape, np.nan)
+    present = np.flatnonzero(current_rows >= 0)
+    if not present.size:
+        return growth
+    rows = current_rows[present]
+    previous_rows = cache.find(cache.keys[rows] - cache.period_count)
+    paired = previous_rows >= 0
+    growth[present[paired]] = _compute_yoy(
+        cache.values[rows[paired]], cache.values[previous_rows[paired]]
+    )
+    return growth
+
+
+def _materialize_components(
+    dataset: Dataset,
+    cache: ObservationCache,
+    current_rows: IntArray,
+    growth: FloatArray,
+) -> list[GrowthComponent]:
+    """Build GrowthComponent records for rows whose YoY growth is defined."""
+    valid = ~np.isnan(growth)
+    components: list[GrowthComponent] = []
+    for key, value in zip(
+        cache.keys[current_rows[valid]].tolist(), growth[valid].tolist(), strict=True
+    ):
+        series_id, year, period = cache.decode(key)
+        series = dataset.series[series_id]
+        item = dataset.items[series.item_code]
         components.append(
             GrowthComponent(
                 series_id=series_id,
@@ -1199,25 +1582,19 @@ def _compute_growth_components(
                 display_level=item.display_level,
                 series_title=series.series_title,
                 value=value,
-                year=current.year,
-                period=_normalize_period(current.period),
+                year=year,
+                period=period,
             )
         )
-    logger.debug("analysis.components_computed", count=len(components))
-    return components, cache
+    return components
 
 
-def _compute_yoy(current: Observation, previous: Observation) -> float | None:
-    """Return the year-over-year change between two observations."""
-    if current.value.is_nan() or previous.value.is_nan():
-        return None
-    if previous.value == 0:
-        return None
-    try:
-        delta = (current.value - previous.value) / previous.value
-    except (DivisionByZero, InvalidOperation):  # pragma: no cover - defensive
-        return None
-    return float(delta)
+def _compute_yoy(current: FloatArray, previous: FloatArray) -> FloatArray:
+    """Return element-wise YoY changes, NaN where either side is missing or zero."""
+    growth = np.full(current.shape, np.nan)
+    valid = ~np.isnan(current) & ~np.isnan(previous) & (previous != 0)
+    np.divide(current - previous, previous, out=growth, where=valid)
+    return growth
 
 
 def _group_components(
@@ -1225,29 +1602,59 @@ def _group_components(
     group_by: str,
     *,
     length_bin_size: int,
-) -> dict[str, list[GrowthComponent]]:
-    """Group components according to the requested strategy."""
-    groups: dict[str, list[GrowthComponent]] = defaultdict(list)
+    bins: IntArray | None = None,
+) -> dict[int, list[GrowthComponent]]:
+    """Group components by integer bin, returned in ascending bin order.
+
+    ``bins`` may supply precomputed bins aligned with ``components``.
+    """
+    if bins is None:
+        bins = _component_bins(components, group_by)
+
+    # A stable argsort keeps input order within each bin; np.unique yields bins ascending.
+    order = np.argsort(bins, kind="stable")
+    unique_bins, starts = np.unique(bins[order], return_index=True)
+    return {
+        value: [components[index] for index in members.tolist()]
+        for value, members in zip(unique_bins.tolist(), np.split(order, starts[1:]), strict=False)
+    }
+
+
+def _component_bins(components: list[GrowthComponent], group_by: str) -> IntArray:
+    """Return the integer group bin of each component."""
+    count = len(components)
     if group_by == "display-level":
-        for comp in components:
-            groups[str(comp.display_level)].append(comp)
-    elif group_by == "item-code-length":
-        for comp in components:
-            code = (comp.item_code or "").strip()
-            length = len(code)
-            label = f"{length} chars"
-            groups[label].append(comp)
-    else:
-        raise ValueError(f"Unsupported group_by value: {group_by}")
+        return np.fromiter((comp.display_level for comp in components), np.int64, count)
+    if group_by == "item-code-length":
+        return np.fromiter(
+            (len((comp.item_code or "").strip()) for comp in components), np.int64, count
+        )
+    raise ValueError(f"Unsupported group_by value: {group_by}")
 
-    def sort_key(item: tuple[str, list[GrowthComponent]]) -> tuple[int, str]:
-        label = item[0]
-        for token in label.split():
-            if token.isdigit():
-                return (int(token), label)
-        return (0, label)
 
-    return dict(sorted(groups.items(), key=sort_key))
+def _series_bins(dataset: Dataset, cache: ObservationCache, group_by: str) -> IntArray:
+    """Return the group bin of every cached series (-1 where metadata is missing)."""
+    bins = np.full(len(cache.series_ids), -1, dtype=np.int64)
+    for position, series_id in enumerate(cache.series_ids):
+        series = dataset.series.get(series_id)
+        if series is None:
+            continue
+        if group_by == "display-level":
+            item = dataset.items.get(series.item_code)
+            if item is not None:
+                bins[position] = item.display_level
+        elif group_by == "item-code-length":
+            bins[position] = len((series.item_code or "").strip())
+        else:
+            raise ValueError(f"Unsupported group_by value: {group_by}")
+    return bins
+
+
+def _group_label(group_by: str, value: int) -> str:
+    """Format an integer group bin as its printable label."""
+    if group_by == "item-code-length":
+        return f"{value} chars"
+    return str(value)
 
 
 def _should_skip_sample(
@@ -1274,6 +1681,11 @@ def _should_skip_sample(
     return skip_small_samples
 
 
+def _component_values(components: Sequence[GrowthComponent]) -> FloatArray:
+    """Return component growth values as a contiguous float64 array."""
+    return np.fromiter((comp.value for comp in components), np.float64, len(components))
+
+
 def _render_group_reports(
     base_dir: Path,
     label: str,
@@ -1282,18 +1694,21 @@ def _render_group_reports(
     """Generate plots and summary payloads for a component group."""
     group_dir = base_dir / f"group_{_sanitize_label(label)}"
     group_dir.mkdir(parents=True, exist_ok=True)
-    values = [comp.value for comp in components]
-    weights = [1.0] * len(components)
-    density_report = generate_density_plot(
-        values, weights, output_dir=group_dir, filename="density.png"
-    )
+    # Components are equally weighted, so no weight vector is passed; the histogram
+    # reuses the statistics computed for the density plot.
+    values = _component_values(components)
+    density_report = generate_density_plot(values, output_dir=group_dir, filename="density.png")
     histogram_report = generate_histogram_plot(
-        values, weights, output_dir=group_dir, filename="histogram.png"
+        values,
+        output_dir=group_dir,
+        filename="histogram.png",
+        statistics=density_report.statistics,
     )
     group_summary = _build_group_summary(label, components, stats=density_report.statistics)
     group_summary["density_plot"] = str(density_report.path.relative_to(base_dir))
     group_summary["histogram_plot"] = str(histogram_report.path.relative_to(base_dir))
-    (group_dir / "summary.json").write_text(json.dumps(group_summary, indent=2))
+    # Per-group files are machine-read; only the top-level summary.json is indented.
+    _write_json(group_dir / "summary.json", group_summary, pretty=False)
     return group_summary
 
 
@@ -1304,11 +1719,9 @@ def _build_group_summary(
     stats: StatSummary | None = None,
 ) -> dict[str, object]:
     """Create a JSON-friendly summary for a group of components."""
-    values = [comp.value for comp in components]
-    weights = [1.0] * len(components)
-    stats_obj = stats or compute_statistics(values, weights)
-    stats_payload = _stats_to_dict(stats_obj)
-    top_examples = sorted(components, key=lambda comp: abs(comp.value), reverse=True)[:5]
+    if stats is None:
+        stats = compute_statistics(_component_values(components))
+    stats_payload = _stats_to_dict(stats)
     examples = [
         {
             "series_id": comp.series_id,
@@ -1318,7 +1731,7 @@ def _build_group_summary(
             "yoy": comp.value,
             "yoy_percent": format_percent(comp.value),
         }
-        for comp in top_examples
+        for comp in _top_examples(components)
     ]
     return {
         "label": label,
@@ -1328,6 +1741,58 @@ def _build_group_summary(
     }
 
 
+def _top_examples(
+    components: Sequence[GrowthComponent], count: int = TOP_EXAMPLE_COUNT
+) -> list[GrowthComponent]:
+    """Return the ``count`` components with the largest absolute growth."""
+    return heapq.nlargest(count, components, key=lambda comp: abs(comp.value))
+
+
+def _summarize_group(job: tuple[str, list[GrowthComponent]]) -> dict[str, object]:
+    """Process-pool entry point wrapping :func:`_build_group_summary`."""
+    label, components = job
+    return _build_group_summary(label, components)
+
+
+def _map_group_summaries(
+    jobs: Sequence[tuple[str, list[GrowthComponent]]],
+    *,
+    workers: int,
+) -> list[dict[str, object]]:
+    """Summarize groups in order, fanning out across processes when there is enough work."""
+    return _process_map(_summarize_group, jobs, workers=workers)
+
+
+def _render_group_job(job: tuple[Path, str, list[GrowthComponent]]) -> dict[str, object]:
+    """Process-pool entry point wrapping :func:`_render_group_reports`."""
+    base_dir, label, components = job
+    return _render_group_reports(base_dir, label, components)
+
+
+def _use_agg_backend() -> None:
+    """Pin worker processes to the non-interactive matplotlib backend."""
+    import matplotlib
+
+    matplotlib.use("Agg")
+
+
+def _process_map(
+    func: Callable[[T], R],
+    jobs: Sequence[T],
+    *,
+    workers: int,
+    initializer: Callable[[], None] | None = None,
+) -> list[R]:
+    """Apply ``func`` to ``jobs`` in order, using a process pool when more than one worker helps."""
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    if workers <= 1:
+        return [func(job) for job in jobs]
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, initializer=initializer) as pool:
+        return list(pool.map(func, jobs, chunksize=chunksize))
+
+
+@functools.lru_cache(maxsize=256)
 def _parse_month(value: str) -> tuple[int, str, datetime]:
     """Convert YYYY-MM strings into (year, period_code, datetime) tuples."""
     try:
@@ -1343,14 +1808,12 @@ def _month_sequence(start: datetime, end: datetime) -> list[tuple[int, str, date
     if start > end:
         raise ValueError("start date must be before end date.")
     months: list[tuple[int, str, datetime]] = []
-    cursor = datetime(start.year, start.month, 1, tzinfo=start.tzinfo)
-    end_marker = datetime(end.year, end.month, 1, tzinfo=end.tzinfo)
-    while cursor <= end_marker:
-        months.append((cursor.year, f"M{cursor.month:02d}", cursor))
-        if cursor.month == 12:
-            cursor = datetime(cursor.year + 1, 1, 1, tzinfo=cursor.tzinfo)
-        else:
-            cursor = datetime(cursor.year, cursor.month + 1, 1, tzinfo=cursor.tzinfo)
+    # Walk an absolute month index so each step is integer arithmetic, not datetime math.
+    for index in range(start.year * 12 + start.month - 1, end.year * 12 + end.month):
+        year, month_zero = divmod(index, 12)
+        months.append(
+            (year, f"M{month_zero + 1:02d}", datetime(year, month_zero + 1, 1, tzinfo=start.tzinfo))
+        )
     return months
 
 
@@ -1374,9 +1837,13 @@ def _load_analysis_dataset(
     if source == "database":
         resolved_dsn = _require_dsn(ctx, None)
         resolved_schema = _resolve_schema(ctx, None)
-        dataset = _load_dataset_from_database(resolved_dsn, resolved_schema)
+        dataset = _load_dataset_from_database(ctx, resolved_dsn, resolved_schema)
     else:
-        dataset = _build_dataset(current_only=current_only, data_files=tuple(data_files) or None)
+        dataset = _build_dataset(
+            ctx,
+            current_only=current_only,
+            data_files=tuple(data_files) or None,
+        )
     cache = _build_observation_cache(dataset)
     return dataset, cache
 
@@ -1452,19 +1919,49 @@ def _flatten_timeseries_row(
     }
 
 
-def _write_csv(rows: list[dict[str, object]], path: Path) -> None:
-    """Write panel rows to CSV via pandas."""
-    import pandas as pd  # type: ignore
+def _write_csv(rows: ExportColumns, path: Path) -> None:
+    """Write panel rows to CSV with the stdlib writer (NaN/None become empty cells)."""
+    columns = [[_csv_cell(value) for value in column] for column in rows.columns.values()]
+    with path.open("w", newline="", encoding="utf-8", buffering=1 << 20) as handle:
+        writer = csv.writer(handle, lineterminator="\n")
+        writer.writerow(rows.columns)
+        writer.writerows(zip(*columns, strict=True))
+
+
+def _csv_cell(value: object) -> object:
+    """Blank out missing values the way ``DataFrame.to_csv`` does."""
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return ""
+    return value
 
-    df = pd.DataFrame(rows)
-    df.to_csv(path, index=False)
 
+def _write_parquet(rows: ExportColumns, path: Path) -> None:
+    """Write panel rows to parquet straight from Arrow columns."""
+    try:
+        import pyarrow as pa  # type: ignore
+        import pyarrow.parquet as pq  # type: ignore
+    except ImportError:  # pragma: no cover - optional deps
+        _write_parquet_with_pandas(rows, path)
+        return
+    schema = pa.schema(
+        [
+            (name, pa.type_for_alias(PARQUET_COLUMN_TYPES.get(name, "float64")))
+            for name in rows.columns
+        ]
+    )
+    pq.write_table(
+        pa.Table.from_pydict(rows.columns, schema=schema),
+        path,
+        compression="zstd",
+        use_dictionary=[name for name in rows.columns if name in PARQUET_DICTIONARY_COLUMNS],
+    )
 
-def _write_parquet(rows: list[dict[str, object]], path: Path) -> None:
-    """Write panel rows to parquet via pandas/pyarrow."""
+
+def _write_parquet_with_pandas(rows: ExportColumns, path: Path) -> None:
+    """Write panel rows to parquet through pandas (fastparquet fallback)."""
     import pandas as pd  # type: ignore
 
-    df = pd.DataFrame(rows)
+    df = pd.DataFrame(rows.columns)
     try:
         df.to_parquet(path, index=False)
     except (ImportError, ValueError) as exc:  # pragma: no cover - optional deps
@@ -1491,11 +1988,22 @@ def _stats_to_dict(stats: StatSummary) -> dict[str, object]:
     }
 
 
+class _LabelTranslation(dict[int, str]):
+    """``str.translate`` table mapping unsafe characters to ``_``, filled on first sight."""
+
+    def __missing__(self, codepoint: int) -> str:
+        char = chr(codepoint)
+        mapped = char if char.isalnum() or char in "-_" else "_"
+        self[codepoint] = mapped
+        return mapped
+
+
+_LABEL_TRANSLATION = _LabelTranslation()
+
+
 def _sanitize_label(label: str) -> str:
     """Return a filesystem-friendly version of the provided label."""
-    safe = [ch if ch.isalnum() or ch in {"-", "_"} else "_" for ch in label]
-    cleaned = "".join(safe).strip("_")
-    return cleaned or "group"
+    return label.translate(_LABEL_TRANSLATION).strip("_") or "group"
 
 
 if __name__ == "__main__":
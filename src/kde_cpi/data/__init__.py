@@ -1,10 +1,33 @@
-"""Top-level data module for CPI processing."""
+"""Top-level data module for CPI processing.
 
-from .client import CpiHttpClient
-from .ingest import CpiDatasetBuilder
-from .loader import CpiDatabaseLoader
-from .models import Area, Dataset, Footnote, Item, Observation, Period, Series
-from .pipeline import load_full_history, update_current_periods
+Re-exports are resolved on first access so importing the package does not pull in
+``requests`` or ``asyncpg`` until a client, loader, or pipeline is actually used.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .client import CpiHttpClient
+    from .ingest import CpiDatasetBuilder
+    from .loader import CpiDatabaseLoader
+    from .models import Area, Dataset, Footnote, Item, Observation, Period, Series
+    from .pipeline import load_full_history, update_current_periods
+
+_LAZY_EXPORTS = {
+    "Area": ".models",
+    "Dataset": ".models",
+    "Footnote": ".models",
+    "Item": ".models",
+    "Observation": ".models",
+    "Period": ".models",
+    "Series": ".models",
+    "CpiHttpClient": ".client",
+    "CpiDatasetBuilder": ".ingest",
+    "CpiDatabaseLoader": ".loader",
+    "load_full_history": ".pipeline",
+    "update_current_periods": ".pipeline",
+}
 
 __all__ = [
     "Area",
@@ -20,3 +43,18 @@ __all__ = [
     "load_full_history",
     "update_current_periods",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule that defines ``name`` and cache the export."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List lazy exports alongside the module's own attributes."""
+    return sorted({*globals(), *__all__})
@@ -1,27 +1,66 @@
 """HTTP client for retrieving CPI datasets from BLS."""
 
+import hashlib
+import json
+import os
+import tempfile
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, cast
 from urllib.parse import urljoin
 
 import requests
 import structlog
 from attrs import define, field
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 
 from .files import BASE_URL
 
 logger = structlog.get_logger(__name__)
 
+# Keep-alive connections to the BLS host; sized above the builder's fetch workers.
+HTTP_POOL_SIZE = 8
+
+
+def _default_session() -> requests.Session:
+    """Return a session that pools connections and retries transient gateway errors."""
+    retry = Retry(
+        total=5,
+        connect=2,
+        backoff_factor=0.5,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        # Hand the final response back so raise_for_status reports it as before.
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_SIZE, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
 
 @define(slots=True)
 class CpiHttpClient:
-    """Thin HTTP wrapper around the BLS CPI flat-file endpoints."""
+    """Thin HTTP wrapper around the BLS CPI flat-file endpoints.
+
+    With ``cache_dir`` set, ``get_text`` keeps each payload on disk and revalidates it with a
+    conditional GET, so unchanged files cost a 304 round trip instead of a download.
+    """
 
     base_url: str = BASE_URL
     timeout: float = 30.0
-    session: requests.Session = field(factory=requests.Session)
+    cache_dir: Path | None = None
+    session: requests.Session = field(factory=_default_session)
     headers: dict[str, str] = field(
         factory=lambda: {
             "User-Agent": "jacob.bourne@gmail.com",
             "Accept": "application/json,text/plain,*/*;q=0.1",
+            # requests only offers gzip/deflate; urllib3 also decodes br/zstd when installed.
+            "Accept-Encoding": ACCEPT_ENCODING,
         },
     )
 
@@ -30,16 +69,65 @@ class CpiHttpClient:
         url = urljoin(self.base_url, filename)
         log = logger.bind(filename=filename, url=url)
         log.debug("http.fetch_start", timeout=self.timeout)
+        entry = _cache_entry(self.cache_dir, url) if self.cache_dir is not None else None
+        cached = _read_cached(entry) if entry is not None else None
+        headers = self.headers
+        if cached is not None:
+            headers = {**headers, **_conditional_headers(cached[1])}
         try:
-            response = self.session.get(url, timeout=self.timeout, headers=self.headers)
+            response = self.session.get(url, timeout=self.timeout, headers=headers)
             response.raise_for_status()
         except requests.HTTPError as exc:
             status = exc.response.status_code if exc.response is not None else None
             log.error("http.fetch_failed", status=status, exc_info=True)
             raise
+        if cached is not None and response.status_code == 304:
+            log.debug("http.not_modified")
+            return cached[0]
         response.encoding = encoding
         log.debug("http.fetch_success", bytes=len(response.content))
-        return response.text
+        text = response.text
+        if entry is not None:
+            _write_cached(entry, text, response.headers)
+        return text
+
+    @contextmanager
+    def open_stream(self, filename: str) -> Iterator[IO[bytes]]:
+        """Open a remote CPI resource as a binary stream without buffering the whole body."""
+        url = urljoin(self.base_url, filename)
+        log = logger.bind(filename=filename, url=url)
+        log.debug("http.stream_start", timeout=self.timeout)
+        try:
+            response = self.session.get(
+                url, timeout=self.timeout, headers=self.headers, stream=True
+            )
+            response.raise_for_status()
+        except requests.HTTPError as exc:
+            status = exc.response.status_code if exc.response is not None else None
+            log.error("http.fetch_failed", status=status, exc_info=True)
+            raise
+        with response:
+            response.raw.decode_content = True
+            yield cast(IO[bytes], response.raw)
+        log.debug("http.stream_complete")
+
+    def get_validator(self, filename: str) -> str | None:
+        """Return an ETag/Last-Modified fingerprint for a resource without downloading it."""
+        url = urljoin(self.base_url, filename)
+        try:
+            response = self.session.head(
+                url, timeout=self.timeout, headers=self.headers, allow_redirects=True
+            )
+            response.raise_for_status()
+        except requests.RequestException:
+            logger.debug("http.head_failed", filename=filename, url=url, exc_info=True)
+            return None
+        etag = response.headers.get("ETag")
+        modified = response.headers.get("Last-Modified")
+        if not etag and not modified:
+            return None
+        length = response.headers.get("Content-Length", "")
+        return f"{etag or ''}|{modified or ''}|{length}"
 
     def close(self) -> None:
         """Release the underlying HTTP session."""
@@ -47,4 +135,50 @@ class CpiHttpClient:
         logger.debug("http.session_closed")
 
 
+def _cache_entry(cache_dir: Path, url: str) -> Path:
+    """Return the cache path stem for ``url``; the payload and validators sit beside it."""
+    return cache_dir / hashlib.blake2b(url.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _conditional_headers(validators: Mapping[str, str]) -> dict[str, str]:
+    """Translate stored validators into conditional request headers."""
+    headers: dict[str, str] = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+    return headers
+
+
+def _read_cached(entry: Path) -> tuple[str, dict[str, str]] | None:
+    """Return the cached payload and its validators, or None when absent or unreadable."""
+    try:
+        validators = json.loads(entry.with_suffix(".json").read_text(encoding="utf-8"))
+        text = entry.with_suffix(".txt").read_text(encoding="utf-8")
+    except (OSError, ValueError):
+        return None
+    return text, validators
+
+
+def _write_cached(entry: Path, text: str, response_headers: Mapping[str, str]) -> None:
+    """Store ``text`` with its ETag/Last-Modified validators; unversioned payloads are skipped."""
+    validators = {
+        "etag": response_headers.get("ETag") or "",
+        "last_modified": response_headers.get("Last-Modified") or "",
+    }
+    if not any(validators.values()):
+        return
+    try:
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        # Payload first: validators only ever describe a fully written payload.
+        for suffix, content in ((".txt", text), (".json", json.dumps(validators))):
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=entry.parent, suffix=".tmp", delete=False
+            ) as handle:
+                handle.write(content)
+            os.replace(handle.name, entry.with_suffix(suffix))
+    except OSError as exc:
+        logger.warning("http.cache_write_failed", path=str(entry), error=str(exc))
+
+
 __all__ = ["CpiHttpClient"]
@@ -1,6 +1,14 @@
 """Orchestration utilities for assembling CPI datasets from flat files."""
 
-from collections.abc import Iterable, Sequence
+import hashlib
+import os
+import pickle
+import tempfile
+from collections.abc import Collection, Iterable, Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TypeVar
 
 import structlog
 from attrs import define, field
@@ -8,88 +16,235 @@ from attrs import define, field
 from . import parser
 from .client import CpiHttpClient
 from .files import CURRENT_DATA_FILES, DATA_FILES, MAPPING_FILES, SERIES_FILE
-from .models import Dataset
+from .models import Dataset, Observation
 
 logger = structlog.get_logger(__name__)
 
+# Bump when model layouts change so stale pickles are never unpickled into new classes.
+SNAPSHOT_VERSION = 1
+
+# Upper bound on simultaneous requests to the BLS server.
+DEFAULT_FETCH_WORKERS = 6
+
+T = TypeVar("T")
+
 
 @define(slots=True)
 class CpiDatasetBuilder:
     """Coordinate retrieval and parsing of CPI datasets from BLS flat files."""
 
     client: CpiHttpClient = field(factory=CpiHttpClient)
+    cache_dir: Path | None = None
+    fetch_workers: int = DEFAULT_FETCH_WORKERS
+
+    def __attrs_post_init__(self) -> None:
+        """Let a default HTTP client revalidate downloads against the snapshot directory."""
+        if (
+            self.cache_dir is not None
+            and isinstance(self.client, CpiHttpClient)
+            and self.client.cache_dir is None
+        ):
+            self.client.cache_dir = self.cache_dir / "http"
+
+    def load_dataset(
+        self,
+        *,
+        data_files: Sequence[str] | None = None,
+        mappings: Collection[str] | None = None,
+    ) -> Dataset:
+        """Fetch mapping tables, series definitions, and observations into a dataset.
+
+        ``mappings`` restricts which mapping tables (``MAPPING_FILES`` keys) are fetched;
+        all of them by default. With ``cache_dir`` set, the parsed dataset is snapshotted to
+        disk keyed by the upstream ETag/Last-Modified headers and reused while those are
+        unchanged.
+        """
+        return self._load(data_files or DATA_FILES, mappings)
+
+    def load_current_observations(self, *, mappings: Collection[str] | None = None) -> Dataset:
+        """Load only the current-year data partition."""
+        return self.load_dataset(data_files=CURRENT_DATA_FILES, mappings=mappings)
 
-    def load_dataset(self, *, data_files: Sequence[str] | None = None) -> Dataset:
-        """Fetch mapping tables, series definitions, and observations into a dataset."""
+    def load_metadata(self) -> Dataset:
+        """Fetch mapping tables and series definitions without any observation partitions."""
+        return self._load(())
+
+    def _load(
+        self, files_to_fetch: Sequence[str], mappings: Collection[str] | None = None
+    ) -> Dataset:
+        """Build (or restore from snapshot) a dataset from ``files_to_fetch`` plus metadata."""
         dataset = Dataset()
-        files_to_fetch = data_files or DATA_FILES
-        log = logger.bind(data_files=list(files_to_fetch), builder="dataset")
+        selected = _select_mappings(mappings)
+        log = logger.bind(
+            data_files=list(files_to_fetch), mappings=list(selected), builder="dataset"
+        )
         log.info("builder.load_start")
-
-        # Load mapping tables first so downstream consumers can resolve codes.
-        dataset = self._populate_mappings(dataset)
-        dataset = self._populate_series(dataset)
-        dataset = self._populate_observations(dataset, files_to_fetch)
+        snapshot = (
+            self._snapshot_path(files_to_fetch, selected) if self.cache_dir is not None else None
+        )
+        if snapshot is not None:
+            cached = _read_snapshot(snapshot)
+            if cached is not None:
+                log.info("builder.snapshot_hit", path=str(snapshot))
+                return cached
+
+        # Downloads overlap, but results are consumed in request order: mapping tables first
+        # so downstream consumers can resolve codes, then series, then observation partitions.
+        with self._fetch_pool(len(selected) + 1 + len(files_to_fetch)) as pool:
+            texts = [
+                pool.submit(self.client.get_text, name)
+                for name in (*selected.values(), SERIES_FILE)
+            ]
+            partitions = [pool.submit(self._fetch_observations, name) for name in files_to_fetch]
+            dataset = self._populate_mappings(dataset, _results(texts[:-1]), selected)
+            dataset = self._populate_series(dataset, texts[-1].result())
+            dataset = self._populate_observations(
+                dataset, zip(files_to_fetch, _results(partitions), strict=True)
+            )
         log.info(
             "builder.load_complete",
             series=len(dataset.series),
             observations=len(dataset.observations),
         )
+        if snapshot is not None:
+            _write_snapshot(snapshot, dataset)
         return dataset
 
-    def load_current_observations(self) -> Dataset:
-        """Load only the current-year data partition."""
-        return self.load_dataset(data_files=CURRENT_DATA_FILES)
-
-    def _populate_mappings(self, dataset: Dataset) -> Dataset:
-        """Fetch and attach mapping tables (areas, items, periods, footnotes)."""
-        for key, filename in MAPPING_FILES.items():
+    def _populate_mappings(
+        self, dataset: Dataset, texts: Iterator[str], mappings: dict[str, str]
+    ) -> Dataset:
+        """Attach the ``mappings`` tables (areas, items, periods, footnotes) from their payloads."""
+        for key, filename in mappings.items():
             log = logger.bind(mapping=key, filename=filename)
             log.debug("builder.mappings_fetch")
-            text = self.client.get_text(filename)
+            text = next(texts)
             added = 0
             if key == "areas":
-                for area in parser.parse_areas(text):
-                    dataset.add_area(area)
-                    added += 1
+                areas = parser.parse_areas(text)
+                dataset.extend_areas(areas)
+                added = len(areas)
             elif key == "items":
-                for item in parser.parse_items(text):
-                    dataset.add_item(item)
-                    added += 1
+                items = parser.parse_items(text)
+                dataset.extend_items(items)
+                added = len(items)
             elif key == "periods":
-                for period in parser.parse_periods(text):
-                    dataset.add_period(period)
-                    added += 1
+                periods = parser.parse_periods(text)
+                dataset.extend_periods(periods)
+                added = len(periods)
             elif key == "footnotes":
-                for footnote in parser.parse_footnotes(text):
-                    dataset.add_footnote(footnote)
-                    added += 1
+                footnotes = parser.parse_footnotes(text)
+                dataset.extend_footnotes(footnotes)
+                added = len(footnotes)
             log.debug("builder.mappings_loaded", count=added)
         return dataset
 
-    def _populate_series(self, dataset: Dataset) -> Dataset:
-        """Fetch and attach the CPI series metadata table."""
-        series_text = self.client.get_text(SERIES_FILE)
-        for series in parser.parse_series(series_text):
-            dataset.add_series(series)
+    def _populate_series(self, dataset: Dataset, series_text: str) -> Dataset:
+        """Attach the CPI series metadata table."""
+        dataset.extend_series(parser.parse_series(series_text))
         logger.debug("builder.series_loaded", count=len(dataset.series))
         return dataset
 
-    def _populate_observations(self, dataset: Dataset, files_to_fetch: Iterable[str]) -> Dataset:
-        """Fetch observation partitions and append them to the dataset."""
-        for filename in files_to_fetch:
-            file_log = logger.bind(filename=filename)
-            file_log.debug("builder.observations_fetch")
-            text = self.client.get_text(filename)
-            observations = parser.parse_observations(text)
-            dataset.extend_observations(observations)
-            file_log.debug("builder.observations_loaded", count=len(observations))
+    def _populate_observations(
+        self, dataset: Dataset, partitions: Iterable[tuple[str, list[Observation]]]
+    ) -> Dataset:
+        """Append parsed ``(filename, observations)`` partitions to the dataset."""
+        extend = dataset.extend_observations
+        for filename, observations in partitions:
+            extend(observations)
+            logger.debug("builder.observations_loaded", filename=filename, count=len(observations))
         return dataset
 
+    def _fetch_observations(self, filename: str) -> list[Observation]:
+        """Stream one observation partition straight into the parser."""
+        logger.debug("builder.observations_fetch", filename=filename)
+        with self.client.open_stream(filename) as stream:
+            return parser.parse_observations(stream)
+
+    def _snapshot_path(
+        self, files_to_fetch: Sequence[str], mappings: dict[str, str]
+    ) -> Path | None:
+        """Return the snapshot file for ``files_to_fetch`` if every upstream file is versioned."""
+        if self.cache_dir is None:
+            return None
+        names = [*mappings.values(), SERIES_FILE, *files_to_fetch]
+        with self._fetch_pool(len(names)) as pool:
+            validators = [
+                validator
+                for validator in pool.map(self.client.get_validator, names)
+                if validator is not None
+            ]
+        if len(validators) != len(names):
+            return None
+        files_digest = hashlib.sha256("\n".join(names).encode("utf-8")).hexdigest()[:16]
+        content_digest = hashlib.sha256("\n".join(validators).encode("utf-8")).hexdigest()[:16]
+        filename = f"dataset-v{SNAPSHOT_VERSION}-{files_digest}-{content_digest}.pickle"
+        return self.cache_dir / filename
+
+    @contextmanager
+    def _fetch_pool(self, jobs: int) -> Iterator[ThreadPoolExecutor]:
+        """Yield a thread pool for ``jobs`` downloads, cancelling leftovers on error."""
+        # Requests are I/O bound and release the GIL; the client's pool keeps HTTP_POOL_SIZE open.
+        workers = max(1, min(self.fetch_workers, jobs))
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="cpi-fetch")
+        try:
+            yield pool
+        finally:
+            pool.shutdown(cancel_futures=True)
+
     def close(self) -> None:
         """Close the underlying HTTP client."""
         self.client.close()
         logger.debug("builder.client_closed")
 
 
+def _select_mappings(mappings: Collection[str] | None) -> dict[str, str]:
+    """Return the requested subset of ``MAPPING_FILES``, keeping its order."""
+    if mappings is None:
+        return dict(MAPPING_FILES)
+    unknown = set(mappings) - MAPPING_FILES.keys()
+    if unknown:
+        raise ValueError(f"Unknown mapping tables: {', '.join(sorted(unknown))}")
+    return {key: filename for key, filename in MAPPING_FILES.items() if key in mappings}
+
+
+def _results(futures: Iterable[Future[T]]) -> Iterator[T]:
+    """Yield future results in submission order."""
+    for future in futures:
+        yield future.result()
+
+
+def _read_snapshot(path: Path) -> Dataset | None:
+    """Load a cached dataset snapshot, ignoring missing or unreadable files."""
+    try:
+        with path.open("rb") as handle:
+            dataset = pickle.load(handle)  # noqa: S301 - written by _write_snapshot
+    except FileNotFoundError:
+        return None
+    except (OSError, pickle.UnpicklingError, AttributeError, EOFError, TypeError) as exc:
+        logger.warning("builder.snapshot_unreadable", path=str(path), error=str(exc))
+        return None
+    return dataset if isinstance(dataset, Dataset) else None
+
+
+def _write_snapshot(path: Path, dataset: Dataset) -> None:
+    """Atomically persist a dataset snapshot and drop superseded ones for the same files."""
+    temp_name: str | None = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=path.parent, suffix=".tmp", delete=False) as handle:
+            temp_name = handle.name
+            pickle.dump(dataset, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_name, path)
+        prefix = path.name.rsplit("-", 1)[0]
+        for stale in path.parent.glob(f"{prefix}-*.pickle"):
+            if stale != path:
+                stale.unlink(missing_ok=True)
+    except OSError as exc:
+        if temp_name is not None:
+            Path(temp_name).unlink(missing_ok=True)
+        logger.warning("builder.snapshot_write_failed", path=str(path), error=str(exc))
+        return
+    logger.debug("builder.snapshot_written", path=str(path))
+
+
 __all__ = ["CpiDatasetBuilder"]
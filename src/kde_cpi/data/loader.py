@@ -1,6 +1,7 @@
 """Async PostgreSQL integration for CPI datasets."""
 
-from collections.abc import Iterable, Sequence
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import chain, islice
 from typing import Any
 
 import asyncpg
@@ -8,6 +9,29 @@ from attrs import define, field
 
 from .models import Area, Dataset, Footnote, Item, Observation, Period, Series
 
+# Rows sent per COPY command; bounds how many record tuples are materialized at once.
+OBSERVATION_COPY_BATCH = 50_000
+OBSERVATION_COLUMNS = ["series_id", "year", "period", "value", "footnotes"]
+OBSERVATION_KEY = ["series_id", "year", "period"]
+AREA_COLUMNS = ["area_code", "area_name"]
+ITEM_COLUMNS = ["item_code", "item_name", "display_level", "selectable", "sort_sequence"]
+PERIOD_COLUMNS = ["period_code", "period_abbr", "period_name"]
+FOOTNOTE_COLUMNS = ["footnote_code", "footnote_text"]
+SERIES_COLUMNS = [
+    "series_id",
+    "series_title",
+    "area_code",
+    "item_code",
+    "seasonal",
+    "periodicity_code",
+    "base_code",
+    "base_period",
+    "begin_year",
+    "begin_period",
+    "end_year",
+    "end_period",
+]
+
 
 @define(slots=True)
 class CpiDatabaseLoader:
@@ -17,6 +41,7 @@ class CpiDatabaseLoader:
     schema: str = "public"
     connection_kwargs: dict[str, Any] = field(factory=dict)
     _connection: asyncpg.Connection | None = field(default=None, init=False, repr=False)
+    _schema_ready: bool = field(default=False, init=False, repr=False)
 
     async def connect(self, **overrides: Any) -> asyncpg.Connection:
         """Establish (or reuse) the async connection."""
@@ -35,9 +60,15 @@ class CpiDatabaseLoader:
         if self._connection is not None:
             await self._connection.close()
             self._connection = None
+            self._schema_ready = False
 
     async def ensure_schema(self) -> None:
-        """Create the CPI tables if they do not already exist."""
+        """Create the CPI tables if they do not already exist.
+
+        The DDL goes out as one multi-statement query, and only once per open connection.
+        """
+        if self._schema_ready:
+            return
         conn = await self.connect()
         qualified = self._qualifier
         statements = [
@@ -113,29 +144,84 @@ class CpiDatabaseLoader:
             );
             """,
         ]
-        for statement in statements:
-            await conn.execute(statement)
+        # Without arguments asyncpg uses the simple-query protocol, which runs the whole
+        # script in one round trip and one implicit transaction.
+        await conn.execute("".join(statements))
+        self._schema_ready = True
 
     async def bulk_load(self, dataset: Dataset, *, truncate: bool = True) -> None:
-        """Copy the full dataset into PostgreSQL, optionally truncating first."""
+        """Copy the full dataset into PostgreSQL, optionally truncating first.
+
+        Without ``truncate`` the rows are merged: metadata is upserted and
+        observations are copied into a staging table and upserted from there.
+        """
         conn = await self.connect()
         await self.ensure_schema()
         async with conn.transaction():
-            if truncate:
-                truncate_sql = (
-                    "TRUNCATE TABLE "
-                    f"{self._qualified('cpi_observation')}, "
-                    f"{self._qualified('cpi_series')}, "
-                    f"{self._qualified('cpi_footnote')}, "
-                    f"{self._qualified('cpi_period')}, "
-                    f"{self._qualified('cpi_item')}, "
-                    f"{self._qualified('cpi_area')} "
-                    "RESTART IDENTITY"
-                )
-                await conn.execute(truncate_sql)
+            # The load is one transaction that is simply re-run on failure, so
+            # skip waiting for the WAL flush at commit.
+            await conn.execute("SET LOCAL synchronous_commit = off")
+            if not truncate:
+                await self.sync_metadata(dataset)
+                await self._merge_observations(conn, dataset)
+                return
+            truncate_sql = (
+                "TRUNCATE TABLE "
+                f"{self._qualified('cpi_observation')}, "
+                f"{self._qualified('cpi_series')}, "
+                f"{self._qualified('cpi_footnote')}, "
+                f"{self._qualified('cpi_period')}, "
+                f"{self._qualified('cpi_item')}, "
+                f"{self._qualified('cpi_area')} "
+                "RESTART IDENTITY"
+            )
+            await conn.execute(truncate_sql)
             await self._copy_mapping_tables(conn, dataset)
             await self._copy_series(conn, dataset)
+            # Building the key and checking the foreign key once over the loaded table is far
+            # cheaper than maintaining both row by row during the COPY.
+            observation_table = self._qualified("cpi_observation")
+            constraints = await self._deferrable_constraints(conn, observation_table)
+            if constraints:
+                drops = ", ".join(
+                    f"DROP CONSTRAINT {_quote_ident(row['conname'])}" for row in constraints
+                )
+                await conn.execute(f"ALTER TABLE {observation_table} {drops};")
             await self._copy_observations(conn, dataset)
+            if constraints:
+                adds = ", ".join(
+                    f"ADD CONSTRAINT {_quote_ident(row['conname'])} {row['definition']}"
+                    for row in reversed(constraints)
+                )
+                await conn.execute(f"ALTER TABLE {observation_table} {adds};")
+
+    async def _deferrable_constraints(
+        self, conn: asyncpg.Connection, table: str
+    ) -> list[asyncpg.Record]:
+        """Return ``table``'s key and foreign keys (foreign keys first) with their definitions.
+
+        Names and definitions come from the catalog, so renamed constraints are rebuilt as
+        they were. A primary key that other tables reference is left in place.
+        """
+        rows: list[asyncpg.Record] = await conn.fetch(
+            """
+            SELECT c.conname, pg_get_constraintdef(c.oid) AS definition
+            FROM pg_constraint AS c
+            WHERE c.conrelid = $1::regclass
+              AND (
+                  c.contype = 'f'
+                  OR (
+                      c.contype = 'p'
+                      AND NOT EXISTS (
+                          SELECT 1 FROM pg_constraint AS r WHERE r.confrelid = c.conrelid
+                      )
+                  )
+              )
+            ORDER BY c.contype, c.conname
+            """,
+            table,
+        )
+        return rows
 
     async def sync_metadata(self, dataset: Dataset) -> None:
         """Upsert mapping tables and series definitions without touching observations."""
@@ -261,79 +347,62 @@ class CpiDatabaseLoader:
                     footnotes=footnote_str,
                 )
             )
-        dataset.extend_observations(observations)
+        # The (series_id, year, period) primary key already guarantees uniqueness.
+        dataset.extend_observations(observations, assume_unique=True)
         return dataset
 
+    async def copy_observations(
+        self, observations: Iterable[Observation], *, batch_size: int = OBSERVATION_COPY_BATCH
+    ) -> int:
+        """COPY observations into ``cpi_observation`` in batches and return the row count."""
+        conn = await self.connect()
+        return await self._copy_observation_batches(
+            conn, "cpi_observation", observations, schema_name=self.schema, batch_size=batch_size
+        )
+
     async def upsert_observations(self, observations: Iterable[Observation]) -> None:
-        """Upsert one or more observation rows."""
+        """Upsert one or more observation rows through a COPY-fed staging table."""
         conn = await self.connect()
-        observations = list(observations)
-        if not observations:
+        records = _observation_records(observations)
+        first = next(records, None)
+        if first is None:
             return
-        query = f"""  # noqa: S608
-        INSERT INTO {self._qualified("cpi_observation")} (series_id, year, period, value, footnotes)
-        VALUES ($1, $2, $3, $4, $5)
-        ON CONFLICT (series_id, year, period)
-        DO UPDATE SET value = EXCLUDED.value,
-                      footnotes = EXCLUDED.footnotes;
-        """
-        args = [
-            (
-                obs.series_id,
-                obs.year,
-                obs.period,
-                None if obs.value.is_nan() else obs.value,
-                list(obs.footnotes) or None,
-            )
-            for obs in observations
-        ]
-        await conn.executemany(query, args)
+        await self._copy_upsert(
+            conn,
+            "cpi_observation",
+            OBSERVATION_COLUMNS,
+            OBSERVATION_KEY,
+            chain((first,), records),
+        )
 
     async def _copy_mapping_tables(self, conn: asyncpg.Connection, dataset: Dataset) -> None:
         """Bulk copy area, item, period, and footnote records."""
         if dataset.areas:
             await conn.copy_records_to_table(
                 "cpi_area",
-                records=[(area.code, area.name) for area in dataset.areas.values()],
-                columns=["area_code", "area_name"],
+                records=list(_area_records(dataset.areas.values())),
+                columns=AREA_COLUMNS,
                 schema_name=self.schema,
             )
         if dataset.items:
             await conn.copy_records_to_table(
                 "cpi_item",
-                records=[
-                    (
-                        item.code,
-                        item.name,
-                        item.display_level,
-                        item.selectable,
-                        item.sort_sequence,
-                    )
-                    for item in dataset.items.values()
-                ],
-                columns=[
-                    "item_code",
-                    "item_name",
-                    "display_level",
-                    "selectable",
-                    "sort_sequence",
-                ],
+                records=list(_item_records(dataset.items.values())),
+                columns=ITEM_COLUMNS,
                 schema_name=self.schema,
             )
         if dataset.periods:
             await conn.copy_records_to_table(
                 "cpi_period",
-                records=[
-                    (period.code, period.abbr, period.name) for period in dataset.periods.values()
-                ],
-                columns=["period_code", "period_abbr", "period_name"],
+                records=list(_period_records(dataset.periods.values())),
+                columns=PERIOD_COLUMNS,
                 schema_name=self.schema,
             )
         if dataset.footnotes:
             await conn.copy_records_to_table(
                 "cpi_footnote",
-                records=[(footnote.code, footnote.text) for footnote in dataset.footnotes.values()],
-                columns=["footnote_code", "footnote_text"],
+                records=list(_footnote_records(dataset.footnotes.values())),
+                columns=FOOTNOTE_COLUMNS,
                 schema_name=self.schema,
             )
 
@@ -342,171 +411,126 @@ class CpiDatabaseLoader:
         if dataset.series:
             await conn.copy_records_to_table(
                 "cpi_series",
-                records=[
-                    (
-                        series.series_id,
-                        series.series_title,
-                        series.area_code,
-                        series.item_code,
-                        series.seasonal,
-                        series.periodicity_code,
-                        series.base_code,
-                        series.base_period,
-                        series.begin_year,
-                        series.begin_period,
-                        series.end_year,
-                        series.end_period,
-                    )
-                    for series in dataset.series.values()
-                ],
-                columns=[
-                    "series_id",
-                    "series_title",
-                    "area_code",
-                    "item_code",
-                    "seasonal",
-                    "periodicity_code",
-                    "base_code",
-                    "base_period",
-                    "begin_year",
-                    "begin_period",
-                    "end_year",
-                    "end_period",
-                ],
+                records=list(_series_records(dataset.series.values())),
+                columns=SERIES_COLUMNS,
                 schema_name=self.schema,
             )
 
     async def _copy_observations(self, conn: asyncpg.Connection, dataset: Dataset) -> None:
         """Bulk copy observation facts into the database."""
-        if dataset.observations:
-            await conn.copy_records_to_table(
-                "cpi_observation",
-                records=[
-                    (
-                        obs.series_id,
-                        obs.year,
-                        obs.period,
-                        None if obs.value.is_nan() else obs.value,
-                        list(obs.footnotes) or None,
-                    )
-                    for obs in dataset.observations
-                ],
-                columns=["series_id", "year", "period", "value", "footnotes"],
-                schema_name=self.schema,
+        await self._copy_observation_batches(
+            conn, "cpi_observation", dataset.observations, schema_name=self.schema
+        )
+
+    async def _merge_observations(self, conn: asyncpg.Connection, dataset: Dataset) -> None:
+        """COPY observations into a staging table and upsert them in one statement."""
+        if not dataset.observations:
+            return
+        await self._copy_upsert(
+            conn,
+            "cpi_observation",
+            OBSERVATION_COLUMNS,
+            OBSERVATION_KEY,
+            _observation_records(dataset.observations),
+        )
+
+    async def _copy_observation_batches(
+        self,
+        conn: asyncpg.Connection,
+        table: str,
+        observations: Iterable[Observation],
+        *,
+        schema_name: str | None = None,
+        batch_size: int = OBSERVATION_COPY_BATCH,
+    ) -> int:
+        """Issue one COPY per ``batch_size`` observations into ``table``."""
+        return await _copy_record_batches(
+            conn,
+            table,
+            OBSERVATION_COLUMNS,
+            _observation_records(observations),
+            schema_name=schema_name,
+            batch_size=batch_size,
+        )
+
+    async def _copy_upsert(
+        self,
+        conn: asyncpg.Connection,
+        table: str,
+        columns: Sequence[str],
+        key: Sequence[str],
+        records: Iterable[tuple[Any, ...]],
+    ) -> None:
+        """COPY ``records`` into a temp copy of ``table`` and upsert them in one statement.
+
+        Non-key ``columns`` are overwritten on conflict, but only for rows whose values
+        actually changed; the staging table is dropped before returning so several upserts
+        can share one enclosing transaction. When ``records`` repeats a key the last row
+        wins: the freshly COPY-filled staging table keeps input order in ``ctid``.
+        """
+        staging = f"{table}_staging"
+        column_list = ", ".join(columns)
+        key_list = ", ".join(key)
+        updated = [column for column in columns if column not in key]
+        assignments = ", ".join(f"{column} = EXCLUDED.{column}" for column in updated)
+        current = ", ".join(f"target.{column}" for column in updated)
+        incoming = ", ".join(f"EXCLUDED.{column}" for column in updated)
+        async with conn.transaction():
+            await conn.execute(
+                f"""
+                CREATE TEMP TABLE {staging}
+                    (LIKE {self._qualified(table)} INCLUDING DEFAULTS)
+                    ON COMMIT DROP;
+                """
             )
+            await _copy_record_batches(conn, staging, columns, records)
+            await conn.execute(
+                f"""
+                INSERT INTO {self._qualified(table)} AS target ({column_list})
+                SELECT DISTINCT ON ({key_list}) {column_list} FROM {staging}
+                ORDER BY {key_list}, ctid DESC
+                ON CONFLICT ({key_list})
+                DO UPDATE SET {assignments}
+                WHERE ({current}) IS DISTINCT FROM ({incoming});
+                """
+            )
+            await conn.execute(f"DROP TABLE {staging}")
 
     async def _upsert_areas(self, conn: asyncpg.Connection, areas: Sequence) -> None:
         """Upsert area dimension records."""
         if not areas:
             return
-        query = f"""  # noqa: S608
-        INSERT INTO {self._qualified("cpi_area")} (area_code, area_name)
-        VALUES ($1, $2)
-        ON CONFLICT (area_code) DO UPDATE SET area_name = EXCLUDED.area_name;
-        """
-        await conn.executemany(query, [(area.code, area.name) for area in areas])
+        await self._copy_upsert(conn, "cpi_area", AREA_COLUMNS, ["area_code"], _area_records(areas))
 
     async def _upsert_items(self, conn: asyncpg.Connection, items: Sequence) -> None:
         """Upsert item dimension records."""
         if not items:
             return
-        query = f"""  # noqa: S608
-        INSERT INTO {self._qualified("cpi_item")} (
-            item_code,
-            item_name,
-            display_level,
-            selectable,
-            sort_sequence
-        )
-        VALUES ($1, $2, $3, $4, $5)
-        ON CONFLICT (item_code) DO UPDATE SET
-            item_name = EXCLUDED.item_name,
-            display_level = EXCLUDED.display_level,
-            selectable = EXCLUDED.selectable,
-            sort_sequence = EXCLUDED.sort_sequence;
-        """
-        await conn.executemany(
-            query,
-            [
-                (
-                    item.code,
-                    item.name,
-                    item.display_level,
-                    item.selectable,
-                    item.sort_sequence,
-                )
-                for item in items
-            ],
-        )
+        await self._copy_upsert(conn, "cpi_item", ITEM_COLUMNS, ["item_code"], _item_records(items))
 
     async def _upsert_periods(self, conn: asyncpg.Connection, periods: Sequence) -> None:
         """Upsert period dimension records."""
         if not periods:
             return
-        query = f"""  # noqa: S608
-        INSERT INTO {self._qualified("cpi_period")} (period_code, period_abbr, period_name)
-        VALUES ($1, $2, $3)
-        ON CONFLICT (period_code)
-        DO UPDATE SET period_abbr = EXCLUDED.period_abbr,
-                      period_name = EXCLUDED.period_name;
-        """
-        await conn.executemany(
-            query, [(period.code, period.abbr, period.name) for period in periods]
+        await self._copy_upsert(
+            conn, "cpi_period", PERIOD_COLUMNS, ["period_code"], _period_records(periods)
         )
 
     async def _upsert_footnotes(self, conn: asyncpg.Connection, footnotes: Sequence) -> None:
         """Upsert footnote dimension records."""
         if not footnotes:
             return
-        query = f"""  # noqa: S608
-        INSERT INTO {self._qualified("cpi_footnote")} (footnote_code, footnote_text)
-        VALUES ($1, $2)
-        ON CONFLICT (footnote_code) DO UPDATE SET footnote_text = EXCLUDED.footnote_text;
-        """
-        await conn.executemany(query, [(footnote.code, footnote.text) for footnote in footnotes])
+        await self._copy_upsert(
+            conn, "cpi_footnote", FOOTNOTE_COLUMNS, ["footnote_code"], _footnote_records(footnotes)
+        )
 
     async def _upsert_series(self, conn: asyncpg.Connection, series_list: Sequence[Series]) -> None:
         """Upsert series dimension records."""
         if not series_list:
             return
-        query = f"""  # noqa: S608
-        INSERT INTO {self._qualified("cpi_series")}
-            (
-                series_id, series_title, area_code, item_code, seasonal, periodicity_code,
-                base_code, base_period, begin_year, begin_period, end_year, end_period
-            )
-        VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12)
-        ON CONFLICT (series_id) DO UPDATE SET
-            series_title = EXCLUDED.series_title,
-            area_code = EXCLUDED.area_code,
-            item_code = EXCLUDED.item_code,
-            seasonal = EXCLUDED.seasonal,
-            periodicity_code = EXCLUDED.periodicity_code,
-            base_code = EXCLUDED.base_code,
-            base_period = EXCLUDED.base_period,
-            begin_year = EXCLUDED.begin_year,
-            begin_period = EXCLUDED.begin_period,
-            end_year = EXCLUDED.end_year,
-            end_period = EXCLUDED.end_period;
-        """
-        args = [
-            (
-                series.series_id,
-                series.series_title,
-                series.area_code,
-                series.item_code,
-                series.seasonal,
-                series.periodicity_code,
-                series.base_code,
-                series.base_period,
-                series.begin_year,
-                series.begin_period,
-                series.end_year,
-                series.end_period,
-            )
-            for series in series_list
-        ]
-        await conn.executemany(query, args)
+        await self._copy_upsert(
+            conn, "cpi_series", SERIES_COLUMNS, ["series_id"], _series_records(series_list)
+        )
 
     def _qualified(self, table: str) -> str:
         """Return a schema-qualified table name."""
@@ -517,4 +541,91 @@ class CpiDatabaseLoader:
         return self._qualified(table)
 
 
+async def _copy_record_batches(
+    conn: asyncpg.Connection,
+    table: str,
+    columns: Sequence[str],
+    records: Iterable[tuple[Any, ...]],
+    *,
+    schema_name: str | None = None,
+    batch_size: int = OBSERVATION_COPY_BATCH,
+) -> int:
+    """Issue one COPY per ``batch_size`` records into ``table`` and return the row count."""
+    records = iter(records)
+    copied = 0
+    while batch := list(islice(records, batch_size)):
+        await conn.copy_records_to_table(
+            table, records=batch, columns=list(columns), schema_name=schema_name
+        )
+        copied += len(batch)
+    return copied
+
+
+def _area_records(areas: Iterable[Area]) -> Iterator[tuple[Any, ...]]:
+    """Shape areas as records for :data:`AREA_COLUMNS`."""
+    return ((area.code, area.name) for area in areas)
+
+
+def _item_records(items: Iterable[Item]) -> Iterator[tuple[Any, ...]]:
+    """Shape items as records for :data:`ITEM_COLUMNS`."""
+    return (
+        (item.code, item.name, item.display_level, item.selectable, item.sort_sequence)
+        for item in items
+    )
+
+
+def _period_records(periods: Iterable[Period]) -> Iterator[tuple[Any, ...]]:
+    """Shape periods as records for :data:`PERIOD_COLUMNS`."""
+    return ((period.code, period.abbr, period.name) for period in periods)
+
+
+def _footnote_records(footnotes: Iterable[Footnote]) -> Iterator[tuple[Any, ...]]:
+    """Shape footnotes as records for :data:`FOOTNOTE_COLUMNS`."""
+    return ((footnote.code, footnote.text) for footnote in footnotes)
+
+
+def _series_records(series_list: Iterable[Series]) -> Iterator[tuple[Any, ...]]:
+    """Shape series definitions as records for :data:`SERIES_COLUMNS`."""
+    return (
+        (
+            series.series_id,
+            series.series_title,
+            series.area_code,
+            series.item_code,
+            series.seasonal,
+            series.periodicity_code,
+            series.base_code,
+            series.base_period,
+            series.begin_year,
+            series.begin_period,
+            series.end_year,
+            series.end_period,
+        )
+        for series in series_list
+    )
+
+
+def _quote_ident(name: str) -> str:
+    """Quote a catalog identifier for interpolation into DDL."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _observation_records(observations: Iterable[Observation]) -> Iterator[tuple[Any, ...]]:
+    """Lazily shape observations as COPY records for the ``cpi_observation`` columns.
+
+    asyncpg encodes a top-level tuple as an array, so the shared footnote tuples are
+    passed through rather than copied into a list per row.
+    """
+    return (
+        (
+            obs.series_id,
+            obs.year,
+            obs.period,
+            None if obs.value.is_nan() else obs.value,
+            obs.footnotes or None,
+        )
+        for obs in observations
+    )
+
+
 __all__ = ["CpiDatabaseLoader"]
@@ -1,11 +1,13 @@
 """Domain models for BLS Consumer Price Index (CU) survey flat files."""
 
-from collections.abc import Iterable
+import functools
+import re
+import sys
+from collections.abc import Iterable, Iterator
 from decimal import Decimal, InvalidOperation
 from typing import Any
 
-import marshmallow as ma
-from attrs import asdict as attrs_asdict, define, field
+from attrs import define, field, fields
 
 
 def _strip(value: str) -> str:
@@ -13,26 +15,19 @@ def _strip(value: str) -> str:
     return value.strip()
 
 
+def _strip_intern(value: str) -> str:
+    """Trim a low-cardinality code and intern it so repeats share one string."""
+    return sys.intern(value.strip())
+
+
 @define(slots=True, frozen=True)
 class Area:
     """Geographic area metadata from the CPI area lookup table."""
 
-    code: str = field(converter=_strip)
+    code: str = field(converter=_strip_intern)
     name: str = field(converter=_strip)
 
 
-class AreaSchema(ma.Schema):
-    """Marshmallow schema for serializing :class:`Area`."""
-
-    code = ma.fields.Str(required=True)
-    name = ma.fields.Str(required=True)
-
-    @ma.post_load
-    def make_area(self, data: dict[str, str], **kwargs: object) -> Area:
-        """Convert validated payloads into :class:`Area` objects."""
-        return Area(**data)
-
-
 def _to_bool(value: str) -> bool:
     """Normalize BLS truthy strings (T, Y, 1) into booleans."""
     if isinstance(value, bool):
@@ -44,25 +39,13 @@ def _to_bool(value: str) -> bool:
 class Item:
     """Item metadata describing CPI product groupings."""
 
-    code: str = field(converter=_strip)
+    code: str = field(converter=_strip_intern)
     name: str = field(converter=_strip)
     display_level: int = field(converter=int)
     selectable: bool = field(converter=_to_bool)
     sort_sequence: int = field(converter=int)
 
 
-class ItemSchema(ma.Schema):
-    """Marshmallow schema for :class:`Item` records."""
-
-    code = ma.fields.Str(required=True)
-    name = ma.fields.Str(required=True)
-
-    @ma.post_load
-    def make_item(self, data: dict[str, str], **kwargs: object) -> Item:
-        """Instantiate :class:`Item` from validated row data."""
-        return Item(**data)
-
-
 @define(slots=True, frozen=True)
 class Period:
     """Period metadata describing CPI reporting intervals."""
@@ -72,19 +55,6 @@ class Period:
     name: str = field(converter=_strip)
 
 
-class PeriodSchema(ma.Schema):
-    """Marshmallow schema for :class:`Period`."""
-
-    code = ma.fields.Str(required=True)
-    abbr = ma.fields.Str(required=True)
-    name = ma.fields.Str(required=True)
-
-    @ma.post_load
-    def make_period(self, data: dict[str, str], **kwargs: object) -> Period:
-        """Instantiate :class:`Period` objects from parsed data."""
-        return Period(**data)
-
-
 @define(slots=True, frozen=True)
 class Footnote:
     """Footnote reference associated with CPI observations."""
@@ -93,33 +63,21 @@ class Footnote:
     text: str = field(converter=_strip)
 
 
-class FootnoteSchema(ma.Schema):
-    """Marshmallow schema for :class:`Footnote`."""
-
-    code = ma.fields.Str(required=True)
-    text = ma.fields.Str(required=True)
-
-    @ma.post_load
-    def make_footnote(self, data: dict[str, str], **kwargs: object) -> Footnote:
-        """Instantiate :class:`Footnote` records."""
-        return Footnote(**data)
-
-
 @define(slots=True, frozen=True, kw_only=True)
 class Series:
     """Metadata describing a CPI series and its structural attributes."""
 
-    series_id: str = field(converter=_strip, kw_only=False)
-    area_code: str = field(converter=_strip, kw_only=False)
-    item_code: str = field(converter=_strip, kw_only=False)
-    seasonal: str = field(converter=_strip, kw_only=False)
-    periodicity_code: str = field(converter=_strip, kw_only=False)
-    base_code: str = field(converter=_strip, kw_only=False)
-    base_period: str = field(converter=_strip, kw_only=False)
+    series_id: str = field(converter=_strip_intern, kw_only=False)
+    area_code: str = field(converter=_strip_intern, kw_only=False)
+    item_code: str = field(converter=_strip_intern, kw_only=False)
+    seasonal: str = field(converter=_strip_intern, kw_only=False)
+    periodicity_code: str = field(converter=_strip_intern, kw_only=False)
+    base_code: str = field(converter=_strip_intern, kw_only=False)
+    base_period: str = field(converter=_strip_intern, kw_only=False)
     begin_year: int = field(converter=int, kw_only=False)
-    begin_period: str = field(converter=_strip, kw_only=False)
+    begin_period: str = field(converter=_strip_intern, kw_only=False)
     end_year: int = field(converter=int, kw_only=False)
-    end_period: str = field(converter=_strip, kw_only=False)
+    end_period: str = field(converter=_strip_intern, kw_only=False)
     series_title: str = field(converter=_strip, default="")
 
     def is_seasonally_adjusted(self) -> bool:
@@ -127,40 +85,42 @@ class Series:
         return self.seasonal.upper() == "S"
 
 
-class SeriesSchema(ma.Schema):
-    """Marshmallow schema for :class:`Series`."""
+# Footnote codes may be a comma-separated list or contain whitespace.
+_split_footnotes = re.compile(r"[\s,]+").split
 
-    series_id = ma.fields.Str(required=True)
-    series_title = ma.fields.Str(required=False, allow_none=True, load_default="", dump_default="")
-    area_code = ma.fields.Str(required=True)
-    item_code = ma.fields.Str(required=True)
-    seasonal = ma.fields.Str(required=True)
-    periodicity_code = ma.fields.Str(required=True)
-    base_code = ma.fields.Str(required=True)
-    base_period = ma.fields.Str(required=True)
-    begin_year = ma.fields.Int(required=True)
-    begin_period = ma.fields.Str(required=True)
-    end_year = ma.fields.Int(required=True)
-    end_period = ma.fields.Str(required=True)
 
-    @ma.post_load
-    def make_series(self, data: dict[str, str], **kwargs: object) -> Series:
-        """Instantiate :class:`Series` from validated payloads."""
-        return Series(**data)
+@functools.lru_cache(maxsize=256)
+def _parse_footnotes(value: str) -> tuple[str, ...]:
+    """Split a raw footnote field; the few distinct fields share one tuple each."""
+    value = value.strip()
+    if not value:
+        return ()
+    return tuple(token for token in _split_footnotes(value) if token)
 
 
 def _footnote_tuple(value: str) -> tuple[str, ...]:
     """Parse footnote codes into a normalized tuple."""
-    value = value.strip()
-    if not value:
-        return ()
-    # Footnote codes may be a comma-separated list or contain whitespace.
-    tokens = [token.strip() for token in value.replace(",", " ").split()]
-    return tuple(token for token in tokens if token)
+    return _parse_footnotes(value)
 
 
-def _decimal(value: str) -> Decimal:
-    """Convert raw observation strings into :class:`Decimal` values."""
+# Observation years span roughly a century; caching ``int`` shares one object per year.
+_cached_int = functools.lru_cache(maxsize=1024)(int)
+
+
+def _year(value: str | int) -> int:
+    """Convert years, sharing one int object per distinct year across observations."""
+    return _cached_int(value)
+
+
+def _period_code(value: str) -> str:
+    """Normalize period codes to upper case and intern the shared instances."""
+    return sys.intern(value.strip().upper())
+
+
+# Index levels repeat heavily across series and months, and Decimals are immutable.
+@functools.lru_cache(maxsize=8192)
+def _parse_decimal(value: str) -> Decimal:
+    """Parse one raw observation value, sharing the result across equal strings."""
     value = value.strip()
     if not value:
         return Decimal("NaN")
@@ -170,40 +130,30 @@ def _decimal(value: str) -> Decimal:
         raise ValueError(f"Cannot parse decimal value from {value!r}") from exc
 
 
-@define(slots=True, frozen=True)
+def _decimal(value: str) -> Decimal:
+    """Convert raw observation strings into :class:`Decimal` values."""
+    return _parse_decimal(value)
+
+
+# Observations are the only model held by the million; nothing weak-references them.
+@define(slots=True, frozen=True, weakref_slot=False)
 class Observation:
     """Single CPI observation value tied to a series and period."""
 
-    series_id: str = field(converter=_strip)
-    year: int = field(converter=int)
-    period: str = field(converter=_strip)
+    series_id: str = field(converter=_strip_intern)
+    year: int = field(converter=_year)
+    period: str = field(converter=_period_code)
     value: Decimal = field(converter=_decimal)
     footnotes: tuple[str, ...] = field(converter=_footnote_tuple, factory=tuple)
 
     def is_annual(self) -> bool:
         """Return True when the observation corresponds to annual data."""
-        return self.period.upper().startswith("M13") or self.period.upper().startswith("R13")
+        return self.period.startswith(("M13", "R13"))
 
 
-class ObservationSchema(ma.Schema):
-    """Marshmallow schema for :class:`Observation`."""
-
-    series_id = ma.fields.Str(required=True)
-    year = ma.fields.Int(required=True)
-    period = ma.fields.Str(required=True)
-    value = ma.fields.Str(required=True)
-    footnotes = ma.fields.Str(required=False, allow_none=True)
-
-    @ma.post_load
-    def make_observation(self, data: dict[str, str], **kwargs: object) -> Observation:
-        """Instantiate :class:`Observation` with normalized payloads."""
-        return Observation(
-            series_id=data["series_id"],
-            year=data["year"],
-            period=data["period"],
-            value=data["value"],
-            footnotes=data.get("footnotes", ""),
-        )
+def _record_dict(record: Any) -> dict[str, object]:
+    """Shallow :func:`attrs.asdict` for the flat mapping models, without its recursion."""
+    return {attribute.name: getattr(record, attribute.name) for attribute in fields(type(record))}
 
 
 @define(slots=True)
@@ -216,22 +166,35 @@ class Dataset:
     footnotes: dict[str, Footnote] = field(factory=dict)
     series: dict[str, Series] = field(factory=dict)
     observations: list[Observation] = field(factory=list)
-    _observation_keys: set[tuple[str, int, str]] = field(factory=set, init=False, repr=False)
+    # ``None`` means the index is stale and is rebuilt on the next de-duplicating extend.
+    _observation_keys: set[tuple[str, int, str]] | None = field(factory=set, init=False, repr=False)
 
     def __attrs_post_init__(self) -> None:
         """Populate the observation de-duplication index."""
         if not self.observations:
             return
+        self._observation_keys = seen = set()
         unique: list[Observation] = []
         for obs in self.observations:
             key = (obs.series_id, obs.year, obs.period)
-            if key in self._observation_keys:
+            if key in seen:
                 continue
-            self._observation_keys.add(key)
+            seen.add(key)
             unique.append(obs)
         if len(unique) != len(self.observations):
             self.observations = unique
 
+    def __getstate__(self) -> dict[str, Any]:
+        """Pickle without the de-duplication index, which is rebuilt only if needed."""
+        state = _record_dict(self)
+        state["_observation_keys"] = None
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore pickled attributes, including snapshots that still carry the index."""
+        for name, value in state.items():
+            setattr(self, name, value)
+
     def add_area(self, area: Area) -> None:
         """Insert or update an area in the dataset."""
         self.areas[area.code] = area
@@ -252,54 +215,98 @@ class Dataset:
         """Insert or update a series metadata record."""
         self.series[series.series_id] = series
 
-    def extend_observations(self, observations: Iterable[Observation]) -> None:
-        """Append observation records to the dataset, dropping duplicates."""
+    def extend_areas(self, areas: Iterable[Area]) -> None:
+        """Insert or update many areas at once."""
+        self.areas.update((area.code, area) for area in areas)
+
+    def extend_items(self, items: Iterable[Item]) -> None:
+        """Insert or update many items at once."""
+        self.items.update((item.code, item) for item in items)
+
+    def extend_periods(self, periods: Iterable[Period]) -> None:
+        """Insert or update many period definitions at once."""
+        self.periods.update((period.code, period) for period in periods)
+
+    def extend_footnotes(self, footnotes: Iterable[Footnote]) -> None:
+        """Insert or update many footnote definitions at once."""
+        self.footnotes.update((footnote.code, footnote) for footnote in footnotes)
+
+    def extend_series(self, series: Iterable[Series]) -> None:
+        """Insert or update many series metadata records at once."""
+        self.series.update((record.series_id, record) for record in series)
+
+    def extend_observations(
+        self, observations: Iterable[Observation], *, assume_unique: bool = False
+    ) -> None:
+        """Append observation records to the dataset, dropping duplicates.
+
+        With ``assume_unique`` the caller guarantees no (series, year, period) key repeats,
+        within ``observations`` or against rows already held (e.g. rows read back under the
+        table's primary key), so the per-row index update is skipped.
+        """
+        if assume_unique:
+            self.observations.extend(observations)
+            self._observation_keys = None
+            return
+        seen = self._observation_keys
+        if seen is None:
+            seen = {(obs.series_id, obs.year, obs.period) for obs in self.observations}
+            self._observation_keys = seen
+        # Bound methods hoisted out of the loop; this runs once per observation row.
+        mark_seen = seen.add
+        append = self.observations.append
         for obs in observations:
             key = (obs.series_id, obs.year, obs.period)
-            if key in self._observation_keys:
-                continue
-            self._observation_keys.add(key)
-            self.observations.append(obs)
-
-    def to_dict(self) -> dict[str, object]:
-        """Return a JSON-friendly representation of the dataset."""
-        return {
-            "areas": [attrs_asdict(area) for area in self.areas.values()],
-            "items": [attrs_asdict(item) for item in self.items.values()],
-            "periods": [attrs_asdict(period) for period in self.periods.values()],
-            "footnotes": [attrs_asdict(footnote) for footnote in self.footnotes.values()],
-            "series": [attrs_asdict(series) for series in self.series.values()],
-            "observations": [
-                {
-                    "series_id": obs.series_id,
-                    "year": obs.year,
-                    "period": obs.period,
-                    "value": str(obs.value),
-                    "footnotes": list(obs.footnotes),
-                }
-                for obs in self.observations
-            ],
+            if key not in seen:
+                mark_seen(key)
+                append(obs)
+
+    def to_dict(self, *, observations: bool = True) -> dict[str, object]:
+        """Return a JSON-friendly representation of the dataset.
+
+        With ``observations`` off the key is left out so callers can stream
+        :meth:`iter_observation_dicts` instead of building the whole list.
+        """
+        payload: dict[str, object] = {
+            "areas": [_record_dict(area) for area in self.areas.values()],
+            "items": [_record_dict(item) for item in self.items.values()],
+            "periods": [_record_dict(period) for period in self.periods.values()],
+            "footnotes": [_record_dict(footnote) for footnote in self.footnotes.values()],
+            "series": [_record_dict(series) for series in self.series.values()],
         }
+        if observations:
+            payload["observations"] = list(self.iter_observation_dicts())
+        return payload
 
-
-class DatasetSchema(ma.Schema):
-    """Marshmallow schema for serializing :class:`Dataset` collections."""
-
-    areas = ma.fields.List(ma.fields.Nested(AreaSchema), required=True)
-    items = ma.fields.List(ma.fields.Nested(ItemSchema), required=True)
-    periods = ma.fields.List(ma.fields.Nested(PeriodSchema), required=True)
-    footnotes = ma.fields.List(ma.fields.Nested(FootnoteSchema), required=True)
-    series = ma.fields.List(ma.fields.Nested(SeriesSchema), required=True)
-    observations = ma.fields.List(ma.fields.Nested(ObservationSchema), required=True)
-
-    @ma.post_load
-    def make_dataset(self, data: dict[str, Any], **kwargs: object) -> Dataset:
-        """Instantiate :class:`Dataset` objects from validated payloads."""
-        return Dataset(
-            areas={area.code: area for area in data["areas"]},
-            items={item.code: item for item in data["items"]},
-            periods={period.code: period for period in data["periods"]},
-            footnotes={footnote.code: footnote for footnote in data["footnotes"]},
-            series={series.series_id: series for series in data["series"]},
-            observations=data["observations"],
-        )
+    def iter_observation_dicts(self) -> Iterator[dict[str, object]]:
+        """Yield the JSON-friendly form of each observation in load order."""
+        for obs in self.observations:
+            yield {
+                "series_id": obs.series_id,
+                "year": obs.year,
+                "period": obs.period,
+                "value": str(obs.value),
+                "footnotes": list(obs.footnotes),
+            }
+
+
+_SCHEMA_NAMES = frozenset(
+    {
+        "AreaSchema",
+        "ItemSchema",
+        "PeriodSchema",
+        "FootnoteSchema",
+        "SeriesSchema",
+        "ObservationSchema",
+        "DatasetSchema",
+    }
+)
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve schemas from :mod:`.schemas`, their old home, on first access."""
+    if name not in _SCHEMA_NAMES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from . import schemas
+
+    return getattr(schemas, name)
@@ -3,6 +3,7 @@
 import csv
 import io
 from collections.abc import Iterable
+from typing import IO
 
 from .models import Area, Footnote, Item, Observation, Period, Series
 
@@ -88,17 +89,52 @@ def parse_series(text: str) -> list[Series]:
     return result
 
 
-def parse_observations(text: str) -> list[Observation]:
-    """Parse CPI observation records from the data files."""
-    observations: list[Observation] = []
-    for row in _read_tsv(text):
-        observations.append(
-            Observation(
-                series_id=row["series_id"],
-                year=row["year"],
-                period=row["period"],
-                value=row["value"],
-                footnotes=row.get("footnote_codes", ""),
-            )
+def _read_tsv_columns(source: str | IO[bytes]) -> dict[str, list[str]]:
+    """Read a tab-separated payload (text or UTF-8 byte stream) column-wise into string lists.
+
+    Leading whitespace is dropped by the tokenizer; trailing padding is left for the model
+    converters, which strip every field anyway.
+    """
+    import pandas as pd  # type: ignore
+
+    buffer = io.StringIO(source) if isinstance(source, str) else source
+    try:
+        frame = pd.read_csv(
+            buffer,
+            sep="\t",
+            dtype=str,
+            na_filter=False,
+            skipinitialspace=True,
+            encoding="utf-8",
         )
-    return observations
+    except pd.errors.EmptyDataError:
+        return {}
+    frame.columns = [_normalize_key(key) for key in frame.columns]
+    # Skip bogus blank lines that may appear at EOF.
+    frame = frame[frame.ne("").any(axis=1)]
+    return {key: frame[key].tolist() for key in frame.columns}
+
+
+def parse_observations(source: str | IO[bytes]) -> list[Observation]:
+    """Parse CPI observation records from the data files.
+
+    ``source`` may be the decoded text or a byte stream, which is tokenized incrementally
+    by pandas' C parser without materializing the whole partition as a string.
+    """
+    columns = _read_tsv_columns(source)
+    if not columns:
+        return []
+    series_ids = columns["series_id"]
+    footnotes = columns.get("footnote_codes") or [""] * len(series_ids)
+    return [
+        Observation(
+            series_id=series_id,
+            year=year,
+            period=period,
+            value=value,
+            footnotes=footnote_codes,
+        )
+        for series_id, year, period, value, footnote_codes in zip(
+            series_ids, columns["year"], columns["period"], columns["value"], footnotes, strict=True
+        )
+    ]
@@ -1,6 +1,6 @@
 """High level orchestration helpers for CPI ingestion."""
 
-from collections.abc import Sequence
+from collections.abc import Collection, Sequence
 
 import structlog
 
@@ -10,6 +10,9 @@ from .models import Dataset
 
 logger = structlog.get_logger(__name__)
 
+# Series rows reference areas and items; periods and footnotes are left as loaded.
+CURRENT_UPDATE_MAPPINGS = frozenset({"areas", "items"})
+
 
 async def load_full_history(
     dsn: str,
@@ -17,25 +20,36 @@ async def load_full_history(
     schema: str = "public",
     truncate: bool = True,
     data_files: Sequence[str] | None = None,
+    loader: CpiDatabaseLoader | None = None,
+    builder: CpiDatasetBuilder | None = None,
 ) -> Dataset:
-    """Load the full CPI history and write it into the database."""
+    """Load the full CPI history and write it into the database.
+
+    A caller-supplied ``loader`` or ``builder`` is used as-is and left open for reuse.
+    """
     pipe_log = logger.bind(operation="load_full_history", schema=schema)
     pipe_log.info(
         "pipeline.full_history_start",
         truncate=truncate,
         data_files=list(data_files) if data_files else None,
     )
-    builder = CpiDatasetBuilder()
-    try:
+    if builder is not None:
         dataset = builder.load_dataset(data_files=data_files)
-    finally:
-        builder.close()
+    else:
+        builder = CpiDatasetBuilder()
+        try:
+            dataset = builder.load_dataset(data_files=data_files)
+        finally:
+            builder.close()
 
-    loader = CpiDatabaseLoader(dsn=dsn, schema=schema)
-    try:
+    if loader is not None:
         await loader.bulk_load(dataset, truncate=truncate)
-    finally:
-        await loader.close()
+    else:
+        loader = CpiDatabaseLoader(dsn=dsn, schema=schema)
+        try:
+            await loader.bulk_load(dataset, truncate=truncate)
+        finally:
+            await loader.close()
     pipe_log.info(
         "pipeline.full_history_complete",
         series=len(dataset.series),
@@ -44,21 +58,38 @@ async def load_full_history(
     return dataset
 
 
-async def update_current_periods(dsn: str, *, schema: str = "public") -> Dataset:
-    """Refresh the current-year CPI data without truncating history."""
+async def update_current_periods(
+    dsn: str,
+    *,
+    schema: str = "public",
+    loader: CpiDatabaseLoader | None = None,
+    mappings: Collection[str] = CURRENT_UPDATE_MAPPINGS,
+    builder: CpiDatasetBuilder | None = None,
+) -> Dataset:
+    """Refresh the current-year CPI data without truncating history.
+
+    Only the ``mappings`` tables are re-fetched and upserted; the others keep their rows.
+    A caller-supplied ``loader`` or ``builder`` is used as-is and left open for reuse.
+    """
     pipe_log = logger.bind(operation="update_current", schema=schema)
-    pipe_log.info("pipeline.current_start")
-    builder = CpiDatasetBuilder()
-    try:
-        dataset = builder.load_current_observations()
-    finally:
-        builder.close()
+    pipe_log.info("pipeline.current_start", mappings=sorted(mappings))
+    if builder is not None:
+        dataset = builder.load_current_observations(mappings=mappings)
+    else:
+        builder = CpiDatasetBuilder()
+        try:
+            dataset = builder.load_current_observations(mappings=mappings)
+        finally:
+            builder.close()
 
-    loader = CpiDatabaseLoader(dsn=dsn, schema=schema)
-    try:
+    if loader is not None:
         await loader.merge_dataset(dataset)
-    finally:
-        await loader.close()
+    else:
+        loader = CpiDatabaseLoader(dsn=dsn, schema=schema)
+        try:
+            await loader.merge_dataset(dataset)
+        finally:
+            await loader.close()
     pipe_log.info(
         "pipeline.current_complete",
         series=len(dataset.series),
@@ -67,4 +98,4 @@ async def update_current_periods(dsn: str, *, schema: str = "public") -> Dataset
     return dataset
 
 
-__all__ = ["load_full_history", "update_current_periods"]
+__all__ = ["CURRENT_UPDATE_MAPPINGS", "load_full_history", "update_current_periods"]
@@ -0,0 +1,137 @@
+"""Marshmallow schemas for the CPI domain models.
+
+Kept apart from :mod:`kde_cpi.data.models` so flat-file ingest and database loads,
+which build the attrs models directly, never import marshmallow.
+"""
+
+from typing import Any
+
+import marshmallow as ma
+
+from .models import Area, Dataset, Footnote, Item, Observation, Period, Series
+
+
+class AreaSchema(ma.Schema):
+    """Marshmallow schema for serializing :class:`Area`."""
+
+    code = ma.fields.Str(required=True)
+    name = ma.fields.Str(required=True)
+
+    @ma.post_load
+    def make_area(self, data: dict[str, str], **kwargs: object) -> Area:
+        """Convert validated payloads into :class:`Area` objects."""
+        return Area(**data)
+
+
+class ItemSchema(ma.Schema):
+    """Marshmallow schema for :class:`Item` records."""
+
+    code = ma.fields.Str(required=True)
+    name = ma.fields.Str(required=True)
+
+    @ma.post_load
+    def make_item(self, data: dict[str, str], **kwargs: object) -> Item:
+        """Instantiate :class:`Item` from validated row data."""
+        return Item(**data)
+
+
+class PeriodSchema(ma.Schema):
+    """Marshmallow schema for :class:`Period`."""
+
+    code = ma.fields.Str(required=True)
+    abbr = ma.fields.Str(required=True)
+    name = ma.fields.Str(required=True)
+
+    @ma.post_load
+    def make_period(self, data: dict[str, str], **kwargs: object) -> Period:
+        """Instantiate :class:`Period` objects from parsed data."""
+        return Period(**data)
+
+
+class FootnoteSchema(ma.Schema):
+    """Marshmallow schema for :class:`Footnote`."""
+
+    code = ma.fields.Str(required=True)
+    text = ma.fields.Str(required=True)
+
+    @ma.post_load
+    def make_footnote(self, data: dict[str, str], **kwargs: object) -> Footnote:
+        """Instantiate :class:`Footnote` records."""
+        return Footnote(**data)
+
+
+class SeriesSchema(ma.Schema):
+    """Marshmallow schema for :class:`Series`."""
+
+    series_id = ma.fields.Str(required=True)
+    series_title = ma.fields.Str(required=False, allow_none=True, load_default="", dump_default="")
+    area_code = ma.fields.Str(required=True)
+    item_code = ma.fields.Str(required=True)
+    seasonal = ma.fields.Str(required=True)
+    periodicity_code = ma.fields.Str(required=True)
+    base_code = ma.fields.Str(required=True)
+    base_period = ma.fields.Str(required=True)
+    begin_year = ma.fields.Int(required=True)
+    begin_period = ma.fields.Str(required=True)
+    end_year = ma.fields.Int(required=True)
+    end_period = ma.fields.Str(required=True)
+
+    @ma.post_load
+    def make_series(self, data: dict[str, str], **kwargs: object) -> Series:
+        """Instantiate :class:`Series` from validated payloads."""
+        return Series(**data)
+
+
+class ObservationSchema(ma.Schema):
+    """Marshmallow schema for :class:`Observation`."""
+
+    series_id = ma.fields.Str(required=True)
+    year = ma.fields.Int(required=True)
+    period = ma.fields.Str(required=True)
+    value = ma.fields.Str(required=True)
+    footnotes = ma.fields.Str(required=False, allow_none=True)
+
+    @ma.post_load
+    def make_observation(self, data: dict[str, str], **kwargs: object) -> Observation:
+        """Instantiate :class:`Observation` with normalized payloads."""
+        return Observation(
+            series_id=data["series_id"],
+            year=data["year"],
+            period=data["period"],
+            value=data["value"],
+            footnotes=data.get("footnotes", ""),
+        )
+
+
+class DatasetSchema(ma.Schema):
+    """Marshmallow schema for serializing :class:`Dataset` collections."""
+
+    areas = ma.fields.List(ma.fields.Nested(AreaSchema), required=True)
+    items = ma.fields.List(ma.fields.Nested(ItemSchema), required=True)
+    periods = ma.fields.List(ma.fields.Nested(PeriodSchema), required=True)
+    footnotes = ma.fields.List(ma.fields.Nested(FootnoteSchema), required=True)
+    series = ma.fields.List(ma.fields.Nested(SeriesSchema), required=True)
+    observations = ma.fields.List(ma.fields.Nested(ObservationSchema), required=True)
+
+    @ma.post_load
+    def make_dataset(self, data: dict[str, Any], **kwargs: object) -> Dataset:
+        """Instantiate :class:`Dataset` objects from validated payloads."""
+        return Dataset(
+            areas={area.code: area for area in data["areas"]},
+            items={item.code: item for item in data["items"]},
+            periods={period.code: period for period in data["periods"]},
+            footnotes={footnote.code: footnote for footnote in data["footnotes"]},
+            series={series.series_id: series for series in data["series"]},
+            observations=data["observations"],
+        )
+
+
+__all__ = [
+    "AreaSchema",
+    "ItemSchema",
+    "PeriodSchema",
+    "FootnoteSchema",
+    "SeriesSchema",
+    "ObservationSchema",
+    "DatasetSchema",
+]
@@ -43,7 +43,10 @@ def configure_logging(
         renderer = structlog.dev.ConsoleRenderer()
 
     structlog.configure(
-        processors=[structlog.stdlib.filter_by_level] + shared_processors + [renderer],
+        processors=shared_processors + [renderer],
+        # Filtering wrappers replace methods below the threshold with no-ops at bind
+        # time, so suppressed calls never build an event dict or run processors.
+        wrapper_class=structlog.make_filtering_bound_logger(level_value),
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
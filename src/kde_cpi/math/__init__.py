@@ -5,6 +5,7 @@ from .stats import (  # noqa: F401
     compute_statistics,
     effective_sample_size,
     weighted_kde_bandwidth,
+    weighted_kde_density,
     weighted_kde_mode,
     weighted_kurtosis,
     weighted_mean,
@@ -25,5 +26,6 @@ __all__ = [
     "weighted_skewness",
     "weighted_kurtosis",
     "weighted_kde_bandwidth",
+    "weighted_kde_density",
     "weighted_kde_mode",
 ]
@@ -6,16 +6,16 @@ from dataclasses import dataclass
 import numpy as np
 from numpy.typing import ArrayLike
 
-from .utils import FloatArray, normalize_weights, sort_by_values, to_numpy
+from .utils import FloatArray, normalize_weights, resolve_weights, sort_by_values, to_numpy
 
 
 def _validate_inputs(
     values: ArrayLike,
-    weights: ArrayLike,
+    weights: ArrayLike | None,
 ) -> tuple[FloatArray, FloatArray]:
-    """Normalize inputs to aligned 1D arrays and validate shapes."""
+    """Normalize inputs to aligned 1D arrays and validate shapes (``None`` = equal weights)."""
     vals = to_numpy(values)
-    wts = normalize_weights(weights)
+    wts = resolve_weights(weights, vals.size)
     if vals.ndim != 1:
         raise ValueError("Values must be a 1D sequence.")
     if vals.shape != wts.shape:
@@ -127,10 +127,29 @@ def weighted_kde_bandwidth(values: ArrayLike, weights: ArrayLike) -> float:
     return float(0.9 * scale * ess ** (-1.0 / 5.0))
 
 
-def _gaussian_kernel(u: FloatArray) -> FloatArray:
-    """Evaluate the standard Gaussian kernel."""
-    kernel = np.exp(-0.5 * np.square(u), dtype=np.float64)
-    return kernel / math.sqrt(2.0 * math.pi)
+# Grid x value cells evaluated per block; bounds the KDE scratch buffer to ~8 MiB.
+KDE_BLOCK_CELLS = 1 << 20
+
+
+def weighted_kde_density(
+    values: FloatArray,
+    weights: FloatArray,
+    grid: FloatArray,
+    bandwidth: float,
+) -> FloatArray:
+    """Evaluate a weighted Gaussian KDE on ``grid`` in bounded-memory blocks."""
+    densities = np.empty(grid.size, dtype=np.float64)
+    step = max(1, KDE_BLOCK_CELLS // max(values.size, 1))
+    for start in range(0, grid.size, step):
+        block = grid[start : start + step, None] - values[None, :]
+        # Reuse one scratch block for the kernel and reduce it with a BLAS mat-vec.
+        block /= bandwidth
+        np.square(block, out=block)
+        block *= -0.5
+        np.exp(block, out=block)
+        densities[start : start + step] = block @ weights
+    densities /= bandwidth * math.sqrt(2.0 * math.pi)
+    return densities
 
 
 def weighted_kde_mode(
@@ -154,9 +173,7 @@ def weighted_kde_mode(
     support_max = vals.max() + extend * bandwidth
     grid = np.linspace(support_min, support_max, grid_points)
 
-    diffs = (grid[:, None] - vals[None, :]) / bandwidth
-    kernel_vals = _gaussian_kernel(diffs)
-    densities = (kernel_vals * wts).sum(axis=1) / bandwidth
+    densities = weighted_kde_density(vals, wts, grid, bandwidth)
 
     mode_index = int(np.argmax(densities))
     return float(grid[mode_index])
@@ -179,13 +196,16 @@ class StatSummary:
 
 def compute_statistics(
     values: ArrayLike,
-    weights: ArrayLike,
+    weights: ArrayLike | None = None,
     *,
     trim: float = 0.08,
     kde_bandwidth: float | None = None,
     grid_points: int = 2048,
 ) -> StatSummary:
-    """Compute a consistent set of weighted statistics for CPI components."""
+    """Compute a consistent set of weighted statistics for CPI components.
+
+    Omitting ``weights`` weights every component equally.
+    """
     vals, wts = _validate_inputs(values, weights)
     mean = weighted_mean(vals, wts)
     median = weighted_median(vals, wts)
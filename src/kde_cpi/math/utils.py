@@ -28,6 +28,15 @@ def normalize_weights(weights: NumericInput, *, ensure_positive: bool = True) ->
     return cast(FloatArray, arr / total)
 
 
+def resolve_weights(weights: NumericInput | None, size: int) -> FloatArray:
+    """Normalize ``weights``, treating ``None`` as equal weights over ``size`` values."""
+    if weights is not None:
+        return normalize_weights(weights)
+    if size <= 0:
+        raise ValueError("Weights must sum to a positive value.")
+    return np.full(size, 1.0 / size, dtype=np.float64)
+
+
 def sort_by_values(values: FloatArray, weights: FloatArray) -> tuple[FloatArray, FloatArray]:
     """Return values and weights sorted together by ascending values."""
     order = np.argsort(values)
@@ -5,16 +5,23 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-import matplotlib.pyplot as plt
 import numpy as np
-from matplotlib.ticker import PercentFormatter
 
 from ..math import (
     StatSummary,
     compute_statistics,
     weighted_kde_bandwidth,
+    weighted_kde_density,
 )
-from ..math.utils import normalize_weights, to_numpy
+from ..math.utils import resolve_weights, to_numpy
+
+
+def _pyplot() -> tuple[Any, Any]:
+    """Import matplotlib on first plot so CLI startup does not pay for it."""
+    import matplotlib.pyplot as plt
+    from matplotlib.ticker import PercentFormatter
+
+    return plt, PercentFormatter
 
 
 def _axis_limits(
@@ -118,15 +125,12 @@ def _evaluate_kde(
     support_min = values.min() - 3.0 * bandwidth
     support_max = values.max() + 3.0 * bandwidth
     grid = np.linspace(support_min, support_max, grid_points)
-    diffs = (grid[:, None] - values[None, :]) / bandwidth
-    kernel_vals = np.exp(-0.5 * diffs**2) / np.sqrt(2 * np.pi)
-    densities = (kernel_vals * weights).sum(axis=1) / bandwidth
-    return grid, densities
+    return grid, weighted_kde_density(values, weights, grid, bandwidth)
 
 
 def generate_density_plot(
     values: Iterable[float],
-    weights: Iterable[float],
+    weights: Iterable[float] | None = None,
     *,
     output_dir: str | Path = "out",
     filename: str = "density.png",
@@ -138,11 +142,12 @@ def generate_density_plot(
     out_dir.mkdir(parents=True, exist_ok=True)
 
     vals = to_numpy(values)
-    wts = normalize_weights(weights)
+    wts = resolve_weights(weights, vals.size)
     stats = compute_statistics(vals, wts)
     bandwidth = stats.weighted_kde_bandwidth
     grid, densities = _evaluate_kde(vals, wts, bandwidth=bandwidth)
 
+    plt, percent_formatter = _pyplot()
     fig, ax = plt.subplots(figsize=(11, 6))
     ax.plot(
         grid,
@@ -151,7 +156,7 @@ def generate_density_plot(
         linewidth=config.line_width,
         label="Weighted KDE",
     )
-    ax.xaxis.set_major_formatter(PercentFormatter(1))
+    ax.xaxis.set_major_formatter(percent_formatter(1))
     ax.set_title(config.title)
     ax.set_xlabel(config.xlabel)
     ax.set_ylabel(config.ylabel)
@@ -204,21 +209,26 @@ def generate_density_plot(
 
 def generate_histogram_plot(
     values: Iterable[float],
-    weights: Iterable[float],
+    weights: Iterable[float] | None = None,
     *,
     output_dir: str | Path = "out",
     filename: str = "histogram.png",
     config: HistogramPlotConfig | None = None,
+    statistics: StatSummary | None = None,
 ) -> PlotReport:
-    """Render a weighted histogram with key summary markers."""
+    """Render a weighted histogram with key summary markers.
+
+    Pass ``statistics`` already computed for the same inputs to skip recomputing them.
+    """
     config = config or HistogramPlotConfig()
     out_dir = Path(output_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
 
     vals = to_numpy(values)
-    wts = normalize_weights(weights)
-    stats = compute_statistics(vals, wts)
+    wts = resolve_weights(weights, vals.size)
+    stats = statistics or compute_statistics(vals, wts)
 
+    plt, percent_formatter = _pyplot()
     fig, ax = plt.subplots(figsize=(11, 6))
     ax.hist(
         vals,
@@ -228,7 +238,7 @@ def generate_histogram_plot(
         alpha=config.alpha,
         edgecolor="white",
     )
-    ax.xaxis.set_major_formatter(PercentFormatter(1))
+    ax.xaxis.set_major_formatter(percent_formatter(1))
     ax.set_title(config.title)
     ax.set_xlabel(config.xlabel)
     ax.set_ylabel(config.ylabel)
@@ -1,15 +1,23 @@
 # tests/test_cli_fast.py
+import asyncio
 import json
+import math
+import subprocess
+import sys
+import types
 from decimal import Decimal
 
+import numpy as np
+import pytest
 from click.testing import CliRunner
 from tests.conftest import FakeItem, FakeObs, FakeSeries
 
 import cli.main as cli_mod
+import kde_cpi.data as cpi_data
 
 
 def test_fetch_dataset_fast(monkeypatch, tmp_path, tiny_dataset):
-    monkeypatch.setattr(cli_mod, "_build_dataset", lambda **kw: tiny_dataset)
+    monkeypatch.setattr(cli_mod, "_build_dataset", lambda ctx, **kw: tiny_dataset)
     r = CliRunner().invoke(cli_mod.cli, ["fetch-dataset", "--output", str(tmp_path / "ds.json")])
     assert r.exit_code == 0
     data = json.loads((tmp_path / "ds.json").read_text())
@@ -101,18 +109,26 @@ def test_load_full_noop(monkeypatch, tiny_dataset):
     async def _fake_load(*a, **k):
         return tiny_dataset
 
-    monkeypatch.setattr(cli_mod, "load_full_history", lambda *a, **k: _fake_load())
+    monkeypatch.setattr(cpi_data, "load_full_history", lambda *a, **k: _fake_load())
     r = CliRunner().invoke(cli_mod.cli, ["load-full", "--dsn", "postgresql://u:p@h/db"])
     assert r.exit_code == 0
 
 
-def test_update_current_noop(monkeypatch, tiny_dataset):
+def test_update_current_noop(monkeypatch, tmp_path, tiny_dataset):
+    seen = {}
+
     async def _fake_update(*a, **k):
+        seen.update(k)
         return tiny_dataset
 
-    monkeypatch.setattr(cli_mod, "update_current_periods", lambda *a, **k: _fake_update())
-    r = CliRunner().invoke(cli_mod.cli, ["update-current", "--dsn", "postgresql://u:p@h/db"])
-    assert r.exit_code == 0
+    monkeypatch.setattr(cpi_data, "update_current_periods", lambda *a, **k: _fake_update(**k))
+    r = CliRunner().invoke(
+        cli_mod.cli,
+        ["--cache-dir", str(tmp_path), "update-current", "--dsn", "postgresql://u:p@h/db"],
+    )
+    assert r.exit_code == 0, r.output
+    # The invocation's cached builder is handed to the pipeline, so HTTP revalidation applies.
+    assert seen["builder"].cache_dir == tmp_path
 
 
 def test_ensure_schema_noop(monkeypatch):
@@ -126,11 +142,30 @@ def test_ensure_schema_noop(monkeypatch):
         def __init__(self, *a, **k):
             pass
 
-    monkeypatch.setattr(cli_mod, "CpiDatabaseLoader", FakeLoader)
+    monkeypatch.setattr(cpi_data, "CpiDatabaseLoader", FakeLoader)
     r = CliRunner().invoke(cli_mod.cli, ["ensure-schema", "--dsn", "postgresql://u:p@h/db"])
     assert r.exit_code == 0
 
 
+def test_database_loader_closed_with_context(monkeypatch):
+    events = []
+
+    class FakeLoader:
+        def __init__(self, *a, **k):
+            events.append("open")
+
+        async def ensure_schema(self):
+            events.append("ensure")
+
+        async def close(self):
+            events.append("close")
+
+    monkeypatch.setattr(cpi_data, "CpiDatabaseLoader", FakeLoader)
+    r = CliRunner().invoke(cli_mod.cli, ["ensure-schema", "--dsn", "postgresql://u:p@h/db"])
+    assert r.exit_code == 0, r.output
+    assert events == ["open", "ensure", "close"]
+
+
 def _build_multi_series_dataset():
     dataset = type("Dataset", (), {})()
     dataset.series = {
@@ -223,3 +258,274 @@ def test_compute_skip_small_samples(monkeypatch):
     assert payload["group_count"] == 0
     assert payload["skip_small_samples"] is True
     assert "Warning: Sample size 1 below minimum 5" in result.output
+
+
+def test_growth_components_pair_same_period_across_years():
+    dataset = _build_multi_series_dataset()
+    dataset.observations = [
+        FakeObs("S2", 2025, "M10", Decimal("220.0")),
+        FakeObs("S1", 2025, "M09", Decimal("105.0")),
+        FakeObs("S2", 2024, "M10", Decimal("200.0")),
+        FakeObs("S1", 2024, "M09", Decimal("100.0")),
+        FakeObs("S2", 2025, "M09", Decimal("210.0")),
+    ]
+    cache = cli_mod._build_observation_cache(dataset)
+    assert cache.periods == [(2024, "M09"), (2024, "M10"), (2025, "M09"), (2025, "M10")]
+
+    latest, _ = cli_mod._compute_growth_components(dataset, selectable_only=True, cache=cache)
+    assert [(c.series_id, c.period, round(c.value, 6)) for c in latest] == [
+        ("S2", "M10", 0.1),
+        ("S1", "M09", 0.05),
+    ]
+
+    september, _ = cli_mod._compute_growth_components(
+        dataset, selectable_only=True, target_period=(2025, "m09"), cache=cache
+    )
+    assert [c.series_id for c in september] == ["S1"]
+
+    missing, _ = cli_mod._compute_growth_components(
+        dataset, selectable_only=True, target_period=(2024, "M09"), cache=cache
+    )
+    assert missing == []
+
+
+def test_write_json_without_orjson(monkeypatch, tmp_path):
+    payload = {"label": "1", "values": [0.5, 1.25]}
+    monkeypatch.setattr(cli_mod, "orjson", None)
+    cli_mod._write_json(tmp_path / "out.json", payload)
+    assert json.loads((tmp_path / "out.json").read_text()) == payload
+    assert json.loads(cli_mod._dumps_json(payload)) == payload
+    cli_mod._write_json(tmp_path / "compact.json", payload, pretty=False)
+    assert "\n" not in (tmp_path / "compact.json").read_text()
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_writes_non_finite_floats_as_null(monkeypatch, tmp_path, use_orjson):
+    """NaN and infinities should serialize to null whether or not orjson is installed."""
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(cli_mod, "orjson", None)
+    payload = {"std": math.nan, "groups": [{"mean": math.inf}, (-math.inf, 1.5)]}
+    expected = {"std": None, "groups": [{"mean": None}, [None, 1.5]]}
+
+    assert json.loads(cli_mod._dumps_json(payload)) == expected
+    cli_mod._write_json(tmp_path / "out.json", payload, pretty=False)
+    assert json.loads((tmp_path / "out.json").read_text()) == expected
+
+
+def test_growth_panel_hand_computed_yoy():
+    dataset = _build_multi_series_dataset()
+    dataset.observations.append(FakeObs("S1", 2023, "M09", Decimal("80.0")))
+    cache = cli_mod._build_observation_cache(dataset)
+    periods = [(2023, "M09"), (2024, "M09"), (2025, "M09"), (2025, "M10")]
+
+    panel = cli_mod._compute_growth_panel(dataset, periods, selectable_only=True, cache=cache)
+
+    assert [len(components) for components in panel] == [0, 1, 2, 0]
+    (s1_2024,) = panel[1]
+    assert (s1_2024.series_id, s1_2024.year, s1_2024.period) == ("S1", 2024, "M09")
+    assert s1_2024.value == pytest.approx((100.0 - 80.0) / 80.0)
+    by_series = {component.series_id: component for component in panel[2]}
+    assert by_series["S1"].value == pytest.approx((105.0 - 100.0) / 100.0)
+    assert by_series["S2"].value == pytest.approx((210.0 - 200.0) / 200.0)
+    assert all((c.year, c.period) == (2025, "M09") for c in panel[2])
+
+
+def test_panel_parquet(monkeypatch, tmp_path, tiny_dataset):
+    pq = pytest.importorskip("pyarrow.parquet")
+    monkeypatch.setattr(
+        cli_mod,
+        "_load_analysis_dataset",
+        lambda *a, **k: (tiny_dataset, cli_mod._build_observation_cache(tiny_dataset)),
+    )
+    out = tmp_path / "panel.parquet"
+    r = CliRunner().invoke(
+        cli_mod.cli,
+        [
+            "panel",
+            "--start",
+            "2025-09",
+            "--end",
+            "2025-09",
+            "--source",
+            "flatfiles",
+            "--current-only",
+            "--export",
+            str(out),
+        ],
+    )
+    assert r.exit_code == 0, r.output
+    table = pq.read_table(out)
+    assert table.num_rows == 1
+    assert table.column("date").to_pylist() == ["2025-09"]
+    assert str(table.schema.field("count").type) == "int64"
+    assert str(table.schema.field("mode").type) == "double"
+    assert pq.ParquetFile(out).metadata.row_group(0).column(0).compression == "ZSTD"
+
+
+def test_map_group_summaries_process_pool_matches_serial():
+    def _component(series_id, value):
+        return cli_mod.GrowthComponent(
+            series_id=series_id,
+            item_code="AA",
+            item_name="Alpha item",
+            display_level=1,
+            series_title=series_id,
+            value=value,
+            year=2025,
+            period="M09",
+        )
+
+    jobs = [
+        (str(level), [_component(f"S{level}{i}", 0.01 * (i + level)) for i in range(6)])
+        for level in range(3)
+    ]
+    serial = cli_mod._map_group_summaries(jobs, workers=1)
+    pooled = cli_mod._map_group_summaries(jobs, workers=2)
+    assert pooled == serial
+    assert [summary["label"] for summary in pooled] == ["0", "1", "2"]
+
+
+@pytest.mark.parametrize("group_by", ["display-level", "item-code-length"])
+def test_series_bins_match_component_grouping(group_by):
+    dataset = _build_multi_series_dataset()
+    cache = cli_mod._build_observation_cache(dataset)
+    current_rows, growth = cli_mod._growth_panel_rows(
+        dataset, [(2025, "M09")], selectable_only=True, cache=cache
+    )
+    components = cli_mod._materialize_components(dataset, cache, current_rows[0], growth[0])
+    rows_present = current_rows[0][~np.isnan(growth[0])]
+    bins = cli_mod._series_bins(dataset, cache, group_by)[cache.series_of(rows_present)]
+
+    prebucketed = cli_mod._group_components(components, group_by, length_bin_size=5, bins=bins)
+    assert prebucketed == cli_mod._group_components(components, group_by, length_bin_size=5)
+    assert sum(len(group) for group in prebucketed.values()) == 2
+
+
+def test_analyze_renders_groups_across_workers(monkeypatch, tmp_path):
+    monkeypatch.setattr(
+        cli_mod, "_load_dataset_from_database", lambda *a, **k: _build_multi_series_dataset()
+    )
+    r = CliRunner().invoke(
+        cli_mod.cli,
+        ["analyze", "--output-dir", str(tmp_path), "--workers", "2"],
+        env={"KDE_CPI_DSN": "postgresql://u:p@h/db"},
+    )
+    assert r.exit_code == 0, r.output
+    (analysis_dir,) = tmp_path.glob("analysis_display_level_*")
+    summary = json.loads((analysis_dir / "summary.json").read_text())
+    assert [group["label"] for group in summary["groups"]] == ["1", "2"]
+    for group in summary["groups"]:
+        assert (analysis_dir / group["density_plot"]).exists()
+
+
+def test_write_csv_matches_pandas_layout(tmp_path):
+    pd = pytest.importorskip("pandas")
+    rows = cli_mod.ExportColumns()
+    rows.append({"date": "2025-09", "group_label": "4 chars", "count": 3, "mode": 0.0125})
+    rows.append({"date": "2025-10", "group_label": "a,b", "count": 1, "mode": float("nan")})
+    rows.append({"date": "2025-11", "group_label": "1", "count": 2, "mode": None})
+
+    cli_mod._write_csv(rows, tmp_path / "stdlib.csv")
+    pd.DataFrame(rows.columns).to_csv(tmp_path / "pandas.csv", index=False)
+    assert (tmp_path / "stdlib.csv").read_text() == (tmp_path / "pandas.csv").read_text()
+
+
+def test_cli_import_defers_network_and_database_stacks():
+    """Importing the CLI (e.g. for --help) should not load requests, asyncpg, or pandas."""
+    code = (
+        "import sys, cli.main; "
+        "print(sorted(m for m in ('requests', 'asyncpg', 'pandas') if m in sys.modules))"
+    )
+    result = subprocess.run(  # noqa: S603 - fixed interpreter and code
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "[]"
+    assert cpi_data.CpiDatabaseLoader.__name__ == "CpiDatabaseLoader"
+
+
+def test_async_runner_prefers_uvloop_when_installed(monkeypatch):
+    """The shared runner should build its loop from uvloop when it is importable."""
+    fake_uvloop = types.ModuleType("uvloop")
+    fake_uvloop.new_event_loop = asyncio.new_event_loop
+    monkeypatch.setitem(sys.modules, "uvloop", fake_uvloop)
+    assert cli_mod._event_loop_factory() is asyncio.new_event_loop
+
+    monkeypatch.setitem(sys.modules, "uvloop", None)
+    assert cli_mod._event_loop_factory() is None
+
+
+def test_version_fast_path_matches_click(monkeypatch, capsys):
+    """The console script should answer --version exactly like the Click group."""
+    import cli
+
+    monkeypatch.setattr(sys, "argv", ["kde-cpi", "--version"])
+    cli.run()
+    fast = capsys.readouterr().out
+    r = CliRunner().invoke(cli_mod.cli, ["-V"])
+    assert r.exit_code == 0
+    assert fast == r.output
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_write_dataset_streams_same_json_as_to_dict(monkeypatch, tmp_path, use_orjson):
+    """Chunked dataset snapshots should match a single indented dump byte for byte."""
+    from kde_cpi.data.models import Area, Dataset, Observation
+
+    if not use_orjson:
+        monkeypatch.setattr(cli_mod, "orjson", None)
+    dataset = Dataset()
+    dataset.add_area(Area(code="0000", name="U.S. city average"))
+    dataset.extend_observations(
+        Observation(series_id=f"S{i}", year="2025", period="M09", value="1.5", footnotes="A,B")
+        for i in range(5)
+    )
+    cli_mod._write_json_stream(
+        tmp_path / "ds.json",
+        dataset.to_dict(observations=False),
+        "observations",
+        dataset.iter_observation_dicts(),
+        chunk_size=2,
+    )
+    expected = cli_mod._dumps_json(dataset.to_dict())
+    assert (tmp_path / "ds.json").read_text() == expected
+
+    cli_mod._write_dataset(tmp_path / "empty.json", Dataset())
+    assert (tmp_path / "empty.json").read_text() == cli_mod._dumps_json(Dataset().to_dict())
+
+
+def test_dataset_builder_is_shared_and_closed_with_context(monkeypatch, tmp_path):
+    """One builder should serve the whole invocation and close when the context does."""
+    created = []
+
+    class FakeBuilder:
+        def __init__(self, *, cache_dir):
+            self.cache_dir = cache_dir
+            self.closed = False
+            created.append(self)
+
+        def close(self):
+            self.closed = True
+
+    monkeypatch.setattr(cpi_data, "CpiDatasetBuilder", FakeBuilder)
+    with cli_mod.click.Context(cli_mod.cli, obj={"cache_dir": tmp_path}) as ctx:
+        first = cli_mod._dataset_builder(ctx)
+        assert cli_mod._dataset_builder(ctx) is first
+        assert first.cache_dir == tmp_path
+        assert not first.closed
+    assert len(created) == 1
+    assert first.closed
+
+
+def test_kde_commands_run_in_process_by_default(monkeypatch):
+    """A process pool is only started when --workers asks for one."""
+
+    def _no_pool(*args, **kwargs):
+        raise AssertionError("process pool started without --workers")
+
+    monkeypatch.setattr(cli_mod, "ProcessPoolExecutor", _no_pool)
+    for name in ("analyze", "panel"):
+        workers = next(p for p in cli_mod.cli.commands[name].params if p.name == "workers")
+        assert workers.default == 1
+    assert cli_mod._process_map(abs, [-1, -2, -3], workers=1) == [1, 2, 3]
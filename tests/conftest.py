@@ -96,9 +96,12 @@ class FakeDataset:
         ]
         self.areas = {}
 
-    def to_dict(self):
+    def to_dict(self, *, observations=True):
         return {"ok": True}
 
+    def iter_observation_dicts(self):
+        return iter(())
+
 
 @pytest.fixture
 def tiny_dataset():
@@ -122,13 +125,13 @@ def fast_plots(monkeypatch, tmp_path):
                 effective_sample_size=123,
             )
 
-    def _fake_density(values, weights, output_dir, filename):
+    def _fake_density(values, weights=None, *, output_dir, filename, **kwargs):
         p = output_dir / filename
         p.parent.mkdir(parents=True, exist_ok=True)
         p.write_bytes(b"")
         return R(p)
 
-    def _fake_hist(values, weights, output_dir, filename):
+    def _fake_hist(values, weights=None, *, output_dir, filename, **kwargs):
         p = output_dir / filename
         p.parent.mkdir(parents=True, exist_ok=True)
         p.write_bytes(b"")
@@ -1,11 +1,12 @@
 """Unit tests for the HTTP client."""
 
+import io
 from unittest.mock import MagicMock
 
 import pytest
 import requests
 
-from kde_cpi.data.client import CpiHttpClient
+from kde_cpi.data.client import HTTP_POOL_SIZE, CpiHttpClient
 
 
 def test_cpi_http_client_get_text_success(mocker):
@@ -26,7 +27,7 @@ def test_cpi_http_client_get_text_success(mocker):
     mock_session.get.assert_called_once()
     args, kwargs = mock_session.get.call_args
     assert "test.txt" in args[0]
-    assert "headers" in kwargs
+    assert "gzip" in kwargs["headers"]["Accept-Encoding"]
 
 
 def test_cpi_http_client_get_text_failure(mocker):
@@ -46,3 +47,64 @@ def test_cpi_http_client_get_text_failure(mocker):
     args, kwargs = mock_session.get.call_args
     assert "test.txt" in args[0]
     assert "headers" in kwargs
+
+
+def test_cpi_http_client_get_validator():
+    """Test that HEAD validators are combined and failures yield None."""
+    mock_session = MagicMock()
+    mock_session.head.return_value.headers = {
+        "ETag": '"abc"',
+        "Last-Modified": "Tue, 14 Oct 2025 12:00:00 GMT",
+        "Content-Length": "42",
+    }
+    client = CpiHttpClient()
+    client.session = mock_session
+
+    assert client.get_validator("cu.area") == '"abc"|Tue, 14 Oct 2025 12:00:00 GMT|42'
+
+    mock_session.head.side_effect = requests.ConnectionError("offline")
+    assert client.get_validator("cu.area") is None
+
+
+def test_cpi_http_client_open_stream_yields_raw_body():
+    """Test that streaming requests the body lazily and closes the response."""
+    mock_session = MagicMock()
+    mock_response = mock_session.get.return_value
+    mock_response.__enter__.return_value = mock_response
+    mock_response.raw = io.BytesIO(b"series_id\tyear\n")
+
+    client = CpiHttpClient()
+    client.session = mock_session
+    with client.open_stream("cu.data.0.Current") as stream:
+        assert stream.read() == b"series_id\tyear\n"
+
+    assert mock_session.get.call_args.kwargs["stream"] is True
+    assert mock_response.raw.decode_content is True
+    mock_response.__exit__.assert_called_once()
+
+
+def test_cpi_http_client_revalidates_cached_payload(tmp_path):
+    """Test that cached payloads are revalidated and reused on 304."""
+    mock_session = MagicMock()
+    fresh = MagicMock(status_code=200, text="area_code\tarea_name\n", content=b"x")
+    fresh.headers = {"ETag": '"abc"', "Last-Modified": "Tue, 14 Oct 2025 12:00:00 GMT"}
+    mock_session.get.return_value = fresh
+
+    client = CpiHttpClient(cache_dir=tmp_path)
+    client.session = mock_session
+    assert client.get_text("cu.area") == "area_code\tarea_name\n"
+    assert "If-None-Match" not in mock_session.get.call_args.kwargs["headers"]
+
+    mock_session.get.return_value = MagicMock(status_code=304)
+    assert client.get_text("cu.area") == "area_code\tarea_name\n"
+    headers = mock_session.get.call_args.kwargs["headers"]
+    assert headers["If-None-Match"] == '"abc"'
+    assert headers["If-Modified-Since"] == "Tue, 14 Oct 2025 12:00:00 GMT"
+
+
+def test_cpi_http_client_session_pools_and_retries():
+    """Test that the default session retries gateway errors over a shared pool."""
+    adapter = CpiHttpClient().session.get_adapter("https://download.bls.gov/")
+    assert adapter.max_retries.total == 5
+    assert 503 in adapter.max_retries.status_forcelist
+    assert adapter._pool_maxsize == HTTP_POOL_SIZE
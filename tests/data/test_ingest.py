@@ -1,10 +1,23 @@
 """Unit tests for the data ingestor."""
 
+import io
+import threading
+import time
+from contextlib import contextmanager
+
+import pytest
+
 from kde_cpi.data import parser
 from kde_cpi.data.ingest import CpiDatasetBuilder
 from kde_cpi.data.models import Area
 
 
+@contextmanager
+def _stream_text(text):
+    """Mimic ``CpiHttpClient.open_stream`` for an in-memory payload."""
+    yield io.BytesIO(text.encode("utf-8"))
+
+
 def test_cpi_dataset_builder_load_dataset_by_dependencies(monkeypatch):
     """Test that the dataset builder correctly loads a dataset by mocking dependencies."""
 
@@ -17,7 +30,15 @@ def test_cpi_dataset_builder_load_dataset_by_dependencies(monkeypatch):
         else:
             return ""  # observation partitions empty
 
-    fake_client = type("C", (), {"get_text": staticmethod(fake_get_text), "close": lambda: None})()
+    fake_client = type(
+        "C",
+        (),
+        {
+            "get_text": staticmethod(fake_get_text),
+            "open_stream": staticmethod(lambda filename: _stream_text(fake_get_text(filename))),
+            "close": lambda: None,
+        },
+    )()
     builder = CpiDatasetBuilder(client=fake_client)
 
     # Make parsers return controlled, minimal objects
@@ -30,7 +51,131 @@ def test_cpi_dataset_builder_load_dataset_by_dependencies(monkeypatch):
     monkeypatch.setattr(parser, "parse_periods", lambda text: [])
     monkeypatch.setattr(parser, "parse_footnotes", lambda text: [])
     monkeypatch.setattr(parser, "parse_series", lambda text: [])
-    monkeypatch.setattr(parser, "parse_observations", lambda text: [])
+    monkeypatch.setattr(parser, "parse_observations", lambda source: [])
 
     dataset = builder.load_dataset()
     assert len(dataset.areas) == 1
+
+
+def test_cpi_dataset_builder_reuses_snapshot_until_upstream_changes(tmp_path):
+    """Test that snapshots are keyed by upstream validators."""
+    fetched = []
+    version = {"value": "v1"}
+
+    class FakeClient:
+        def get_text(self, filename, encoding="utf-8"):
+            fetched.append(filename)
+            if filename == "cu.area":
+                return "area_code\tarea_name\n0000\tU.S. city average\n"
+            return ""
+
+        def get_validator(self, filename):
+            return version["value"]
+
+        def open_stream(self, filename):
+            return _stream_text(self.get_text(filename))
+
+        def close(self):
+            return None
+
+    builder = CpiDatasetBuilder(client=FakeClient(), cache_dir=tmp_path)
+    first = builder.load_dataset(data_files=["cu.data.0.Current"])
+    fetch_count = len(fetched)
+    second = builder.load_dataset(data_files=["cu.data.0.Current"])
+
+    assert len(fetched) == fetch_count
+    assert second.areas == first.areas
+    assert len(list(tmp_path.glob("dataset-*.pickle"))) == 1
+
+    version["value"] = "v2"
+    builder.load_dataset(data_files=["cu.data.0.Current"])
+    assert len(fetched) == 2 * fetch_count
+    assert len(list(tmp_path.glob("dataset-*.pickle"))) == 1
+
+
+def test_cpi_dataset_builder_load_metadata_skips_observation_partitions():
+    """Test that metadata loading never requests observation partitions."""
+    fetched = []
+
+    class FakeClient:
+        def get_text(self, filename, encoding="utf-8"):
+            fetched.append(filename)
+            if filename == "cu.area":
+                return "area_code\tarea_name\n0000\tU.S. city average\n"
+            return ""
+
+        def open_stream(self, filename):
+            return _stream_text(self.get_text(filename))
+
+        def close(self):
+            return None
+
+    dataset = CpiDatasetBuilder(client=FakeClient()).load_metadata()
+
+    assert len(dataset.areas) == 1
+    assert dataset.observations == []
+    assert "cu.series" in fetched
+    assert not any(name.startswith("cu.data.") for name in fetched)
+
+
+def test_cpi_dataset_builder_fetches_partitions_concurrently_in_order():
+    """Test that downloads overlap while partitions are appended in request order."""
+    lock = threading.Lock()
+    in_flight = {"now": 0, "peak": 0}
+    partitions = ["cu.data.1.AllItems", "cu.data.2.Summaries", "cu.data.3.AsizeNorthEast"]
+
+    class FakeClient:
+        def get_text(self, filename, encoding="utf-8"):
+            with lock:
+                in_flight["now"] += 1
+                in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            # Earlier partitions finish last so ordering cannot come from completion order.
+            time.sleep(
+                0.05 * (len(partitions) - partitions.index(filename))
+                if filename in partitions
+                else 0.01
+            )
+            with lock:
+                in_flight["now"] -= 1
+            if filename in partitions:
+                year = 2000 + partitions.index(filename)
+                return f"series_id\tyear\tperiod\tvalue\nCUUR0000SA0\t{year}\tM01\t1.0\n"
+            return ""
+
+        def open_stream(self, filename):
+            return _stream_text(self.get_text(filename))
+
+        def close(self):
+            return None
+
+    dataset = CpiDatasetBuilder(client=FakeClient()).load_dataset(data_files=partitions)
+
+    assert [obs.year for obs in dataset.observations] == [2000, 2001, 2002]
+    assert in_flight["peak"] > 1
+
+
+def test_cpi_dataset_builder_fetches_only_selected_mappings():
+    """Test that a mapping selection skips the other lookup tables."""
+    fetched = []
+
+    class FakeClient:
+        def get_text(self, filename, encoding="utf-8"):
+            fetched.append(filename)
+            if filename == "cu.area":
+                return "area_code\tarea_name\n0000\tU.S. city average\n"
+            return ""
+
+        def open_stream(self, filename):
+            return _stream_text(self.get_text(filename))
+
+        def close(self):
+            return None
+
+    builder = CpiDatasetBuilder(client=FakeClient())
+    dataset = builder.load_current_observations(mappings={"areas", "items"})
+
+    assert len(dataset.areas) == 1
+    assert "cu.period" not in fetched
+    assert "cu.footnote" not in fetched
+    with pytest.raises(ValueError, match="Unknown mapping tables: regions"):
+        builder.load_current_observations(mappings={"regions"})
@@ -98,15 +98,18 @@ async def test_close_closes_connection(mocker):
 
 @pytest.mark.asyncio
 async def test_ensure_schema_executes_all_statements(mocker):
-    """ensure_schema should run the expected DDL statements."""
+    """ensure_schema should send all DDL in one query, once per connection."""
     mock_connection = mocker.AsyncMock()
     loader = CpiDatabaseLoader(schema="public")
     loader._connection = mock_connection
 
+    await loader.ensure_schema()
     await loader.ensure_schema()
 
-    assert mock_connection.execute.await_count == 10
-    ddl_payload = " ".join(call.args[0] for call in mock_connection.execute.await_args_list)
+    mock_connection.execute.assert_awaited_once()
+    ddl_payload = mock_connection.execute.await_args.args[0]
+    assert ddl_payload.count("CREATE TABLE IF NOT EXISTS") == 6
+    assert ddl_payload.count("ALTER TABLE") == 4
     assert "CREATE TABLE IF NOT EXISTS public.cpi_area" in ddl_payload
     assert "CREATE TABLE IF NOT EXISTS public.cpi_observation" in ddl_payload
 
@@ -125,6 +128,7 @@ async def test_bulk_load_with_truncate(mocker):
     dataset = build_dataset()
     connection = mocker.AsyncMock()
     _setup_transaction(mocker, connection)
+    connection.fetch.return_value = []
 
     loader = CpiDatabaseLoader()
     loader._connection = connection
@@ -144,18 +148,29 @@ async def test_bulk_load_with_truncate(mocker):
     await loader.bulk_load(dataset, truncate=True)
 
     ensure_schema_mock.assert_awaited_once()
-    connection.execute.assert_awaited_once()
+    statements = [call.args[0] for call in connection.execute.await_args_list]
+    assert statements[0] == "SET LOCAL synchronous_commit = off"
+    # Without constraints in the catalog the COPY runs with nothing dropped or re-added.
+    assert len(statements) == 2
+    assert statements[1].startswith("TRUNCATE TABLE")
     copy_mapping_mock.assert_awaited_once_with(connection, dataset)
     copy_series_mock.assert_awaited_once_with(connection, dataset)
     copy_obs_mock.assert_awaited_once_with(connection, dataset)
 
 
 @pytest.mark.asyncio
-async def test_bulk_load_without_truncate_skips_execute(mocker):
-    """bulk_load should skip TRUNCATE when truncate=False."""
+async def test_bulk_load_rebuilds_catalog_constraints_around_copy(mocker):
+    """The truncate path should drop and re-add observation constraints by their real names."""
     dataset = build_dataset()
     connection = mocker.AsyncMock()
     _setup_transaction(mocker, connection)
+    connection.fetch.return_value = [
+        {
+            "conname": "obs_series_fk",
+            "definition": "FOREIGN KEY (series_id) REFERENCES public.cpi_series(series_id)",
+        },
+        {"conname": "obs_pk", "definition": "PRIMARY KEY (series_id, year, period)"},
+    ]
 
     loader = CpiDatabaseLoader()
     loader._connection = connection
@@ -164,9 +179,48 @@ async def test_bulk_load_without_truncate_skips_execute(mocker):
     mocker.patch.object(CpiDatabaseLoader, "_copy_series", new=mocker.AsyncMock())
     mocker.patch.object(CpiDatabaseLoader, "_copy_observations", new=mocker.AsyncMock())
 
+    await loader.bulk_load(dataset, truncate=True)
+
+    assert connection.fetch.await_args.args[1] == "public.cpi_observation"
+    statements = [call.args[0] for call in connection.execute.await_args_list]
+    assert statements[2] == (
+        'ALTER TABLE public.cpi_observation DROP CONSTRAINT "obs_series_fk", '
+        'DROP CONSTRAINT "obs_pk";'
+    )
+    assert statements[3] == (
+        'ALTER TABLE public.cpi_observation ADD CONSTRAINT "obs_pk" '
+        "PRIMARY KEY (series_id, year, period), "
+        'ADD CONSTRAINT "obs_series_fk" '
+        "FOREIGN KEY (series_id) REFERENCES public.cpi_series(series_id);"
+    )
+
+
+@pytest.mark.asyncio
+async def test_bulk_load_without_truncate_merges_rows(mocker):
+    """bulk_load should upsert via a staging table when truncate=False."""
+    dataset = build_dataset()
+    connection = mocker.AsyncMock()
+    _setup_transaction(mocker, connection)
+
+    loader = CpiDatabaseLoader(schema="custom")
+    loader._connection = connection
+    mocker.patch.object(CpiDatabaseLoader, "ensure_schema", new=mocker.AsyncMock())
+    sync_mock = mocker.patch.object(CpiDatabaseLoader, "sync_metadata", new=mocker.AsyncMock())
+    copy_obs_mock = mocker.patch.object(
+        CpiDatabaseLoader, "_copy_observations", new=mocker.AsyncMock()
+    )
+
     await loader.bulk_load(dataset, truncate=False)
 
-    connection.execute.assert_not_called()
+    sync_mock.assert_awaited_once_with(dataset)
+    copy_obs_mock.assert_not_called()
+    statements = [call.args[0] for call in connection.execute.await_args_list]
+    assert not any("TRUNCATE" in statement for statement in statements)
+    assert "CREATE TEMP TABLE cpi_observation_staging" in statements[1]
+    assert "ON CONFLICT (series_id, year, period)" in statements[2]
+    staging_call = connection.copy_records_to_table.await_args_list[0]
+    assert staging_call.args[0] == "cpi_observation_staging"
+    assert staging_call.kwargs["records"][1][3] is None
 
 
 @pytest.mark.asyncio
@@ -276,21 +330,52 @@ async def test_fetch_dataset_rehydrates_domain_models(mocker):
 
 @pytest.mark.asyncio
 async def test_upsert_observations_transforms_payload(mocker):
-    """upsert_observations should normalize decimals and footnotes."""
-    loader = CpiDatabaseLoader()
+    """upsert_observations should stage normalized rows via COPY and upsert once."""
+    loader = CpiDatabaseLoader(schema="custom")
     connection = mocker.AsyncMock()
+    _setup_transaction(mocker, connection)
     loader._connection = connection
 
     observations = build_dataset().observations
-    await loader.upsert_observations(observations)
+    await loader.upsert_observations(iter(observations))
 
-    connection.executemany.assert_awaited_once()
-    sql, args = connection.executemany.await_args_list[0].args
-    assert "INSERT INTO" in sql
+    connection.executemany.assert_not_called()
+    copy_call = connection.copy_records_to_table.await_args_list[0]
+    assert copy_call.args[0] == "cpi_observation_staging"
+    args = copy_call.kwargs["records"]
     assert args[0][3] == observations[0].value
-    assert args[0][4] == list(observations[0].footnotes)
+    assert args[0][4] == observations[0].footnotes
     assert args[1][3] is None
     assert args[1][4] is None
+    statements = [call.args[0] for call in connection.execute.await_args_list]
+    assert "CREATE TEMP TABLE cpi_observation_staging" in statements[0]
+    assert "INSERT INTO custom.cpi_observation AS target" in statements[1]
+    assert "ON CONFLICT (series_id, year, period)" in statements[1]
+    assert "value = EXCLUDED.value, footnotes = EXCLUDED.footnotes" in statements[1]
+    assert (
+        "WHERE (target.value, target.footnotes) IS DISTINCT FROM "
+        "(EXCLUDED.value, EXCLUDED.footnotes)"
+    ) in statements[1]
+    assert statements[2] == "DROP TABLE cpi_observation_staging"
+
+
+@pytest.mark.asyncio
+async def test_upsert_observations_keeps_last_row_for_duplicate_keys(mocker):
+    """A key repeated in the input should upsert once, keeping the last staged row."""
+    loader = CpiDatabaseLoader()
+    connection = mocker.AsyncMock()
+    _setup_transaction(mocker, connection)
+    loader._connection = connection
+
+    first = Observation(series_id="S1", year=2024, period="M01", value="1.0", footnotes="")
+    last = Observation(series_id="S1", year=2024, period="M01", value="2.0", footnotes="")
+    await loader.upsert_observations([first, last])
+
+    records = connection.copy_records_to_table.await_args_list[0].kwargs["records"]
+    assert [record[3] for record in records] == [first.value, last.value]
+    insert = connection.execute.await_args_list[1].args[0]
+    assert "SELECT DISTINCT ON (series_id, year, period)" in insert
+    assert "ORDER BY series_id, year, period, ctid DESC" in insert
 
 
 @pytest.mark.asyncio
@@ -302,7 +387,8 @@ async def test_upsert_observations_noop_for_empty_input(mocker):
 
     await loader.upsert_observations([])
 
-    connection.executemany.assert_not_called()
+    connection.execute.assert_not_called()
+    connection.copy_records_to_table.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -338,10 +424,26 @@ async def test_copy_series_and_observations_payloads(mocker):
     obs_call = connection.copy_records_to_table.await_args_list[0]
     assert obs_call.args[0] == "cpi_observation"
     obs_records: Sequence = obs_call.kwargs["records"]
-    assert obs_records[0][4] == ["A"]
+    assert obs_records[0][4] == ("A",)
     assert obs_records[1][3] is None
 
 
+@pytest.mark.asyncio
+async def test_copy_observations_issues_one_copy_per_batch(mocker):
+    """copy_observations should split rows into batch_size COPY commands."""
+    dataset = build_dataset()
+    loader = CpiDatabaseLoader(schema="custom")
+    connection = mocker.AsyncMock()
+    loader._connection = connection
+
+    copied = await loader.copy_observations(iter(dataset.observations), batch_size=1)
+
+    assert copied == 2
+    calls = connection.copy_records_to_table.await_args_list
+    assert [len(call.kwargs["records"]) for call in calls] == [1, 1]
+    assert all(call.kwargs["schema_name"] == "custom" for call in calls)
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("method_name", "data_selector"),
@@ -353,20 +455,28 @@ async def test_copy_series_and_observations_payloads(mocker):
         ("_upsert_series", lambda d: list(d.series.values())),
     ],
 )
-async def test_upsert_helpers_call_executemany(
+async def test_upsert_helpers_copy_into_staging_tables(
     mocker,
     method_name: str,
     data_selector: Callable[[Dataset], Sequence],
 ):
-    """Each upsert helper should pass rows to executemany when data exists."""
+    """Each upsert helper should COPY rows into a staging table, then upsert from it."""
     dataset = build_dataset()
     loader = CpiDatabaseLoader()
     connection = mocker.AsyncMock()
+    _setup_transaction(mocker, connection)
     method = getattr(loader, method_name)
 
     await method(connection, data_selector(dataset))
 
-    connection.executemany.assert_awaited_once()
+    connection.executemany.assert_not_called()
+    copy_call = connection.copy_records_to_table.await_args
+    assert copy_call.args[0].endswith("_staging")
+    assert len(copy_call.kwargs["records"]) == 1
+    assert len(copy_call.kwargs["records"][0]) == len(copy_call.kwargs["columns"])
+    upsert_sql = connection.execute.await_args_list[1].args[0]
+    assert f"INSERT INTO public.{copy_call.args[0].removesuffix('_staging')}" in upsert_sql
+    assert "ON CONFLICT" in upsert_sql
 
 
 @pytest.mark.asyncio
@@ -377,4 +487,5 @@ async def test_upsert_series_skips_empty_sequences(mocker):
 
     await loader._upsert_series(connection, [])
 
-    connection.executemany.assert_not_called()
+    connection.execute.assert_not_called()
+    connection.copy_records_to_table.assert_not_called()
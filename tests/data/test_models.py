@@ -1,7 +1,9 @@
 """Unit tests for the data models."""
 
+import pickle
 from decimal import Decimal
 
+import attrs
 import pytest
 
 from kde_cpi.data.models import (
@@ -53,6 +55,7 @@ def test_to_bool(value, expected):
         ("A,B", ("A", "B")),
         ("A , B", ("A", "B")),
         ("A B", ("A", "B")),
+        (",A,,B ", ("A", "B")),
     ],
 )
 def test_footnote_tuple(value, expected):
@@ -74,6 +77,12 @@ def test_decimal(value, expected):
     assert str(_decimal(value)) == str(expected)
 
 
+def test_repeated_values_share_parsed_objects():
+    """Test that equal raw values and footnote fields reuse one parsed object."""
+    assert _decimal("".join(["101", ".5"])) is _decimal("101.5")
+    assert _footnote_tuple("".join(["P", ",R"])) is _footnote_tuple("P,R")
+
+
 def test_series_is_seasonally_adjusted():
     """Test the is_seasonally_adjusted method."""
     series = Series(
@@ -133,6 +142,62 @@ def test_observation_is_annual(period, expected):
     assert observation.is_annual() is expected
 
 
+def test_observation_period_is_normalized_and_interned():
+    """Test that period codes are canonicalized once at construction."""
+    first = Observation(series_id="a", year=2023, period=" m01 ", value="1", footnotes="")
+    second = Observation(
+        series_id="b", year=2023, period="".join(["M", "01"]), value="2", footnotes=""
+    )
+    assert first.period == "M01"
+    assert first.period is second.period
+
+
+def test_observation_shares_series_id_and_year_objects():
+    """Test that rows of one series share their identifier and year objects."""
+    first = Observation(
+        series_id="CUUR0000SA0 ", year="2023", period="M01", value="1", footnotes=""
+    )
+    second = Observation(
+        series_id="".join(["CUUR0000", "SA0"]),
+        year="".join(["20", "23"]),
+        period="M02",
+        value="2",
+        footnotes="",
+    )
+    assert first.series_id == "CUUR0000SA0"
+    assert first.series_id is second.series_id
+    assert first.year == 2023
+    assert first.year is second.year
+
+
+def test_observation_has_no_instance_dict_or_weakref_slot():
+    """Test that observations carry only their five field slots."""
+    obs = Observation(series_id="a", year=2023, period="M01", value="1", footnotes="")
+    assert Observation.__slots__ == ("series_id", "year", "period", "value", "footnotes")
+    assert not hasattr(obs, "__dict__")
+    assert obs == Observation(series_id="a", year=2023, period="M01", value="1", footnotes="")
+
+
+def test_series_codes_share_interned_strings():
+    """Test that series codes share one string with observations and mapping rows."""
+    series = Series(
+        series_id="".join(["CUUR0000", "SA0 "]),
+        area_code="".join(["00", "00"]),
+        item_code="SA0",
+        seasonal="U",
+        periodicity_code="R",
+        base_code="S",
+        base_period="1982-84=100",
+        begin_year=1913,
+        begin_period="M01",
+        end_year=2025,
+        end_period="M08",
+    )
+    obs = Observation(series_id="CUUR0000SA0", year=2025, period="M08", value="1", footnotes="")
+    assert series.series_id is obs.series_id
+    assert series.area_code is Area(code="0000 ", name="U.S. city average").code
+
+
 def test_dataset_add_and_extend():
     """Test adding and extending data in a Dataset."""
     dataset = Dataset()
@@ -187,3 +252,73 @@ def test_dataset_add_and_extend():
     assert len(dataset.footnotes) == 1
     assert len(dataset.series) == 1
     assert len(dataset.observations) == 2
+
+
+def test_dataset_extend_assume_unique_rebuilds_index_lazily():
+    """Test that trusted appends skip dedup but later extends still see those rows."""
+    first, second = (
+        Observation(series_id="S1", year=2023, period=period, value="1", footnotes="")
+        for period in ("M01", "M02")
+    )
+    dataset = Dataset()
+    dataset.extend_observations([first], assume_unique=True)
+    dataset.extend_observations([first, second])
+
+    assert dataset.observations == [first, second]
+
+
+def test_dataset_pickle_omits_dedup_index():
+    """Test that snapshots drop the key index yet restored datasets still de-duplicate."""
+    obs = Observation(series_id="S1", year=2023, period="M01", value="1", footnotes="")
+    dataset = Dataset(areas={"0000": Area(code="0000", name="U.S. city average")})
+    dataset.extend_observations([obs])
+
+    restored = pickle.loads(pickle.dumps(dataset))  # noqa: S301 - pickled in-process
+    assert restored._observation_keys is None
+    assert restored.areas == dataset.areas
+    restored.extend_observations([obs])
+    assert restored.observations == [obs]
+
+
+def test_dataset_to_dict_matches_attrs_asdict():
+    """Test that the shallow record dicts match attrs.asdict for every mapping table."""
+    dataset = Dataset()
+    dataset.add_area(Area(code="0000", name="U.S. city average"))
+    dataset.add_item(
+        Item(code="SA0", name="All items", display_level=0, selectable="T", sort_sequence=1)
+    )
+    dataset.add_period(Period(code="M01", abbr="JAN", name="January"))
+    dataset.add_footnote(Footnote(code="P", text="Preliminary"))
+    dataset.add_series(
+        Series(
+            series_id="CUUR0000SA0",
+            area_code="0000",
+            item_code="SA0",
+            seasonal="U",
+            periodicity_code="R",
+            base_code="S",
+            base_period="1982-84=100",
+            begin_year=1913,
+            begin_period="M01",
+            end_year=2025,
+            end_period="M08",
+        )
+    )
+
+    payload = dataset.to_dict()
+    for key in ("areas", "items", "periods", "footnotes", "series"):
+        assert payload[key] == [attrs.asdict(record) for record in getattr(dataset, key).values()]
+
+
+def test_dataset_bulk_extend_mappings_overwrites_by_code():
+    """Test that bulk mapping inserts keep the last record for each code."""
+    dataset = Dataset()
+    dataset.extend_areas(
+        [Area(code="0000", name="Old name"), Area(code="0000", name="U.S. city average")]
+    )
+    dataset.extend_periods([Period(code="M01", abbr="JAN", name="January")])
+    dataset.extend_footnotes([])
+
+    assert dataset.areas["0000"].name == "U.S. city average"
+    assert list(dataset.periods) == ["M01"]
+    assert dataset.footnotes == {}
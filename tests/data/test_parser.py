@@ -1,5 +1,7 @@
 """Unit tests for the data parser."""
 
+import io
+
 from kde_cpi.data.parser import (
     parse_areas,
     parse_footnotes,
@@ -86,3 +88,25 @@ def test_parse_observations():
     assert observations[0].period == "M01"
     assert str(observations[0].value) == "9.8"
     assert observations[0].footnotes == ()
+
+
+def test_parse_observations_skips_blank_rows_and_pads_headers():
+    """Test that padded headers, trailing blanks, and a missing footnote column are handled."""
+    text = "series_id        \tyear\tperiod\t       value\n"
+    text += "CUUR0000SA0      \t2024\tM01\t     308.417\n"
+    text += "\t\t\t\n"
+    observations = parse_observations(text)
+    assert len(observations) == 1
+    assert observations[0].series_id == "CUUR0000SA0"
+    assert str(observations[0].value) == "308.417"
+    assert observations[0].footnotes == ()
+    assert parse_observations("") == []
+
+
+def test_parse_observations_accepts_byte_stream():
+    """Test that observation partitions can be parsed from a binary stream."""
+    stream = io.BytesIO(b"series_id\tyear\tperiod\tvalue\nCUUR0000SA0\t2024\tM02\t310.326\n")
+    observations = parse_observations(stream)
+    assert [(obs.series_id, obs.year, str(obs.value)) for obs in observations] == [
+        ("CUUR0000SA0", 2024, "310.326")
+    ]
@@ -3,7 +3,11 @@
 import pytest
 
 from kde_cpi.data.models import Dataset
-from kde_cpi.data.pipeline import load_full_history, update_current_periods
+from kde_cpi.data.pipeline import (
+    CURRENT_UPDATE_MAPPINGS,
+    load_full_history,
+    update_current_periods,
+)
 
 
 @pytest.fixture
@@ -73,8 +77,43 @@ async def test_update_current_periods_orchestrates_update(
 
     assert result is dataset
     builder_class.assert_called_once_with()
-    builder_instance.load_current_observations.assert_called_once_with()
+    builder_instance.load_current_observations.assert_called_once_with(
+        mappings=CURRENT_UPDATE_MAPPINGS
+    )
     builder_instance.close.assert_called_once()
     loader_class.assert_called_once_with(dsn="test_dsn", schema="test_schema")
     loader_instance.merge_dataset.assert_awaited_once_with(dataset)
     loader_instance.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_load_full_history_reuses_supplied_loader(
+    mocker, mock_dataset_builder, mock_database_loader
+):
+    """Test that a caller-owned loader is used and left open."""
+    _, _, dataset = mock_dataset_builder
+    loader_class, _ = mock_database_loader
+    shared = mocker.AsyncMock()
+
+    await load_full_history("test_dsn", loader=shared)
+
+    loader_class.assert_not_called()
+    shared.bulk_load.assert_awaited_once_with(dataset, truncate=True)
+    shared.close.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_update_current_periods_reuses_supplied_builder(
+    mocker, mock_dataset_builder, mock_database_loader
+):
+    """Test that a caller-owned builder is used and left open."""
+    builder_class, _, dataset = mock_dataset_builder
+    shared = mocker.MagicMock()
+    shared.load_current_observations.return_value = dataset
+
+    result = await update_current_periods("test_dsn", builder=shared)
+
+    assert result is dataset
+    builder_class.assert_not_called()
+    shared.load_current_observations.assert_called_once_with(mappings=CURRENT_UPDATE_MAPPINGS)
+    shared.close.assert_not_called()
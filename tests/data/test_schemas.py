@@ -0,0 +1,29 @@
+"""Unit tests for the marshmallow schemas."""
+
+import subprocess
+import sys
+
+from kde_cpi.data import models
+from kde_cpi.data.models import Area, Observation
+from kde_cpi.data.schemas import AreaSchema, ObservationSchema
+
+
+def test_schemas_build_models():
+    """Test that schema loads produce the attrs models."""
+    assert AreaSchema().load({"code": " 0000 ", "name": "All"}) == Area(code="0000", name="All")
+    observation = ObservationSchema().load(
+        {"series_id": "S1", "year": 2024, "period": "M01", "value": "1.5", "footnotes": "P"}
+    )
+    assert observation == Observation(
+        series_id="S1", year=2024, period="M01", value="1.5", footnotes="P"
+    )
+
+
+def test_models_keep_schema_names_without_importing_marshmallow():
+    """Test that models resolves schemas lazily and ingest never loads marshmallow."""
+    assert models.AreaSchema is AreaSchema
+    code = "import sys, kde_cpi.data.ingest; print('marshmallow' in sys.modules)"
+    result = subprocess.run(  # noqa: S603 - fixed interpreter and code
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
@@ -3,7 +3,7 @@
 import numpy as np
 import pytest
 
-from kde_cpi.math import compute_statistics
+from kde_cpi.math import compute_statistics, stats as stats_mod, weighted_kde_density
 
 
 @pytest.fixture
@@ -28,3 +28,25 @@ def test_compute_statistics(sample_data, sample_weights):
     assert stats.weighted_std == pytest.approx(np.sqrt(2.0))
     assert stats.weighted_skewness == pytest.approx(0.0)
     assert stats.weighted_kurtosis == pytest.approx(-1.3, abs=0.1)
+
+
+def test_weighted_kde_density_blocks_match_dense_evaluation(monkeypatch):
+    """Test that blocked KDE evaluation matches the dense Gaussian sum."""
+    rng = np.random.default_rng(7)
+    values = rng.normal(size=40)
+    weights = rng.random(40)
+    weights /= weights.sum()
+    grid = np.linspace(-4.0, 4.0, 101)
+    bandwidth = 0.3
+    diffs = (grid[:, None] - values[None, :]) / bandwidth
+    expected = (np.exp(-0.5 * diffs**2) * weights).sum(axis=1) / (bandwidth * np.sqrt(2 * np.pi))
+
+    monkeypatch.setattr(stats_mod, "KDE_BLOCK_CELLS", 7 * values.size)
+    densities = weighted_kde_density(values, weights, grid, bandwidth)
+
+    np.testing.assert_allclose(densities, expected, rtol=1e-12)
+
+
+def test_compute_statistics_defaults_to_equal_weights(sample_data, sample_weights):
+    """Test that omitting weights matches explicit equal weights."""
+    assert compute_statistics(sample_data) == compute_statistics(sample_data, sample_weights)
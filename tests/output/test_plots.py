@@ -3,6 +3,7 @@
 import numpy as np
 import pytest
 
+from kde_cpi.math import compute_statistics
 from kde_cpi.output.plots import (
     DensityPlotConfig,
     HistogramPlotConfig,
@@ -53,6 +54,18 @@ def test_generate_histogram_plot(mock_plt, tmp_path):
     fig_mock.savefig.assert_called_once()
 
 
+def test_generate_histogram_plot_reuses_statistics(mock_plt, mocker, tmp_path):
+    """Test that supplied statistics skip recomputation and weights default to equal."""
+    values = np.array([1.0, 2.0, 3.0])
+    stats = compute_statistics(values)
+    compute_mock = mocker.patch("kde_cpi.output.plots.compute_statistics")
+
+    report = generate_histogram_plot(values, output_dir=tmp_path, statistics=stats)
+
+    compute_mock.assert_not_called()
+    assert report.statistics is stats
+
+
 def test_axis_limits():
     """Test that the axis limits are calculated correctly."""
     values = np.array([-10, -5, 0, 5, 10])
@@ -0,0 +1,67 @@
+"""Integration tests for the incremental Sphinx build hooks in ``docs/conf.py``."""
+
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("sphinx")
+pytest.importorskip("myst_parser")
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _build(docs: Path, build: Path, *, fast: bool = True) -> str:
+    env = {**os.environ, "DOCS_FAST": "1" if fast else ""}
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-m", "sphinx", "-b", "html", ".", str(build / "html")]
+        + ["-d", str(build / "doctrees")],
+        cwd=docs,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout
+
+
+def _copy_docs(tmp_path: Path) -> Path:
+    docs = tmp_path / "docs"
+    shutil.copytree(REPO_ROOT / "docs", docs, ignore=shutil.ignore_patterns("_build", "api"))
+    (tmp_path / "src").symlink_to(REPO_ROOT / "src")
+    return docs
+
+
+@pytest.mark.integration
+def test_touched_sources_are_read_zero_times_after_one_pruned_build(tmp_path):
+    """Test that content-hash pruning persists, so a touch costs one cheap build at most."""
+    docs = _copy_docs(tmp_path)
+    build = tmp_path / "_build"
+    _build(docs, build)
+
+    for source in docs.rglob("*.rst"):
+        source.touch()
+    pruned = _build(docs, build)
+    assert "0 added, 0 changed" not in pruned
+    assert "reading sources... [" not in pruned
+
+    assert "0 added, 0 changed, 0 removed" in _build(docs, build)
+
+
+@pytest.mark.integration
+def test_missing_autosummary_stub_is_regenerated(tmp_path):
+    """Test that the autosummary skip notices a deleted nested stub and rebuilds the tree."""
+    pytest.importorskip("sphinx_autodoc_typehints")
+    docs = _copy_docs(tmp_path)
+    build = tmp_path / "_build"
+    _build(docs, build, fast=False)
+    stub = docs / "api" / "generated" / "kde_cpi.math.stats.rst"
+    content = stub.read_text()
+
+    assert "skipping generation" in _build(docs, build, fast=False)
+    stub.unlink()
+    assert "skipping generation" not in _build(docs, build, fast=False)
+    assert stub.read_text() == content
@@ -26,3 +26,15 @@ def test_configure_logging(mocker):
 
     # Reset logging configuration
     structlog.reset_defaults()
+
+
+def test_configure_logging_drops_disabled_levels_at_bind_time(mocker):
+    """Test that levels below the threshold become no-op methods."""
+    mocker.patch("logging.basicConfig")
+    configure_logging(level="info")
+    wrapper = structlog.get_config()["wrapper_class"]
+    assert wrapper.debug.__name__ == "_nop"
+    assert wrapper.info.__name__ != "_nop"
+
+    # Reset logging configuration
+    structlog.reset_defaults()